@@ -0,0 +1,111 @@
+import base64
+import datetime
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination over (created_in, id) from the newest items, subclasses may page over another time field.
+    A page starts right after the key of the last item of the previous page, so it costs an index scan of a page
+    at any depth and no total count is made. Querysets are paged by the database, other sources of items
+    by their get_page method, e.g. lobby_list.OpenLobbies pages the sorted set of the lobby index.
+    """
+
+    key_field = "created_in"
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None) -> list:
+        self.request = request
+        self.cursor = self.decode_cursor(request)
+        key_value, item_id, is_reversed = self.cursor or (None, None, False)
+
+        if isinstance(queryset, QuerySet):
+            items = self.page_queryset(queryset, key_value, item_id, is_reversed)
+        else:
+            items = queryset.get_page(key_value, item_id, is_reversed, self.page_size + 1)
+
+        self.has_more = len(items) > self.page_size
+        items = items[:self.page_size]
+        self.keys = [self.get_key(item) for item in items]
+
+        if is_reversed:
+            items.reverse()
+            self.keys.reverse()
+
+        return items
+
+    def page_queryset(self, queryset: QuerySet, key_value, item_id, is_reversed: bool) -> list:
+        field = self.key_field
+
+        if key_value is not None:
+            lookup = "gt" if is_reversed else "lt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": key_value}) | Q(**{field: key_value, f"id__{lookup}": item_id})
+            )
+
+        ordering = (field, "id") if is_reversed else (f"-{field}", "-id")
+        return list(queryset.order_by(*ordering)[:self.page_size + 1])
+
+    def get_key(self, item) -> tuple[datetime.datetime, int]:
+        """Get the key of a model instance or of a serialized item"""
+
+        if isinstance(item, dict):
+            return parse_datetime(item[self.key_field]), item["id"]
+        return getattr(item, self.key_field), item.id
+
+    def decode_cursor(self, request) -> tuple | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if encoded is None:
+            return None
+
+        try:
+            is_reversed, item_id, key_value = base64.urlsafe_b64decode(encoded.encode()).decode().split(" ", 2)
+            return datetime.datetime.fromisoformat(key_value), int(item_id), bool(int(is_reversed))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, key: tuple, is_reversed: bool) -> str:
+        key_value, item_id = key
+        encoded = base64.urlsafe_b64encode(f"{int(is_reversed)} {item_id} {key_value.isoformat()}".encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> str | None:
+        is_reversed = self.cursor is not None and self.cursor[2]
+
+        if self.keys and (is_reversed or self.has_more):
+            return self.encode_cursor(self.keys[-1], False)
+
+    def get_previous_link(self) -> str | None:
+        is_reversed = self.cursor is not None and self.cursor[2]
+
+        if self.keys and (self.has_more if is_reversed else self.cursor is not None):
+            return self.encode_cursor(self.keys[0], True)
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class FinishedInKeysetPagination(KeysetPagination):
+    """Pagination over (finished_in, id) from the last finished items"""
+
+    key_field = "finished_in"
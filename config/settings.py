@@ -260,6 +260,35 @@ JWT_SETTINGS = {
     'USER_ID_CLAIM': 'user_id',
 
     'AUTH_TOKEN_CLASSES': ('src.user.auth.models.JWTToken',), 
+
+    # Access tokens are checked by their signature and expiry against a cached user secret, without the database
+    'IS_STATELESS_VERIFICATION': True,
+}
+
+
+# Token cache settings (tokens of socket handshakes are resolved to user snapshots cached in a process and in Redis)
+
+TOKEN_CACHE_SETTINGS = {
+    'MAX_SIZE': 10000,
+    'LOCAL_TTL': 30,
+    'TTL': 300,
+    'NEGATIVE_TTL': 5,
+}
+
+
+# Token sweep settings (expired and superseded tokens are deleted by a periodic task, by chunks of rows)
+
+TOKEN_SWEEP_SETTINGS = {
+    'CHUNK_SIZE': 1000,
+}
+
+
+# Password hashing settings (PBKDF2 runs in a pool of processes, hashes over the pending limit are refused)
+
+HASHING_SETTINGS = {
+    'MAX_WORKERS': int(os.environ.get('HASHING_MAX_WORKERS', os.cpu_count())),
+    'MAX_PENDING': int(os.environ.get('HASHING_MAX_PENDING', 64)),
+    'TIMEOUT': 10,
 }
 
 
@@ -280,6 +309,7 @@ CHANNEL_LAYERS = {
 
 REDIS_HOST = os.environ.get('DOC_HOST_CL', os.environ['REDIS_HOST'])
 REDIS_PORT = 6379
+ASYNC_REDIS_MAX_CONNECTIONS = int(os.environ.get('ASYNC_REDIS_MAX_CONNECTIONS', 100))
 REDIS_PASSWORD = os.environ.get('DOC_REDIS_PASSWORD', os.environ['REDIS_PASSWORD'])
 
 CELERY_BROKER_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
@@ -290,6 +320,69 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 # CELERY_RESULT_EXPIRES = 3
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+CELERY_BEAT_SCHEDULE = {
+    'flush-game-states': {
+        'task': 'src.game.celery_tasks.tasks.flush_game_states',
+        'schedule': timedelta(seconds=30),
+    },
+    'sweep-tokens': {
+        'task': 'src.user.celery_tasks.tasks.sweep_tokens',
+        'schedule': timedelta(hours=1),
+    },
+    'build-leaderboard': {
+        'task': 'src.game.celery_tasks.tasks.build_leaderboard',
+        'schedule': timedelta(minutes=1),
+    },
+}
+
+
+# Game state settings (boards of running games are kept in Redis and written to the database write-behind)
+
+GAME_STATE_SETTINGS = {
+    'EXPIRY': 10800,
+}
+
+
+# Timer settings (seconds a lobby waits for a late move after a turn deadline before a winner is determined)
+
+TIMER_SETTINGS = {
+    'PREPARATION_GRACE': 5,
+    'SHOT_GRACE': 3,
+}
+
+
+# Layout pool settings (pre-generated fleet layouts for random placement)
+
+LAYOUT_POOL_SETTINGS = {
+    'SIZE': 5000,
+    'WATERMARK': 1000,
+    'REFILL_TIMEOUT': 300,
+}
+
+
+# Lobby list settings (open lobbies are served from an index in Redis, it is rebuilt from the database after the expiry)
+
+LOBBY_LIST_SETTINGS = {
+    'EXPIRY': 300,
+}
+
+
+# Leaderboard settings (ratings of users are kept in a sorted set in Redis, a periodic task builds it from the database
+# when it is missing)
+
+LEADERBOARD_SETTINGS = {
+    'TOP_COUNT': 15,
+    'MAX_COUNT': 100,
+    'RADIUS': 5,
+    'MAX_RADIUS': 25,
+}
+
+
+# Bot settings (bot turns run in a task pool of a worker, apart from the sockets of players)
+
+BOT_SETTINGS = {
+    'MAX_TASKS': int(os.environ.get('BOT_MAX_TASKS', 100)),
+}
 
 
 # smtp
@@ -1,7 +1,9 @@
 import redis
+from redis import asyncio as aioredis
 from . import settings
 
 
+# Sync client for celery tasks, DRF views and management commands
 redis_instance = redis.Redis(
     host=settings.REDIS_HOST, 
     port=settings.REDIS_PORT, 
@@ -9,8 +11,13 @@ redis_instance = redis.Redis(
     encoding="utf-8",
     )
 
-
-def column_generate(column_name: str) -> str:
-    """Generate a string as a dictionary"""
-
-    return str({f"{column_name}{element}": "" for element in range(1, 11)})
+# Async client for consumers and bots, its pool is shared by all sockets of a worker
+async_redis_instance = aioredis.Redis(
+    connection_pool=aioredis.BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        decode_responses=True,
+        encoding="utf-8",
+        max_connections=settings.ASYNC_REDIS_MAX_CONNECTIONS,
+    )
+)
@@ -2,6 +2,7 @@ from gettext import ngettext
 from django.contrib import admin, messages
 
 from . import models
+from .engine import bitboard
 
 
 class ShipInlince(admin.TabularInline):
@@ -45,8 +46,8 @@ class BoardAdmin(admin.ModelAdmin):
 
     list_display = ("id", "lobby_id", "user_id", "is_ready", "is_my_turn", "is_play_again")
     list_display_links = ("id", "lobby_id")
-    fields = ("A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "is_ready", "is_my_turn", "is_play_again", 
-              "lobby_id", "user_id")
+    fields = ("columns", "is_ready", "is_my_turn", "is_play_again", "lobby_id", "user_id")
+    readonly_fields = ("columns", )
     search_fields = ("lobby_id", )
     list_max_show_all = 250
     list_per_page = 150
@@ -56,6 +57,10 @@ class BoardAdmin(admin.ModelAdmin):
     actions = ["make_prepared", "make_unprepared", "clear_is_play_again_field", "clear_all_boolean_fields", 
                "remove_board_owner", "clear_columns"]
 
+    @admin.display(description="columns")
+    def columns(self, obj):
+        return bitboard.CompactBoard.from_bytes(obj.grid).to_columns()
+
     @admin.action(description="Prepare selected boards")
     def make_prepared(self, request, queryset):
         updated = queryset.update(is_ready=True)
@@ -101,6 +106,15 @@ class BoardAdmin(admin.ModelAdmin):
             updated,
         ) % updated, messages.SUCCESS)
 
+    @admin.action(description="Clear columns of selected boards")
+    def clear_columns(self, request, queryset):
+        updated = queryset.update(grid=bitboard.CompactBoard().to_bytes())
+        self.message_user(request, ngettext(
+            'Сleared the columns on %d board.',
+            'Сleared the columns on %d boards.',
+            updated,
+        ) % updated, messages.SUCCESS)
+
 
 @admin.register(models.Ship)
 class ShipAdmin(admin.ModelAdmin):
@@ -2,34 +2,25 @@ import random
 import asyncio
 import logging
 
-from config.utilities import redis_instance
-from src.game.consumers import db_queries as ws_db_queries, services as ws_services
+from src.game.consumers import mixins as ws_mixins
+from src.game.engine import bitboard, targeting
+from src.game.timers import turns
 
 
-class GenericBot:
+class GenericBot(ws_mixins.GameStateMixin, ws_mixins.LobbyBoardsMixin):
     """
     A class that has the main logic for searching fields and other preparatory logic for executing shots
     """
 
     @staticmethod
-    def bot_gets_ship_dict_on_the_board(board: dict) -> dict:
+    def bot_gets_ship_dict_on_the_board(board: bitboard.CompactBoard) -> dict:
         """
         A bot gets ships on the board. 
         Return a following dictionary:
             {<ship_id>.<serial number of a ship of this type>: <number of fields it stands on>}.
         """
 
-        ship_dict = {}
-
-        for column_value in board.values():
-            for field_value in column_value.values():
-                if type(field_value) == float:
-                    if field_value not in ship_dict:
-                        ship_dict[field_value] = 1
-                    else:
-                        ship_dict[field_value] += 1
-
-        return ship_dict
+        return board.get_living_ship_dict()
     
     @staticmethod
     def bot_gets_ship_size_and_name_list(ships: dict) -> list:
@@ -166,9 +157,8 @@ class GenericBot:
         return field_dict
     
     async def bot_passes_move_to_user(self, lobby_slug: str, user) -> None:
-        boards = await ws_db_queries.get_lobby_boards(lobby_slug)
-        my_board, enemy_board = await ws_services.determine_whoose_boards(user, boards)
-        await ws_db_queries.update_boards(True, my_board, enemy_board)
+        if not await self.hand_over_turn(lobby_slug, user, True):
+            logging.warning(msg=f"Bot: the turn in lobby '{lobby_slug}' had already been moved.")
     
     async def bot_there_are_no_ships(self, output_data: dict) -> None:
         """If no ships on a board - end of a game"""
@@ -177,26 +167,124 @@ class GenericBot:
         await self.send_json(content=output_data)
     
     async def bot_missed(
-            self, user, board_id: int, lobby_name: str, 
-            random_shot: str, output_data: dict, board: dict
+            self, user, board_id: int, lobby_name: str, output_data: dict, board: bitboard.CompactBoard
         ) -> None:
         """If a bot missed"""
         
         output_data["is_my_turn"] = True
-        board[random_shot[0]][random_shot] = "miss"
         await self.bot_passes_move_to_user(lobby_name, user)
-        await ws_db_queries.write_shot(board_id, board)
+        await self.write_game_board(lobby_name, board_id, board)
     
+    def bot_shoots(
+            self, compact_board: bitboard.CompactBoard, board: dict, last_hit: str, field_dict: dict,
+            column_name_list: list, ship_size_and_name_list: list, max_index: int | None,
+            method_gets_fields_around_hit
+        ):
+        """
+        Shots of a bot turn, they are taken on the board in memory until a miss or the end of a game.
+        Yield (<shot fields>, <shot type>, <last hit before the shot>, <is a ship sunk>).
+        """
+
+        while True:
+            if not field_dict:
+                field_dict = self.bot_get_field_dict(board, column_name_list, 1)
+            
+            random_shot = random.choice(list(field_dict))
+            type_to_shot, found_slot = compact_board.shoot(random_shot)
+            fields = {random_shot: type_to_shot}
+            board[random_shot[0]][random_shot] = type_to_shot
+
+            # A bot missed
+            if type_to_shot == "miss":
+                yield fields, type_to_shot, last_hit, False
+                return
+
+            # if the ship was destroyed
+            if compact_board.is_sunk(found_slot):
+                for field_name, field_value in compact_board.reveal_space(found_slot).items():
+                    board[field_name[0]][field_name] = field_value
+                    fields[field_name] = field_value
+
+                yield fields, type_to_shot, last_hit, True
+                last_hit = ""
+
+                # if all ships were destroyed
+                if not compact_board.count_living_ships():
+                    return
+
+                ship_dict_on_board = self.bot_gets_ship_dict_on_the_board(compact_board)
+                max_index = max_index if max_index else self.bot_selects_target(ship_dict_on_board, ship_size_and_name_list)
+                field_dict = self.bot_get_field_dict(board, column_name_list, max_index)
+
+            # if the ship wasn't destroyed
+            else:
+                yield fields, type_to_shot, last_hit, False
+                field_dict = method_gets_fields_around_hit(random_shot, board, column_name_list)
+                last_hit = random_shot
+
+    def bot_shoots_by_board(self, compact_board: bitboard.CompactBoard, last_hit: str, method_selects_field):
+        """Shots of a bot turn that selects every field by the board itself, no fields are searched. See bot_shoots"""
+
+        while True:
+            field_name = method_selects_field(compact_board)
+            type_to_shot, found_slot = compact_board.shoot(field_name)
+            fields = {field_name: type_to_shot}
+
+            if type_to_shot == "miss":
+                yield fields, type_to_shot, last_hit, False
+                return
+
+            if compact_board.is_sunk(found_slot):
+                fields.update(compact_board.reveal_space(found_slot))
+                yield fields, type_to_shot, last_hit, True
+                last_hit = ""
+
+                if not compact_board.count_living_ships():
+                    return
+            else:
+                yield fields, type_to_shot, last_hit, False
+                last_hit = field_name
+
+    def bot_starts_turn(
+            self, compact_board: bitboard.CompactBoard, last_hit: str, ships: dict, column_name_list: list,
+            method_gets_fields_around_hit = None, max_index: int = None, method_selects_field = None
+        ):
+        """
+        A bot chooses fields to search and gets a generator of shots of its turn, see bot_shoots.
+        A bot that selects fields by the board itself gets shots of bot_shoots_by_board.
+        """
+
+        if method_selects_field is not None:
+            return self.bot_shoots_by_board(compact_board, last_hit, method_selects_field)
+
+        board = compact_board.to_columns()
+        ship_size_and_name_list = self.bot_gets_ship_size_and_name_list(ships) if max_index is None else []
+
+        if method_gets_fields_around_hit is None:
+            method_gets_fields_around_hit = self.bot_gets_fields_around_hit
+
+        # Checking whether there is a wounded ship on the user's board
+        if last_hit:
+            field_dict = method_gets_fields_around_hit(last_hit, board, column_name_list)
+        else:
+            ship_dict_on_board = self.bot_gets_ship_dict_on_the_board(compact_board)
+            max_index = max_index if max_index else self.bot_selects_target(ship_dict_on_board, ship_size_and_name_list)
+            field_dict = self.bot_get_field_dict(board, column_name_list, max_index)
+
+        return self.bot_shoots(compact_board, board, last_hit, field_dict, column_name_list, ship_size_and_name_list,
+                               max_index, method_gets_fields_around_hit)
+
     async def _bot_take_shot(
             self, user, lobby_id: int, lobby_slug: str, bot_level: str, board_id: int, time_to_turn: int, last_hit: str,
-            ships: dict, column_name_list: list, method_gets_fields_around_hit = None, max_index: int = None
+            ships: dict, column_name_list: list, method_gets_fields_around_hit = None, max_index: int = None,
+            method_selects_field = None, is_whole_turn: bool = False
         ) -> tuple:
-        """A bot shooting logic. A bot's shooting cycle will end on a first miss"""
+        """
+        A bot shooting logic. A bot's shooting cycle will end on a first miss.
+        In the whole turn mode all shots are sent at once.
+        """
 
-        board = await ws_db_queries.get_board(board_id, column_name_list)
-        ws_services.confert_to_json(board)
-        ship_dict_on_board = self.bot_gets_ship_dict_on_the_board(board)
-        ship_size_and_name_list = self.bot_gets_ship_size_and_name_list(ships) if max_index is None else []
+        compact_board = await self.get_game_board(lobby_slug, board_id)
         output_data = {
                 "type": "bot_taken_to_shot", 
                 "field_dict": {}, 
@@ -206,88 +294,100 @@ class GenericBot:
                 "bot_message": ""
             }
         
-        if not ship_dict_on_board:
+        if not compact_board.count_living_ships():
             return await self.bot_there_are_no_ships(output_data)
-        
-        if method_gets_fields_around_hit is None:
-            method_gets_fields_around_hit = self.bot_gets_fields_around_hit
 
-        # Checking whether there is a wounded ship on the user's board
-        if last_hit:
-            field_dict = method_gets_fields_around_hit(last_hit, board, column_name_list)
-        else:
-            max_index = max_index if max_index else self.bot_selects_target(ship_dict_on_board, ship_size_and_name_list)
-            field_dict = self.bot_get_field_dict(board, column_name_list, max_index)
+        shots = self.bot_starts_turn(compact_board, last_hit, ships, column_name_list, method_gets_fields_around_hit,
+                                     max_index, method_selects_field)
+
+        if is_whole_turn:
+            return await self._bot_resolve_turn(user, lobby_id, lobby_slug, bot_level, board_id, time_to_turn,
+                                                compact_board, shots)
 
         while True:
             # Delete "is_running" key from <lobby_slug> (remove this key from the redis dictionary to update the timer)
-            redis_instance.hdel(lobby_slug, "is_running")
+            await turns.end_turn(lobby_slug)
             
             # Update move time
             countdown = await self._countdown(self.lobby_name, time_to_turn)
 
-            if not field_dict:
-                field_dict = self.bot_get_field_dict(board, column_name_list, 1)
-            
-            random_shot = random.choice(list(field_dict))
-            type_to_shot = "hit" if type(board[random_shot[0]][random_shot]) == float else "miss"
-            fields = {random_shot: type_to_shot}
-
+            fields, type_to_shot, output_data["last_hit"], is_sunk = next(shots)
             output_data["field_dict"] = fields
-            output_data["last_hit"] = last_hit
             output_data["time_left"] = countdown["time_left"]
 
             # A bot missed
             if type_to_shot == "miss":
-                await self.bot_missed(user, board_id, lobby_slug, random_shot, output_data, board)
+                await self.bot_missed(user, board_id, lobby_slug, output_data, compact_board)
                 return await self.send_json(content=output_data)
             
             # A bot hit
-            found_ship = board[random_shot[0]][random_shot]
-            ship_dict_on_board[found_ship] -= 1
-            board[random_shot[0]][random_shot] = type_to_shot
-            await ws_db_queries.write_shot(board_id, board)
+            await self.write_game_board(lobby_slug, board_id, compact_board)
             
-            # if the ship was destroyed
-            if ship_dict_on_board[found_ship] == 0:
-                last_hit = ""
-                del ship_dict_on_board[found_ship]
-
-                fields.update(self._add_misses_around_sunken_ship(found_ship, board))
-
+            if is_sunk:
                 # if all ships were destroyed
-                if ship_dict_on_board:
-                    bot_message = self.get_bot_message_bot_destroyed_ship(bot_level)
-                    dict_message = await self._send_message(lobby_id, bot_message, True)
-                    output_data["bot_message"] =  dict_message["message"]
-
-                    max_index = max_index if max_index else self.bot_selects_target(ship_dict_on_board, ship_size_and_name_list)
-                    field_dict = self.bot_get_field_dict(board, column_name_list, max_index)
-
-                # if not all ships were destroyed
-                else:
+                if not compact_board.count_living_ships():
                     return await self.bot_there_are_no_ships(output_data)
-            
-            # if the ship wasn't destroyed
-            else:
-                field_dict = method_gets_fields_around_hit(random_shot, board, column_name_list)
-                last_hit = random_shot
+
+                bot_message = self.get_bot_message_bot_destroyed_ship(bot_level)
+                dict_message = await self._send_message(lobby_id, bot_message, True)
+                output_data["bot_message"] =  dict_message["message"]
 
             await self.send_json(content=output_data)
             await asyncio.sleep(1)
 
+    async def _bot_resolve_turn(
+            self, user, lobby_id: int, lobby_slug: str, bot_level: str, board_id: int, time_to_turn: int,
+            compact_board: bitboard.CompactBoard, shots
+        ) -> None:
+        """
+        Take all shots of a bot turn in memory, then write the board once
+        and send the shots in order as a single event with at most one chat message.
+        """
+
+        await turns.end_turn(lobby_slug)
+        countdown = await self._countdown(self.lobby_name, time_to_turn)
+        output_data = {
+                "type": "bot_turn_resolved",
+                "shots": [],
+                "is_my_turn": False,
+                "enemy_ships": None,
+                "time_left": countdown["time_left"],
+                "bot_message": ""
+            }
+        is_ship_sunk = False
+
+        for fields, type_to_shot, last_hit, is_sunk in shots:
+            output_data["shots"].append({"field_dict": fields, "last_hit": last_hit})
+            output_data["is_my_turn"] = type_to_shot == "miss"
+            is_ship_sunk = is_ship_sunk or is_sunk
+
+        if output_data["is_my_turn"]:
+            await self.bot_passes_move_to_user(lobby_slug, user)
+
+        await self.write_game_board(lobby_slug, board_id, compact_board)
+
+        if not compact_board.count_living_ships():
+            output_data["enemy_ships"] = 0
+
+        elif is_ship_sunk:
+            bot_message = self.get_bot_message_bot_destroyed_ship(bot_level)
+            dict_message = await self._send_message(lobby_id, bot_message, True)
+            output_data["bot_message"] = dict_message["message"]
+
+        await self.send_json(content=output_data)
+
 
 class EasyBot(GenericBot):
     """Easy bot level"""
 
     async def easy_bot_take_shot(
             self, user, lobby_id: int, lobby_slug: str, board_id: int, time_to_turn: int, last_hit: str, 
-            ships: dict, column_name_list: list
+            ships: dict, column_name_list: list, is_whole_turn: bool = False
         ) -> tuple:
         """A easy bot shooting logic."""
 
         await self._bot_take_shot(user, lobby_id, lobby_slug, "EASY", board_id, time_to_turn, last_hit, 
-            ships, column_name_list, max_index=1)
+            ships, column_name_list, max_index=1, is_whole_turn=is_whole_turn)
 
 
 class MediumBot(GenericBot):
@@ -295,66 +395,31 @@ class MediumBot(GenericBot):
 
     async def medium_bot_take_shot(
             self, user, lobby_id: int, lobby_slug: str, board_id: int, time_to_turn: int, last_hit: str, 
-            ships: dict, column_name_list: list
+            ships: dict, column_name_list: list, is_whole_turn: bool = False
         ) -> tuple:
         """A medium bot shooting logic."""
 
         await self._bot_take_shot(user, lobby_id, lobby_slug, "MEDIUM", board_id, time_to_turn, last_hit, 
-            ships, column_name_list)
+            ships, column_name_list, is_whole_turn=is_whole_turn)
 
 
 class HighBot(GenericBot):
     """High bot level"""
 
-    def high_bot_gets_fields_around_hit(self, current_field: str, board: dict, column_name_list: list) -> dict:
-        """A high bot receives fields around the board"""
-
-        field_dict = {}
-        field_number = int(current_field[1:])
-        column_name = current_field[0]
-        column_index = column_name_list.index(column_name)
-
-        for num in range(field_number, 1, -1):
-            _field = f"{column_name}{num - 1}"
-
-            if type(board[column_name][_field]) == float:
-                field_dict[_field] = board[column_name][_field]
-            elif board[column_name][_field] != "hit":
-                break
-        
-        for num in range(field_number, 10):
-            _field = f"{column_name}{num + 1}"
+    @staticmethod
+    def high_bot_selects_field(board: bitboard.CompactBoard) -> str:
+        """
+        A high bot selects a field that is covered by the most positions of the remaining ships.
+        The heat map covers wounded ships too, so the bot doesn't search fields around a hit.
+        """
 
-            if type(board[column_name][_field]) == float:
-                field_dict[_field] = board[column_name][_field]
-            elif board[column_name][_field] != "hit":
-                break
-        
-        for index in range(column_index, 0, -1):
-            _column_name = column_name_list[index - 1]
-            _field = f"{_column_name}{field_number}"
-
-            if type(board[_column_name][_field]) == float:
-                field_dict[_field] = board[_column_name][_field]
-            elif board[_column_name][_field] != "hit":
-                break
-        
-        for index in range(column_index, 9):
-            _column_name = column_name_list[index + 1]
-            _field = f"{_column_name}{field_number}"
-
-            if type(board[_column_name][_field]) == float:
-                field_dict[_field] = board[_column_name][_field]
-            elif board[_column_name][_field] != "hit":
-                break
-        
-        return field_dict
+        return targeting.select_field(board)
 
     async def high_bot_take_shot(
             self, user, lobby_id: int, lobby_slug: str, board_id: int, time_to_turn: int, 
-            last_hit: str, ships: dict, column_name_list: list
+            last_hit: str, ships: dict, column_name_list: list, is_whole_turn: bool = False
         ) -> tuple:
         """A high bot shooting logic"""
 
         await self._bot_take_shot(user, lobby_id, lobby_slug, "HIGH", board_id, time_to_turn, last_hit, 
-            ships, column_name_list, self.high_bot_gets_fields_around_hit)
+            ships, column_name_list, method_selects_field=self.high_bot_selects_field, is_whole_turn=is_whole_turn)
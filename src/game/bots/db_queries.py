@@ -2,7 +2,7 @@ import uuid
 
 from channels.db import database_sync_to_async
 
-from .. import models
+from .. import models, db_queries as game_queries
 from src.user.models import User
 
 
@@ -15,5 +15,5 @@ def create_lobby(
     query = models.Lobby.objects.create(
         name=name, bet=bet, time_to_move=time_to_move, time_to_placement=time_to_placement, is_play_with_a_bot=bot_level
     )
-    query.users.add(user)
+    game_queries.add_users_to_lobby(query.id, [user])
     return query.id, query.slug
@@ -0,0 +1,118 @@
+import time
+import asyncio
+import logging
+
+from functools import partial
+from channels.layers import get_channel_layer
+
+from config import settings
+from . import bot_interfaces
+from src.game.consumers import mixins as ws_mixins
+
+
+class CpuMeter:
+    """
+    Awaits a coroutine and counts the CPU time spent in its steps, time spent waiting isn't counted.
+    The steps run on the thread of the event loop, so its CPU time is counted, not the one of the whole process.
+    """
+
+    def __init__(self, coroutine) -> None:
+        self.coroutine = coroutine
+        self.cpu_time = 0.0
+
+    def __await__(self):
+        value, error = None, None
+
+        while True:
+            start = time.thread_time()
+            try:
+                future = self.coroutine.send(value) if error is None else self.coroutine.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.cpu_time += time.thread_time() - start
+
+            try:
+                value, error = (yield future), None
+            except BaseException as exception:
+                value, error = None, exception
+
+
+class BotExecutor:
+    """
+    Runs bot turns as asyncio tasks, a lobby has at most one running turn.
+    The number of turns running at once is capped, the rest wait for a free slot.
+    """
+
+    def __init__(self, max_tasks: int) -> None:
+        self.tasks = {}
+        self.semaphore = asyncio.Semaphore(max_tasks)
+        self.turn_count = 0
+        self.cpu_time = 0.0
+        self.wall_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def submit(self, lobby_slug: str, coroutine) -> bool:
+        """Start a bot turn of a lobby. Return False if the lobby already has a running turn"""
+
+        if lobby_slug in self.tasks:
+            coroutine.close()
+            logging.warning(msg=f"Bot: lobby '{lobby_slug}' already has a running turn.")
+            return False
+
+        task = asyncio.create_task(self._run(lobby_slug, coroutine))
+        self.tasks[lobby_slug] = task
+        task.add_done_callback(partial(self._finish_task, lobby_slug))
+        return True
+
+    async def _run(self, lobby_slug: str, coroutine) -> None:
+        async with self.semaphore:
+            meter = CpuMeter(coroutine)
+            start = time.perf_counter()
+
+            try:
+                await meter
+            finally:
+                wall_time = time.perf_counter() - start
+                self.turn_count += 1
+                self.cpu_time += meter.cpu_time
+                self.wall_time += wall_time
+                logging.info(
+                    msg=f"Bot: the turn of lobby '{lobby_slug}' took {wall_time:.2f}s, {meter.cpu_time * 1000:.1f}ms of CPU."
+                )
+
+    def _finish_task(self, lobby_slug: str, task: asyncio.Task) -> None:
+        del self.tasks[lobby_slug]
+
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(msg=f"Bot: the turn of lobby '{lobby_slug}' failed.", exc_info=task.exception())
+
+    async def cancel(self, lobby_slug: str) -> None:
+        """Stop a running bot turn of a lobby"""
+
+        task = self.tasks.get(lobby_slug)
+
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class BotPlayer(bot_interfaces.BotMessageInterface,
+                bot_interfaces.BotTakeToShotInterface,
+                ws_mixins.CountDownTimerMixin,
+                ws_mixins.SendMessageMixin):
+    """A bot that plays a turn apart from a consumer and sends its shots to the lobby group"""
+
+    def __init__(self, user, lobby_slug: str) -> None:
+        self.user = user
+        self.lobby_name = lobby_slug
+        self.lobby_group_name = f"lobby_{lobby_slug}"
+        self.channel_layer = get_channel_layer()
+
+    async def send_json(self, content: dict) -> None:
+        await self.channel_layer.group_send(self.lobby_group_name, content)
+
+
+bot_executor = BotExecutor(settings.BOT_SETTINGS["MAX_TASKS"])
@@ -0,0 +1,141 @@
+import time
+import random
+
+from src.game import services
+from src.game.engine import bitboard, placement
+from . import bot_logic
+
+
+SHIPS = [
+    {"id": 1, "name": "fourdeck", "size": 4},
+    {"id": 2, "name": "tripledeck", "size": 3},
+    {"id": 3, "name": "doubledeck", "size": 2},
+    {"id": 4, "name": "singledeck", "size": 1},
+]
+BOT_LEVELS = ("EASY", "MEDIUM", "HIGH")
+
+# A decision that took less than 2 ** <bucket> microseconds falls into the bucket
+LATENCY_BUCKET_COUNT = 20
+
+
+def get_level_options(bot: bot_logic.BotTakeShot, bot_level: str) -> dict:
+    """Get options of a bot turn that the <level>_bot_take_shot methods pass to _bot_take_shot"""
+
+    if bot_level == "EASY":
+        return {"max_index": 1}
+    elif bot_level == "MEDIUM":
+        return {}
+    elif bot_level == "HIGH":
+        return {"method_selects_field": bot.high_bot_selects_field}
+    raise ValueError()
+
+
+class SimulationStats:
+    """Results of simulated games, stats of different processes are merged"""
+
+    def __init__(self) -> None:
+        self.games = {}
+        self.wins = {}
+        self.shots_to_win = {}
+        self.latency_histograms = {}
+
+    def add_game(self, bot_levels: tuple, winner: str, shot_count: int) -> None:
+        self.games[bot_levels] = self.games.get(bot_levels, 0) + 1
+        self.wins[(bot_levels, winner)] = self.wins.get((bot_levels, winner), 0) + 1
+        self.shots_to_win[winner] = self.shots_to_win.get(winner, 0) + shot_count
+
+    def add_decision(self, bot_level: str, nanoseconds: int) -> None:
+        histogram = self.latency_histograms.setdefault(bot_level, [0] * LATENCY_BUCKET_COUNT)
+        histogram[min((nanoseconds // 1000).bit_length(), LATENCY_BUCKET_COUNT - 1)] += 1
+
+    def merge(self, other: "SimulationStats") -> "SimulationStats":
+        for name in ("games", "wins", "shots_to_win"):
+            for key, value in getattr(other, name).items():
+                getattr(self, name)[key] = getattr(self, name).get(key, 0) + value
+
+        for bot_level, other_histogram in other.latency_histograms.items():
+            histogram = self.latency_histograms.setdefault(bot_level, [0] * LATENCY_BUCKET_COUNT)
+            for bucket, count in enumerate(other_histogram):
+                histogram[bucket] += count
+
+        return self
+
+    def get_win_rate(self, bot_levels: tuple, bot_level: str) -> float:
+        return self.wins.get((bot_levels, bot_level), 0) / self.games[bot_levels]
+
+    def get_average_shots_to_win(self, bot_level: str) -> float | None:
+        win_count = sum(count for (_, winner), count in self.wins.items() if winner == bot_level)
+        return self.shots_to_win[bot_level] / win_count if win_count else None
+
+    def get_latency_quantile(self, bot_level: str, quantile: float) -> int:
+        """Get an upper bound of a quantile of decision latency in microseconds"""
+
+        histogram = self.latency_histograms[bot_level]
+        rank, count = quantile * sum(histogram), 0
+
+        for bucket, bucket_count in enumerate(histogram):
+            count += bucket_count
+            if count >= rank:
+                return 2 ** bucket
+        return 2 ** (LATENCY_BUCKET_COUNT - 1)
+
+
+class SimulatedBot:
+    """A bot level that takes turns at an enemy board in memory"""
+
+    def __init__(self, bot: bot_logic.BotTakeShot, bot_level: str, enemy_board: bitboard.CompactBoard) -> None:
+        self.bot = bot
+        self.bot_level = bot_level
+        self.enemy_board = enemy_board
+        self.options = get_level_options(bot, bot_level)
+        self.last_hit = ""
+        self.shot_count = 0
+
+    def take_turn(self, stats: SimulationStats) -> bool:
+        """Shoot until a miss. Return True if all enemy ships have sunk"""
+
+        shots = self.bot.bot_starts_turn(self.enemy_board, self.last_hit, SHIPS, services.column_name_list,
+                                         **self.options)
+
+        while True:
+            start = time.perf_counter_ns()
+            _, type_to_shot, last_hit, _ = next(shots)
+            stats.add_decision(self.bot_level, time.perf_counter_ns() - start)
+            self.shot_count += 1
+
+            if type_to_shot == "miss":
+                self.last_hit = last_hit
+                return False
+
+            if not self.enemy_board.count_living_ships():
+                return True
+
+
+def play_game(bot: bot_logic.BotTakeShot, bot_levels: tuple, stats: SimulationStats, rng: random.Random) -> str:
+    """Play a game between two bot levels on random layouts. Return the level of the winner"""
+
+    fleet = placement.get_fleet(SHIPS, services.ship_count_dict)
+    players = [SimulatedBot(bot, bot_level, placement.place_fleet(fleet, rng)) for bot_level in bot_levels]
+    turn = rng.randrange(2)
+
+    while not players[turn].take_turn(stats):
+        turn = 1 - turn
+
+    winner = players[turn]
+    stats.add_game(bot_levels, winner.bot_level, winner.shot_count)
+    return winner.bot_level
+
+
+def simulate(bot_levels: tuple, game_count: int, seed: int | None = None) -> SimulationStats:
+    """Play a number of games between two bot levels"""
+
+    # Bots draw their shots from the random module, so it is seeded too
+    random.seed(seed)
+    rng = random.Random(seed)
+    bot = bot_logic.BotTakeShot()
+    stats = SimulationStats()
+
+    for _ in range(game_count):
+        play_game(bot, bot_levels, stats, rng)
+
+    return stats
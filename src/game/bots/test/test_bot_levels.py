@@ -6,7 +6,9 @@ from src.user.models import User
 from src.game import models as game_models
 from src.game.bots import bot_levels
 from src.game.consumers import db_queries as ws_db_queries, services as ws_services
+from src.game.engine import bitboard, store
 from src.game.consumers.test.test_data import board, ships, column_name_list
+from config.utilities import redis_instance
 
 
 class TestSyncGenericBot(APITestCase):
@@ -25,7 +27,7 @@ class TestSyncGenericBot(APITestCase):
     def test_bot_gets_ship_dict_on_the_board(self):
         """Testing bot_gets_ship_dict_on_the_board method"""
         
-        ship_dict = self.instance.bot_gets_ship_dict_on_the_board(board)
+        ship_dict = self.instance.bot_gets_ship_dict_on_the_board(bitboard.CompactBoard.from_columns(deepcopy(board)))
         assert ship_dict == self.ship_dict_on_board, ship_dict
 
     def test_bot_gets_ship_size_and_name_list(self):
@@ -65,6 +67,22 @@ class TestSyncGenericBot(APITestCase):
         field_dict_1 = self.instance.bot_get_field_dict(copy_board, column_name_list, 4)
         assert len(field_dict_1) == 21, field_dict_1
     
+    def test_bot_shoots(self):
+        """Testing bot_shoots method"""
+
+        compact_board = bitboard.CompactBoard.from_columns(deepcopy(board))
+        copy_board = compact_board.to_columns()
+        field_dict = self.instance.bot_get_field_dict(copy_board, column_name_list, 4)
+        shots = list(self.instance.bot_shoots(
+            compact_board, copy_board, "", field_dict, column_name_list, self.ship_size_and_name_list, 4,
+            self.instance.bot_gets_fields_around_hit
+        ))
+
+        *hits, (fields, shot_type, _, _) = shots
+        assert shot_type == "miss" or not compact_board.count_living_ships(), shots
+        assert all(shot_type == "hit" for _, shot_type, _, _ in hits), hits
+        assert copy_board == compact_board.to_columns(), copy_board
+
     def test_bot_defines_plane(self):
         """Testing bot_defines_plane method"""
 
@@ -129,10 +147,6 @@ class TestAsyncGenericBot(APITransactionTestCase):
 
     fixtures = ["./src/game/consumers/test/test_data.json"]
 
-    @staticmethod
-    async def perform_write_shot(board_id: int, column_dictionary: dict) -> None:
-        await ws_db_queries.write_shot(board_id, column_dictionary)
-
     def setUp(self) -> None:
         super().setUp()
         self.user = User.objects.get(pk=1)
@@ -140,14 +154,22 @@ class TestAsyncGenericBot(APITransactionTestCase):
         self.board_1 = game_models.Board.objects.get(id=3)
         self.board_2 = game_models.Board.objects.get(id=4)
 
+        # The bot passes a move only while its board holds the turn
+        self.board_2.is_my_turn = True
+        self.board_2.save(update_fields=["is_my_turn"])
+
         self.instance = bot_levels.GenericBot()
-        self.instance.perform_write_shot = self.perform_write_shot
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        store.delete(str(self.lobby.slug))
+        redis_instance.delete(str(self.lobby.slug))
     
     async def test_bot_passes_move_to_user(self):
         """Testing bot_passes_move_to_user method"""
 
         assert self.board_1.is_my_turn == False, self.board_1.is_my_turn
-        assert self.board_2.is_my_turn == False, self.board_2.is_my_turn
+        assert self.board_2.is_my_turn == True, self.board_2.is_my_turn
 
         await self.instance.bot_passes_move_to_user(self.lobby.slug, self.user)
         await database_sync_to_async(self.board_1.refresh_from_db)()
@@ -159,18 +181,19 @@ class TestAsyncGenericBot(APITransactionTestCase):
     async def test_bot_missed(self):
         """Testing bot_missed method"""
 
-        board = await ws_db_queries.get_board(self.board_1.id, column_name_list)
-        ws_services.confert_to_json(board)
+        board = bitboard.CompactBoard.from_bytes(await ws_db_queries.get_board(self.board_1.id))
+        board.shoot("A1")
 
         assert self.board_1.is_my_turn == False, self.board_1.is_my_turn
-        assert self.board_2.is_my_turn == False, self.board_2.is_my_turn
+        assert self.board_2.is_my_turn == True, self.board_2.is_my_turn
 
-        await self.instance.bot_missed(self.user, self.board_1.id, str(self.lobby.slug), "A1", {}, board)
+        await self.instance.bot_missed(self.user, self.board_1.id, str(self.lobby.slug), {}, board)
         await database_sync_to_async(self.board_1.refresh_from_db)()
         await database_sync_to_async(self.board_2.refresh_from_db)()
         
         assert self.board_1.is_my_turn == True, self.board_1.is_my_turn
         assert self.board_2.is_my_turn == False, self.board_2.is_my_turn
+        assert store.get_board(str(self.lobby.slug), self.board_1.id) == board
 
 
 class TestHighBot(APITestCase):
@@ -186,28 +209,15 @@ class TestHighBot(APITestCase):
 
         cls.instance = bot_levels.HighBot()
 
-    def test_high_bot_gets_fields_around_hit(self):
-        """Testing high_bot_gets_fields_around_hit method"""
-
-        copy_board = deepcopy(board)
-
-        # horizontal
-        field_dict = self.instance.high_bot_gets_fields_around_hit("F7", copy_board, column_name_list)
-        test_data = {"F6": 27.2, "F8": 27.2, "F9": 27.2}
-        assert field_dict == test_data, field_dict
-
-        copy_board["F"]["F6"] = "hit"
-        copy_board["F"]["F9"] = "hit"
-        field_dict = self.instance.high_bot_gets_fields_around_hit("F7", copy_board, column_name_list)
-        test_data = {"F8": 27.2}
-        assert field_dict == test_data, field_dict
+    def test_high_bot_starts_turn(self):
+        """Testing bot_starts_turn method with the field selection of a high bot"""
 
-        copy_board["F"]["F8"] = "hit"
-        field_dict = self.instance.high_bot_gets_fields_around_hit("F7", copy_board, column_name_list)
-        test_data = {}
-        assert field_dict == test_data, field_dict
+        compact_board = bitboard.CompactBoard.from_columns(deepcopy(board))
+        shots = list(self.instance.bot_starts_turn(
+            compact_board, "", ships, column_name_list, method_selects_field=self.instance.high_bot_selects_field
+        ))
 
-        # vertical
-        field_dict = self.instance.high_bot_gets_fields_around_hit("H1", copy_board, column_name_list)
-        test_data = {'F1': 27.1, 'G1': 27.1, 'I1': 27.1}
-        assert field_dict == test_data, field_dict
+        *hits, (fields, shot_type, _, _) = shots
+        assert shot_type == "miss" or not compact_board.count_living_ships(), shots
+        assert all(shot_type == "hit" for _, shot_type, _, _ in hits), hits
+        assert len({next(iter(fields)) for fields, _, _, _ in shots}) == len(shots), shots
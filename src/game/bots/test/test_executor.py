@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+
+from src.game.bots.executor import BotExecutor, CpuMeter
+
+
+async def bot_turn(shots: list, count: int) -> int:
+    for shot in range(count):
+        await asyncio.sleep(0.01)
+        shots.append(shot)
+    return count
+
+
+class TestBotExecutor:
+    """Testing the BotExecutor class methods"""
+
+    @pytest.mark.asyncio
+    async def test_cpu_meter(self):
+        """Testing that the CpuMeter class returns a result of a coroutine and doesn't count waiting"""
+
+        meter = CpuMeter(bot_turn([], 5))
+        assert await meter == 5
+        assert 0 < meter.cpu_time < 0.05, meter.cpu_time
+
+    @pytest.mark.asyncio
+    async def test_submit(self):
+        """Testing that a lobby has only one running turn"""
+
+        executor, shots = BotExecutor(10), []
+
+        assert executor.submit("first", bot_turn(shots, 3)) == True
+        assert executor.submit("first", bot_turn(shots, 3)) == False
+        assert executor.submit("second", bot_turn(shots, 3)) == True
+        assert len(executor) == 2
+
+        await asyncio.gather(*executor.tasks.values())
+        await asyncio.sleep(0)
+
+        assert len(shots) == 6, shots
+        assert len(executor) == 0
+        assert executor.turn_count == 2
+
+    @pytest.mark.asyncio
+    async def test_max_tasks(self):
+        """Testing that turns over the limit wait for a free slot and that a turn can be cancelled"""
+
+        executor, first_shots, second_shots = BotExecutor(1), [], []
+        executor.submit("first", bot_turn(first_shots, 100))
+        executor.submit("second", bot_turn(second_shots, 1))
+        await asyncio.sleep(0.05)
+        assert 0 < len(first_shots) < 100, first_shots
+        assert second_shots == [], second_shots
+
+        await executor.cancel("first")
+        await asyncio.gather(*executor.tasks.values())
+        assert len(first_shots) < 100, first_shots
+        assert second_shots == [0], second_shots
+        assert executor.turn_count == 2
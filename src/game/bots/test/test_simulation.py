@@ -0,0 +1,32 @@
+import pytest
+
+from src.game.bots import simulation
+
+
+class TestSimulation:
+    """Testing the bot simulation functions"""
+
+    def test_simulate(self):
+        """Testing the simulate function and the SimulationStats class"""
+
+        pair = ("EASY", "HIGH")
+        stats = simulation.simulate(pair, 20, seed=0)
+
+        assert stats.games == {pair: 20}, stats.games
+        assert stats.get_win_rate(pair, "EASY") + stats.get_win_rate(pair, "HIGH") == 1
+        assert 17 <= stats.get_average_shots_to_win("HIGH") <= 100, stats.shots_to_win
+        assert stats.get_latency_quantile("HIGH", 0.5) <= stats.get_latency_quantile("HIGH", 0.99)
+
+        # games are repeated by a seed
+        assert simulation.simulate(pair, 20, seed=0).wins == stats.wins
+
+        decision_count = sum(stats.latency_histograms["EASY"])
+        stats.merge(simulation.simulate(pair, 10, seed=1))
+        assert stats.games == {pair: 30}, stats.games
+        assert sum(stats.latency_histograms["EASY"]) > decision_count
+
+    def test_get_level_options(self):
+        """Testing the get_level_options function"""
+
+        with pytest.raises(ValueError):
+            simulation.get_level_options(simulation.bot_logic.BotTakeShot(), "easy")
@@ -1,6 +1,7 @@
 import uuid
 
 from ..models import Lobby, Board
+from ..engine import store
 
 
 def determine_winner_at_preparation_stage(lobby_slug: uuid) -> None:
@@ -19,6 +20,9 @@ def determine_winner_at_shot_stage(lobby_slug: uuid) -> None:
     """Determine the winner at the shot stage"""
 
     lobby = Lobby.objects.get(slug=lobby_slug)
+    store.flush(lobby_slug)
+    store.delete(lobby_slug)
+
     if not lobby.winner:
         Board.objects.filter(lobby_id=lobby.id).update(is_play_again=False)
         username = Board.objects.get(lobby_id=lobby.id, is_my_turn=False).user_id.username
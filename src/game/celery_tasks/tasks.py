@@ -1,38 +1,25 @@
-import uuid
-import logging
-import asyncio
-
-from asgiref.sync import async_to_sync
 from celery import shared_task
 
-from config.utilities import redis_instance
-from . import services
+from ..engine import store, layout_pool
+from .. import leaderboard
+
+
+@shared_task(ignore_result=True)
+def flush_game_states():
+    """The periodic task that writes game states of running games to the database"""
+
+    store.flush_all()
 
 
 @shared_task(ignore_result=True)
-def countdown(lobby_slug: uuid, time_left: int, old_turn: str):
-    """The task that acts like a countdown"""
-
-    for number in range(time_left, -1, -1):
-        current_turn = redis_instance.hget(lobby_slug, "current_turn")
-        logging.info(msg=(current_turn, number))
-        async_to_sync(asyncio.sleep)(1)
-
-        if number > 0 and current_turn == old_turn:
-            redis_instance.hset(lobby_slug, mapping={"time_left": number})
-
-        else:
-            if current_turn == None:
-                redis_instance.delete(lobby_slug)
-            
-            elif current_turn == "0":
-                async_to_sync(asyncio.sleep)(5)
-                if redis_instance.hget(lobby_slug, "current_turn") == "0":
-                    services.determine_winner_at_preparation_stage(lobby_slug)
-            
-            elif int(current_turn) > 0 and number == 0:
-                async_to_sync(asyncio.sleep)(3)
-                services.determine_winner_at_shot_stage(lobby_slug)
-
-            logging.info(msg="Task closed.")
-            break
+def build_leaderboard():
+    """The periodic task that builds the leaderboard in Redis when it isn't built"""
+
+    leaderboard.build_if_missing()
+
+
+@shared_task(ignore_result=True)
+def fill_layout_pool(ship_sizes: list):
+    """The task that tops a pool of fleet layouts up"""
+
+    layout_pool.fill(tuple(ship_sizes))
@@ -2,11 +2,13 @@ import random
 import logging
 
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
-from ..bots import bot_interfaces
+from ..bots import bot_interfaces, executor
 
-from config.utilities import redis_instance
+from config.utilities import async_redis_instance
 from . import mixins, db_queries
-from .. import services
+from .. import services, lobby_list
+from ..engine import store
+from ..timers import deadlines
 
 
 class MainConsumer(AsyncJsonWebsocketConsumer, mixins.CreateNewGameMixin):
@@ -23,13 +25,16 @@ class MainConsumer(AsyncJsonWebsocketConsumer, mixins.CreateNewGameMixin):
     async def receive_json(self, content, **kwargs):
         if content["type"] == "created_game":
             lobby = await self.get_new_game(content["lobby_slug"])
+            await lobby_list.arefresh(lobby["id"])
             data = {"type": content["type"], "lobby": lobby, "user_id": self.scope["user"].id}
             await self.channel_layer.group_send(self.lobby_group_name, data)
         
         elif content["type"] == "deleted_game":
+            # The lobby leaves the index in delete_game, once it is deleted from the database
             await self.channel_layer.group_send(self.lobby_group_name, content)
         
         elif content["type"] == "add_user_to_game":
+            await lobby_list.arefresh(content["lobby_id"])
             data = {"type": content["type"], "lobby_id": content["lobby_id"], "user_id": self.scope["user"].id}
             await self.channel_layer.group_send(self.lobby_group_name, data)
     
@@ -77,7 +82,6 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer,
         self.user = None
         self.lobby_group_name = None
         self.column_name_list = services.column_name_list
-        self.string_number_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         self.ship_count_dict = services.ship_count_dict  
 
     async def connect(self):
@@ -113,15 +117,21 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer,
         
         # A bot makes to shot
         elif content["type"] == "bot_take_to_shot":
-            await self.bot_take_shot(
+            bot = executor.BotPlayer(self.user, self.lobby_name)
+            executor.bot_executor.submit(self.lobby_name, bot.bot_take_shot(
                 self.user, content["lobby_id"], self.lobby_name, content["board_id"], content["time_to_turn"], 
-                content["last_hit"], content["ships"], self.column_name_list, content["bot_level"]
-            )
+                content["last_hit"], content["ships"], self.column_name_list, content["bot_level"],
+                content.get("is_whole_turn", False)
+            ))
 
         elif content["type"] == "take_shot":
-            is_my_turn, field_name_dict, enemy_ships = await self.take_shot(
-                self.lobby_name, content["board_id"], content["field_name"]
-            )
+            shot = await self.take_shot(self.lobby_name, content["board_id"], content["field_name"])
+
+            # A second shot of a stale client after its miss
+            if shot is None:
+                return await self.send_json(content={"type": "shot_rejected", "field_name": content["field_name"]})
+
+            is_my_turn, field_name_dict, enemy_ships = shot
             countdown = await self._countdown(self.lobby_name, content["time_to_turn"])
             data = {"type": "send_shot", "field_name_dict": field_name_dict, "user_id": self.user.id, 
                       "is_my_turn": is_my_turn, "enemy_ships": enemy_ships, "time_left": countdown["time_left"]}
@@ -171,7 +181,7 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer,
             if not content["is_bot"]:
                 await self.calculate_rating_and_cash_of_game(winner, content["bet"])
             
-            self.remove_current_turn_in_lobby_from_redis(self.lobby_name)
+            await self.remove_current_turn_in_lobby_from_redis(self.lobby_name)
             await self.channel_layer.group_send(self.lobby_group_name, {"type": "determine_winner", "winner": winner})
 
         elif content["type"] == "countdown":
@@ -232,8 +242,12 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer,
             await self.channel_layer.group_send(self.lobby_group_name, data)
         
         elif content["type"] == "delete_game":
-            await db_queries.delete_lobby(self.lobby_name)
-            redis_instance.delete(self.lobby_name)
+            await executor.bot_executor.cancel(self.lobby_name)
+            lobby_id = await db_queries.delete_lobby(self.lobby_name)
+            await lobby_list.aremove(lobby_id)
+            await async_redis_instance.delete(self.lobby_name)
+            await store.adelete(self.lobby_name)
+            await deadlines.acancel(self.lobby_name)
 
     async def send_shot(self, event):
         """Called when someone fires at an enemy board"""
@@ -241,6 +255,18 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer,
         logging.info("sent 'send_shot' message")
         await self.send_json(event)
     
+    async def bot_taken_to_shot(self, event):
+        """Called when a bot fires at a user board"""
+
+        logging.info("sent 'bot_taken_to_shot' message")
+        await self.send_json(event)
+    
+    async def bot_turn_resolved(self, event):
+        """Called when a bot took all shots of its turn at once"""
+
+        logging.info("sent 'bot_turn_resolved' message")
+        await self.send_json(event)
+    
     async def is_ready_to_play(self, event):
         """Called when someone change ready to play field"""
 
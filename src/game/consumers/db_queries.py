@@ -1,32 +1,28 @@
 import uuid
 
+from django.db import transaction
+from django.db.models import Case, When, Value, F
 from django.utils import timezone
 from channels.db import database_sync_to_async
 
-from .. import models
+from .. import models, db_queries as game_queries
 from ...user import models as user_models
+from ...user.auth import token_cache
 
 
 @database_sync_to_async
-def get_board(board_id: int, column_name_list: list) -> models.Board:
-    """Get enemy board"""
+def get_board(board_id: int) -> bytes:
+    """Get a packed board"""
 
-    query = models.Board.objects.values(*column_name_list).get(id=board_id)
-    return query
+    query = models.Board.objects.values_list("grid", flat=True).get(id=board_id)
+    return bytes(query)
 
 
 @database_sync_to_async
-def update_board(board_id: int, board: dict) -> None:
-    """Get board for update"""
+def update_board(board_id: int, grid: bytes) -> None:
+    """Update a packed board"""
 
-    models.Board.objects.filter(id=board_id).update(**board)
-
-
-@database_sync_to_async
-def write_shot(board_id: int, board: dict) -> None:
-    """Get board for update"""
-
-    models.Board.objects.filter(id=board_id).update(**board)
+    models.Board.objects.filter(id=board_id).update(grid=grid)
 
 
 @database_sync_to_async
@@ -69,20 +65,38 @@ def clear_count_of_ships(board_id: int) -> None:
 
 
 @database_sync_to_async
-def get_lobby_boards(lobby_slug: uuid) -> list:
-    """Get lobby boards"""
+def get_lobby_board_owners(lobby_slug: uuid) -> list:
+    """Get (<board id>, <owner id>) of lobby boards"""
 
-    query = models.Board.objects.select_related("lobby_id").filter(lobby_id__slug=lobby_slug)
+    query = models.Board.objects.filter(lobby_id__slug=lobby_slug).values_list("id", "user_id")
     return list(query)
 
 
 @database_sync_to_async
-def update_boards(bool_value: bool, my_board, enemy_board) -> None:
-    """Update your_turn field of Boards model instances"""
+def is_turn_held(board_id: int) -> bool:
+    """Check whether a board holds the turn"""
+
+    return models.Board.objects.filter(id=board_id, is_my_turn=True).exists()
 
-    my_board.is_my_turn = bool_value
-    enemy_board.is_my_turn = not bool_value
-    models.Board.objects.bulk_update([my_board, enemy_board], ["is_my_turn"])
+
+@database_sync_to_async
+def transfer_turn(board_ids: tuple, board_id: int, expected_board_id: int | None) -> bool:
+    """
+    Give the turn to one of the boards if it is still at the expected board, None expects that nobody has it.
+    The boards are checked and updated by a single statement. Return False and leave the boards untouched
+    if the turn was moved by someone else, e.g. by a second shot of a stale client.
+    """
+
+    with transaction.atomic():
+        count = models.Board.objects.filter(
+            id__in=board_ids, is_my_turn=Case(When(id=expected_board_id, then=Value(True)), default=Value(False))
+        ).update(is_my_turn=Case(When(id=board_id, then=Value(True)), default=Value(False)))
+
+        # Rows are checked one by one, a half-applied transfer is rolled back
+        if count != len(board_ids):
+            transaction.set_rollback(True)
+
+    return count == len(board_ids)
 
 
 async def get_lobby_by_slug(slug: uuid) -> models.Lobby:
@@ -115,10 +129,10 @@ async def get_user(id: int) -> str:
 
 
 @database_sync_to_async
-def add_user_to_lobby(lobby: models.Lobby, user: models.User) -> None:
-    """Add a second user to a lobby"""
+def add_user_to_lobby(lobby: models.Lobby, user: models.User) -> bool:
+    """Add a second user to a lobby. Return False if somebody has taken the place"""
 
-    lobby.users.add(user)
+    return game_queries.add_users_to_lobby(lobby.id, [user])
 
 
 @database_sync_to_async
@@ -155,19 +169,38 @@ def create_lobby(name: str, bet: int, time_to_move: int, time_to_placement: int,
 
     query = models.Lobby.objects.create(name=name, bet=bet, time_to_move=time_to_move, 
                                         time_to_placement=time_to_placement)
-    query.users.add(*users)
+    game_queries.add_users_to_lobby(query.id, users)
     return query.id, query.slug
 
 
 @database_sync_to_async
-def delete_lobby(lobby_slug: str) -> None:
-    """Delete lobby"""
+def delete_lobby(lobby_slug: str) -> int:
+    """Delete lobby. Return its id"""
 
-    models.Lobby.objects.get(slug=lobby_slug).delete()
+    lobby = models.Lobby.objects.get(slug=lobby_slug)
+    lobby_id = lobby.id
+    lobby.delete()
+    return lobby_id
 
 
 @database_sync_to_async
-def update_user_statistics(winning_user: user_models.User, losing_user: user_models.User) -> None:
-    """Update the bet and the rating of the user model instance"""
+def update_user_statistics(winning_user_id: int, losing_user_id: int, rating: int, bet: int) -> list[user_models.User]:
+    """
+    Move the bet and the rating from the loser to the winner and count the game in the stats summary of the users.
+    The fields are raised by F expressions, so games of a user that end at the same time don't lose an update.
+    Return the users with their new ratings.
+    """
+
+    users = user_models.User.objects.filter(id__in=(winning_user_id, losing_user_id))
+
+    with transaction.atomic():
+        users.filter(id=winning_user_id).update(
+            cash=F("cash") + bet, rating=F("rating") + rating,
+            game_count=F("game_count") + 1, win_count=F("win_count") + 1,
+        )
+        users.filter(id=losing_user_id).update(
+            cash=F("cash") - bet, rating=F("rating") - rating, game_count=F("game_count") + 1
+        )
 
-    user_models.User.objects.bulk_update([winning_user, losing_user], ["cash", "rating"])
+    token_cache.invalidate_users(winning_user_id, losing_user_id)
+    return list(users.only("id", "username", "rating"))
@@ -8,9 +8,10 @@ from channels.db import database_sync_to_async
 from ..celery_tasks import tasks
 
 from . import services, db_queries
-from .addspace import add_space
-from .. import serializers, models as game_models, db_queries as game_queries
-from config.utilities import redis_instance
+from ..engine import bitboard, placement, layout_pool, store
+from ..timers import turns
+from .. import serializers, models as game_models, db_queries as game_queries, leaderboard
+from config.utilities import async_redis_instance
 
 
 class RefreshBoardMixin:
@@ -30,7 +31,7 @@ class RefreshBoardMixin:
         await self.perform_refresh_board(board_id, board)
     
     async def perform_refresh_board(self, board_id: int, board: dict) -> None:
-        await db_queries.update_board(board_id, board)
+        await db_queries.update_board(board_id, bitboard.CompactBoard.from_columns(board).to_bytes())
 
 
 class RefreshShipsMixin:
@@ -59,11 +60,15 @@ class DropShipOnBoardMixin:
 class AddSpaceAroundShipMixin:
     """Add spaces around a ship"""
 
-    def insert_space_around_ship(self, space_name, ship_plane: str, field_name_list: list, board: dict) -> None:
-        if ship_plane == "horizontal": 
-            add_space.AddSpaceAroundShipHorizontally(space_name, field_name_list, self.column_name_list, board)
-        else:
-            add_space.AddSpaceAroundShipVertically(space_name, field_name_list, self.column_name_list, board)
+    @staticmethod
+    def insert_space_around_ship(space_name: str, field_name_list: list, board: dict) -> None:
+        """Add a space name to the fields around a ship, they are taken from the neighbour table"""
+
+        halo = bitboard.get_halo(bitboard.get_mask(field_name_list))
+
+        for index in bitboard.iter_indexes(halo):
+            field_name = bitboard.field_name(index)
+            board[field_name[0]][field_name] += space_name
 
 
 class ClearCountOfShipsMixin:
@@ -80,14 +85,95 @@ class ClearCountOfShipsMixin:
         await db_queries.clear_count_of_ships(board_id)
 
 
-class IsReadyToPlayMixin:
+class GameStateMixin:
+    """
+    Boards of a running game live in the game state store.
+    The database is updated at the end of a game and periodically by the celery beat.
+    """
+
+    async def get_game_board(self, lobby_slug: uuid.uuid4, board_id: int) -> bitboard.CompactBoard:
+        """Get a board from the game state, load it from the database if it isn't there"""
+
+        board = await store.aget_board(lobby_slug, board_id)
+
+        if board is None:
+            board = bitboard.CompactBoard.from_bytes(await db_queries.get_board(board_id))
+            await store.aset_board(lobby_slug, board_id, board, is_dirty=False)
+
+        return board
+
+    async def write_game_board(self, lobby_slug: uuid.uuid4, board_id: int, board: bitboard.CompactBoard) -> None:
+        await store.aset_board(lobby_slug, board_id, board)
+
+    async def load_game_state(self, lobby_slug: uuid.uuid4) -> None:
+        """Load boards of a lobby to the game state"""
+
+        grids = await database_sync_to_async(game_queries.get_lobby_grids)(lobby_slug)
+        boards = {board_id: bitboard.CompactBoard.from_bytes(grid) for board_id, grid in grids.items()}
+        await store.aset_boards(lobby_slug, boards, is_dirty=False)
+
+    async def close_game_state(self, lobby_slug: uuid.uuid4) -> None:
+        """Write boards of a lobby to the database and remove the game state"""
+
+        await database_sync_to_async(store.flush)(lobby_slug)
+        await store.adelete(lobby_slug)
+
+
+class LobbyBoardsMixin:
+    """
+    Ids of the lobby boards are fetched once and kept on the instance, the owner of the first board doesn't change.
+    A turn is handed over by a single conditional update of both boards, the board that holds it is kept in Redis too.
+    """
+
+    async def get_lobby_board_ids(self, lobby_slug: uuid.uuid4, user) -> tuple[int, int]:
+        """Get ids of the user board and the enemy board"""
+
+        lobby_board_ids = vars(self).setdefault("lobby_board_ids", {})
+        key = (str(lobby_slug), user.id)
+
+        if key not in lobby_board_ids:
+            boards = await db_queries.get_lobby_board_owners(lobby_slug)
+            lobby_board_ids[key] = services.determine_whoose_board_ids(user.id, boards)
+
+        return lobby_board_ids[key]
+
+    async def hand_over_turn(self, lobby_slug: uuid.uuid4, user, is_my_turn: bool, is_first_turn: bool = False) -> bool:
+        """
+        Give the turn to the user board or to the enemy board, the other board has to hold it.
+        The first turn is given only if nobody holds it. Return False if the turn wasn't given.
+        """
+
+        my_board_id, enemy_board_id = await self.get_lobby_board_ids(lobby_slug, user)
+        board_id, expected_board_id = (my_board_id, enemy_board_id) if is_my_turn else (enemy_board_id, my_board_id)
+        expected_board_id = None if is_first_turn else expected_board_id
+        is_transferred = await db_queries.transfer_turn((my_board_id, enemy_board_id), board_id, expected_board_id)
+
+        if is_transferred:
+            await turns.set_turn_board(lobby_slug, board_id)
+        return is_transferred
+
+    async def holds_turn(self, lobby_slug: uuid.uuid4, user, turn_board_id: int | None) -> bool:
+        """
+        Check whether the user board holds the turn, against the board read from Redis by the shot lock.
+        A turn that isn't kept in Redis, e.g. after the lobby hash was lost, is read from the database.
+        """
+
+        my_board_id, _ = await self.get_lobby_board_ids(lobby_slug, user)
+
+        if turn_board_id is None:
+            return await db_queries.is_turn_held(my_board_id)
+        return turn_board_id == my_board_id
+
+
+class IsReadyToPlayMixin(GameStateMixin):
     """Update a model instance"""
 
     async def _is_ready_to_play(self, board_id: int, is_ready: bool, is_enemy_ready: bool) -> bool:
         """Change ready to play field"""
 
         if is_ready and is_enemy_ready:
-            redis_instance.hdel(self.lobby_name, "is_running")
+            await turns.end_turn(self.lobby_name)
+            await self.load_game_state(self.lobby_name)
 
         await self.perform_update_board_is_ready(board_id, is_ready)
         return is_ready
@@ -96,7 +182,7 @@ class IsReadyToPlayMixin:
         await db_queries.update_board_is_ready(board_id, is_ready)
 
 
-class DetermineWinnerMixin:
+class DetermineWinnerMixin(GameStateMixin):
     """Determine a winner of a game"""
 
     async def detemine_winner_name(self, user_id: int, bot_level: str) -> str:
@@ -110,6 +196,7 @@ class DetermineWinnerMixin:
         return f"{bot_level} bot"
 
     async def determine_winner_of_game(self, lobby_slug: uuid.uuid4, username: str) -> None:
+        await self.close_game_state(lobby_slug)
         await self.preform_set_winner_in_lobby(lobby_slug, username)
 
     async def preform_set_winner_in_lobby(self, lobby_slug: uuid.uuid4, username: str) -> None:
@@ -124,17 +211,13 @@ class AddUserToGameMixin:
     def is_lobby_free(user, lobby) -> bool:
         """Check if a lobby is free"""
 
-        user_list = lobby.users.all()
-
-        if len(user_list) < 2 or user in user_list:
-            return True
-        return False
+        return lobby.player_count < 2 or lobby.users.filter(id=user.id).exists()
 
     async def _add_user_to_game(self, board_id: int) -> game_models.User or None:
         lobby = await db_queries.get_lobby_by_slug(self.lobby_name)
 
-        if await self.is_lobby_free(self.user, lobby):
-            await db_queries.add_user_to_lobby(lobby, self.user)
+        # The place may be taken between the check and the join
+        if await self.is_lobby_free(self.user, lobby) and await db_queries.add_user_to_lobby(lobby, self.user):
             await db_queries.update_user_id_of_board(board_id, self.user.id)
             serializer = serializers.BaseUserSerializer(self.user)
             return serializer.data
@@ -204,31 +287,23 @@ class CreateNewGameMixin:
 class CountDownTimerMixin:
     """
     Timer class. 
-    Starts a background countdown with celery.
+    Sets a turn deadline that is fired by the timer service.
     Sends the remaining time to the action and the name of the action.
     """
 
     @staticmethod
-    def remove_current_turn_in_lobby_from_redis(lobby_slug: uuid.uuid4) -> None:
+    async def remove_current_turn_in_lobby_from_redis(lobby_slug: uuid.uuid4) -> None:
         """Remove current turn in lobby key from redis"""
 
-        redis_instance.hdel(lobby_slug, "current_turn")
+        await async_redis_instance.hdel(lobby_slug, "current_turn")
 
     async def _countdown(self, lobby_slug: uuid.uuid4, time_left: int | None) -> dict:
         """Timer"""
 
-        current_turn = redis_instance.hget(lobby_slug, "current_turn")
-        is_task_in_progress = redis_instance.hget(lobby_slug, "is_running")
-
         if time_left is None:
-            time_left = int(redis_instance.hget(lobby_slug, "time_left"))
+            time_left = await turns.claim_timer(lobby_slug)
         else:
-            redis_instance.hset(name=lobby_slug, mapping={"current_turn": int(current_turn) + 1})
-            current_turn = str(int(current_turn) + 1)
-
-        if not is_task_in_progress:
-            tasks.countdown.delay(lobby_slug, time_left, current_turn)
-            redis_instance.hset(name=lobby_slug, mapping={"is_running": 1})
+            time_left = await turns.advance_turn(lobby_slug, time_left)
 
         return {"type": "countdown", "time_left": time_left}
 
@@ -236,210 +311,89 @@ class CountDownTimerMixin:
 class CalculateRatingAndCash:
     """Calculate current user rating and cash"""
 
-    def calculate_rating(self, rating: int, winning_user, losing_user) -> None:
-        """Calculate rating"""
-
-        winning_user.rating += rating
-        losing_user.rating -= rating
-    
-    def calculate_cash(self, bet: int, winning_user, losing_user) -> None:
-        """Calculate rating"""
-
-        winning_user.cash += bet
-        losing_user.cash -= bet
-
     async def calculate_rating_and_cash_of_game(self, winner: str, bet: int) -> None:
         """Calculate current user rating and cash"""
 
         lobby = await db_queries.get_lobby_with_users_by_slug(self.lobby_name)
         winning_user, losing_user = services.determine_winner_and_loser(winner, lobby.users.all())
         random_rating = random.choice(range(25, 31))
-        self.calculate_rating(random_rating, winning_user, losing_user)
-        self.calculate_cash(bet, winning_user, losing_user)
-        await self.perform_update_user_statistics(winning_user, losing_user)
+        await self.perform_update_user_statistics(winning_user, losing_user, random_rating, bet)
 
-    async def perform_update_user_statistics(self, winning_user, losing_user) -> None:
-        await db_queries.update_user_statistics(winning_user, losing_user)
+    async def perform_update_user_statistics(self, winning_user, losing_user, rating: int, bet: int) -> None:
+        users = await db_queries.update_user_statistics(winning_user.id, losing_user.id, rating, bet)
+        await leaderboard.aupdate_users(*users)
 
 
-class TakeShotMixin:
+class TakeShotMixin(GameStateMixin, LobbyBoardsMixin):
     """Update a model instance"""
 
-    @staticmethod
-    def _get_type_shot(board, field_name) -> str:
-        """Get type shot on field"""
-
-        return "hit" if type(board[field_name[0]][field_name]) == float else "miss"
-
-    @staticmethod
-    def _shot(board: dict, field_name: str, shot_type: str) -> str:
-        """Make a shoot"""
-
-        field_value = board[field_name[0]][field_name]
-        board[field_name[0]][field_name] = shot_type
-        return field_value
-    
-    @staticmethod
-    def _is_ship_has_sunk(field_value: float, board: dict) -> bool:
-        """Check if the ship has sunk"""
-
-        for _, column_value in board.items():
-            for _, value in column_value.items():
-                if field_value == value:
-                    return False
-        return True
-    
-    @staticmethod
-    def _add_misses_around_sunken_ship(field_value: float, board: dict) -> dict:
-        """Add misses around the sunken ship"""
-
-        field_name_dict = {}
-
-        for column_name, column_value in board.items():
-            for field_name, value in column_value.items():
-                if f"space {field_value}" in str(value):
-                    board[column_name][field_name] = "miss"
-                    field_name_dict[field_name] = "miss"
-        
-        return field_name_dict
+    async def hand_over_to_the_enemy(self, lobby_slug: uuid.uuid4) -> bool:
+        return await self.hand_over_turn(lobby_slug, self.user, False)
+
+    async def take_shot(self, lobby_slug: uuid.uuid4, board_id: int, field_name: str) -> tuple | None:
+        """
+        Take a shot at an enemy board. Return None if the shot was taken out of turn, the board isn't touched then.
+        Shots of a lobby hold its shot lock from the turn check to the write, so two shots can't pass one check.
+        """
+
+        token, turn_board_id = await turns.lock_shot(lobby_slug)
+
+        if token is None:
+            logging.warning(msg=f"User '{self.user.username}' took a shot during another shot in lobby '{lobby_slug}'.")
+            return None
+
+        try:
+            if not await self.holds_turn(lobby_slug, self.user, turn_board_id):
+                logging.warning(msg=f"User '{self.user.username}' took a shot out of turn in lobby '{lobby_slug}'.")
+                return None
+
+            board = await self.get_game_board(lobby_slug, board_id)
+            shot_type, slot = board.shoot(field_name)
+            is_my_turn = True if shot_type == "hit" else False
+            number_of_enemy_ships, field_name_dict = None, {field_name: shot_type}
+
+            if is_my_turn:
+                if board.is_sunk(slot):
+                    field_name_dict.update(board.reveal_space(slot))
+                    number_of_enemy_ships = board.count_living_ships()
+            elif not await self.hand_over_to_the_enemy(lobby_slug):
+                logging.warning(msg=f"User '{self.user.username}' took a shot out of turn in lobby '{lobby_slug}'.")
+                return None
+
+            await turns.end_turn(lobby_slug)
+
+            await self.perform_write_shot(lobby_slug, board_id, board)
+            return is_my_turn, field_name_dict, number_of_enemy_ships
+        finally:
+            await turns.unlock_shot(lobby_slug, token)
     
-    async def hand_over_to_the_enemy(self, lobby_slug: uuid.uuid4) -> None:
-        boards = await db_queries.get_lobby_boards(lobby_slug)
-        my_board, enemy_board = await services.determine_whoose_boards(self.user, boards)
-        await db_queries.update_boards(False, my_board, enemy_board)
-
-    async def take_shot(self, lobby_slug: uuid.uuid4, board_id: int, field_name: str) -> tuple:
-        board = await db_queries.get_board(board_id, self.column_name_list)
-        services.confert_to_json(board)
-        shot_type = self._get_type_shot(board, field_name)
-        field_value = self._shot(board, field_name, shot_type)
-        is_my_turn = True if shot_type == "hit" else False
-        number_of_enemy_ships, field_name_dict = None, {field_name: shot_type}
-
-        if is_my_turn:
-            if self._is_ship_has_sunk(field_value, board):
-                field_name_dict.update(self._add_misses_around_sunken_ship(field_value, board))
-                number_of_enemy_ships = services.determine_number_of_enemy_ships(board)
-        else: 
-            await self.hand_over_to_the_enemy(lobby_slug)
-
-        redis_instance.hdel(lobby_slug, "is_running")
-
-        await self.perform_write_shot(board_id, board)
-        return is_my_turn, field_name_dict, number_of_enemy_ships
-    
-    async def perform_write_shot(self, board_id: int, column_dictionary: dict) -> None:
-        await db_queries.write_shot(board_id, column_dictionary)
+    async def perform_write_shot(self, lobby_slug: uuid.uuid4, board_id: int, board: bitboard.CompactBoard) -> None:
+        await self.write_game_board(lobby_slug, board_id, board)
 
 
-class RandomPlacementMixin(AddSpaceAroundShipMixin):
+class RandomPlacementMixin:
     """Update a board model instance"""
 
-    @staticmethod
-    def _is_put_on_board(field_list: list, board: dict) -> bool:
-        """Check if a ship can be put on a board"""
-
-        for field_name in field_list:
-            if board[field_name[0]][field_name]:
-                return False
-
-        return True
-    
-    @staticmethod
-    def _put_ship_on_board(ship_id: int, ship_number: int, field_list: list, board: dict) -> None:
-        """Put a ship on a board"""
-
-        for field_name in field_list:
-            board[field_name[0]][field_name] = float(f"{ship_id}.{ship_number}")
-
-    @staticmethod
-    def get_field_list_horizontally(
-        random_number: int, random_column_name: str, ship_size: int, column_name_list: list
-    ) -> list:
-        """Get list of field horizontally"""
-
-        index = column_name_list.index(random_column_name)
-
-        if index + ship_size <= 9:
-            field_list = [f"{column_name_list[index + number]}{random_number}" for number in range(ship_size)]
-        else: 
-            field_list = [f"{column_name_list[index - number]}{random_number}" for number in range(ship_size)]
-        
-        return field_list
-    
-    @staticmethod
-    def get_field_list_vertically(random_number: int, random_column_name: str, ship_size: int) -> list:
-        """Get list of fields vertically"""
-
-        if random_number + ship_size <= 10:
-            field_list = [f"{random_column_name}{random_number + number}" for number in range(ship_size)]
-        else: 
-            field_list = [f"{random_column_name}{random_number - number}" for number in range(ship_size)]
-        
-        return field_list
-
-    # Переработать логику получения списка полей, костыль херня
-    async def get_field_list(self, plane: str, ship_size: int, board: dict, ships: list) -> list:
-        """Get a list of fields where a ship will a located"""
-
-        for _ in range(100):
-            random_number = random.choice(self.string_number_list)
-            random_column_name = random.choice(self.column_name_list)
-
-            if plane == "vertical":
-                field_list = self.get_field_list_vertically(random_number, random_column_name, ship_size)
-            else:
-                field_list = self.get_field_list_horizontally(
-                    random_number, random_column_name, ship_size, self.column_name_list
-                )
-
-            if self._is_put_on_board(field_list, board):
-                return field_list
-
-        logging.info(msg="Failed to randomize ships to the board, try again.")
-        return await self.random_placement(board, ships)
-
     async def random_placement(self, board: dict, ships: list) -> dict:
         """Random ships placement on a board"""
 
-        services.clear_board(board)
-
-        for ship in ships:
-            count = self.ship_count_dict[ship["name"]]
-            for ship_number in range(1, count + 1):
-                plane = random.choice(("horizontal", "vertical"))
-                field_list = await self.get_field_list(plane, ship["size"], board, ships)
-                if type(field_list) == list:  # из-за временного костыля идет проверка, при его исправлении - проверку убрать
-                    self._put_ship_on_board(ship["id"], ship_number, field_list, board)
-                    self.insert_space_around_ship(f" space {ship['id']}.{ship_number}", plane, field_list, board)
-
+        placed_board = placement.place_fleet(placement.get_fleet(ships, self.ship_count_dict))
+        board.update(placed_board.to_columns())
         return board
     
     async def perform_update_board(self, board_id: int, column_dictionary: dict) -> None:
-        await db_queries.update_board(board_id, column_dictionary)
+        await db_queries.update_board(board_id, bitboard.CompactBoard.from_columns(column_dictionary).to_bytes())
 
 
-class ChooseWhoWillShotFirstMixin:
+class ChooseWhoWillShotFirstMixin(LobbyBoardsMixin):
     """Concrete mixin that chooses a player who will shot first"""
 
-    @staticmethod
-    @database_sync_to_async
-    def is_turn_determined(my_board: game_models.Board, enemy_board: game_models.Board) -> bool:
-        """Check if a turn is determined"""
-
-        if my_board.is_my_turn or enemy_board.is_my_turn:
-            return True
-        return False
-
     async def choose_first_shooter(self, lobby_slug: uuid.uuid4) -> bool or None:
-        """Choose who will take first shot"""
+        """Choose who will take first shot, None if the turn is already determined"""
 
-        boards = await db_queries.get_lobby_boards(lobby_slug)
-        my_board, enemy_board = await services.determine_whoose_boards(self.user, boards)
+        random_bool_value = random.choice((True, False))
 
-        if not await self.is_turn_determined(my_board, enemy_board):
-            random_bool_value = random.choice((True, False))
-            await db_queries.update_boards(random_bool_value, my_board, enemy_board)
+        if await self.hand_over_turn(lobby_slug, self.user, random_bool_value, is_first_turn=True):
             return random_bool_value
 
 
@@ -453,7 +407,7 @@ class RandomPlacementClearShipsMixin(RandomPlacementMixin, ClearCountOfShipsMixi
         ) -> None:
         """Random placement ships on a board and update ships count field"""
 
-        placed_board = await self.random_placement(board, ships)
+        placed_board = await self.pop_layout(board, ships)
         self._clear_count_of_ships(ships)
         data = {"type": "random_placed", "ships": ships, "board": placed_board, "board_id": board_id}
 
@@ -463,6 +417,18 @@ class RandomPlacementClearShipsMixin(RandomPlacementMixin, ClearCountOfShipsMixi
         if bot_level is None: 
             await self.send_json(content=data)
 
+    async def pop_layout(self, board: dict, ships: list) -> dict:
+        """Random ships placement on a board by a layout from the pool, start the pool refill if it runs low"""
+
+        fleet = placement.get_fleet(ships, self.ship_count_dict)
+        placed_board, is_refill_needed = await layout_pool.pop(fleet)
+
+        if is_refill_needed:
+            tasks.fill_layout_pool.delay(placement.get_ship_sizes(fleet))
+
+        board.update(placed_board.to_columns())
+        return board
+
 
 class RefreshBoardShipsMixin(RefreshBoardMixin, RefreshShipsMixin):
     """Concrete mixin for refresh a board model instance and ship model instances"""
@@ -499,7 +465,7 @@ class DropShipAddSpaceMixin(DropShipOnBoardMixin, AddSpaceAroundShipMixin):
         """Drop a ship on a board and add spaces around a ship"""
 
         self.drop_ship_on_board(ship_id, ship_count, field_name_list, board)
-        self.insert_space_around_ship(f" space {ship_id}.{ship_count}", ship_plane, field_name_list, board)
+        self.insert_space_around_ship(f" space {ship_id}.{ship_count}", field_name_list, board)
 
         await self.perform_update_board(board_id, board)
         await self.perform_ship_updates(ship_id, ship_count)
@@ -508,7 +474,7 @@ class DropShipAddSpaceMixin(DropShipOnBoardMixin, AddSpaceAroundShipMixin):
         await self.send_json(content={"type": "drop_ship", "board": board, "board_id": board_id, "ships": ship_list})
     
     async def perform_update_board(self, board_id: int, board: dict) -> None:
-        await db_queries.update_board(board_id, board)
+        await db_queries.update_board(board_id, bitboard.CompactBoard.from_columns(board).to_bytes())
     
     async def perform_ship_updates(self, ship_id: int, ship_count: int) -> None:
         await db_queries.update_count_of_ship(ship_id, ship_count)
@@ -1,39 +1,3 @@
-import logging
-import json
-
-from channels.db import database_sync_to_async
-
-
-
-def confert_to_json(board: dict) -> None:
-    """Convert board to json format"""
-
-    for key, value in board.items():
-        board[key] = json.loads(value.replace("'", '"'))
-
-
-def clear_board(board_columns: dict) -> dict:
-    """Clear board"""
-
-    for column_name, column_value in board_columns.items():
-        for field_name, field_value in column_value.items():
-            if field_value:
-                board_columns[column_name][field_name] = ""
-
-
-def determine_number_of_enemy_ships(board: dict) -> int:
-        """Determine number of living enemy ships"""
-
-        enemy_ships_list = []
-
-        for _, column_value in board.items():
-            for _, value in column_value.items():
-                if value not in enemy_ships_list and type(value) == float:
-                    enemy_ships_list.append(value)
-        
-        return len(enemy_ships_list)
-
-
 def determine_winner_and_loser(winner: str, users) -> tuple:
     """Determine winner and loser users"""
 
@@ -43,10 +7,11 @@ def determine_winner_and_loser(winner: str, users) -> tuple:
         return users[1], users[0]
 
 
-@database_sync_to_async
-def determine_whoose_boards(user, boards: list) -> tuple:
-        """Determine whoose boards"""
+def determine_whoose_board_ids(user_id: int, boards: list) -> tuple[int, int]:
+    """Determine whoose boards by (<board id>, <owner id>) of lobby boards"""
+
+    (first_board_id, first_owner_id), (second_board_id, _) = boards
 
-        if user.username == str(boards[0].user_id):
-            return boards[0], boards[1]
-        return boards[1], boards[0]
+    if first_owner_id == user_id:
+        return first_board_id, second_board_id
+    return second_board_id, first_board_id
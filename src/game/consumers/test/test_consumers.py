@@ -5,10 +5,12 @@ from channels.testing import WebsocketCommunicator
 from channels.db import database_sync_to_async
 
 from .test_data import column_name_list
-from src.game.consumers import consumers, services, db_queries
+from src.game.consumers import consumers, mixins, db_queries
+from src.game.engine import bitboard
 from src.game import models, serializers
 from src.user import models as user_models, services as user_services
 from config.utilities import redis_instance
+from src.user.auth import token_cache
 from config.middlewares import TokenAuthMiddlewareStack
 
 
@@ -34,6 +36,7 @@ class Config(TransactionTestCase):
         
     def tearDown(self) -> None:
         redis_instance.flushall()
+        token_cache.local_cache.clear()
         super().tearDown()
 
     async def launch_websocket_communicator(self, path: str):
@@ -134,7 +137,7 @@ class TestBotLobbyConsumer(Config):
                 if item in ship_list:
                     ship_list.pop(0)
         
-        await db_queries.update_board(1, board_column_list)
+        await db_queries.update_board(1, bitboard.CompactBoard.from_columns(board_column_list).to_bytes())
 
     async def test_easy_bot_take_to_shot(self):
         """Testing easy bot """
@@ -209,6 +212,33 @@ class TestBotLobbyConsumer(Config):
 
         await communicator.disconnect()
     
+    async def test_whole_bot_turn(self):
+        """Testing a bot turn that is sent as a single event"""
+
+        path = f"ws/lobby/{self.lobby_1.slug}/?token={self.token_1.access_token}"
+        communicator = await self.launch_websocket_communicator(path=path)
+        redis_instance.hset(name=str(self.lobby_1.slug), mapping={"current_turn": 0})
+
+        test_input = {
+            "type": "bot_take_to_shot", 
+            "lobby_id": 1,
+            "board_id": 1, 
+            "last_hit": "", 
+            "time_to_turn": 30, 
+            "bot_level": "HIGH", 
+            "ships": self.ser_board_1_ships,
+            "is_whole_turn": True
+            }
+
+        await communicator.send_json_to(test_input)
+        response = await communicator.receive_json_from()
+        assert response["type"] == "bot_turn_resolved", response["type"]
+        assert len(response["shots"]) > 0, response["shots"]
+        assert response["time_left"] == 30, response["time_left"]
+        assert response["is_my_turn"] == ("miss" in response["shots"][-1]["field_dict"].values()), response
+
+        await communicator.disconnect()
+    
     async def test_high_bot_destroy_ship(self):
         """Testing high bot destroy ship"""
 
@@ -356,7 +386,8 @@ class TestLobbyConsumer(Config):
         path = f"ws/lobby/{self.lobby_1.slug}/?token={self.token_1.access_token}"
         communicator = await self.launch_websocket_communicator(path=path)
         assert communicator.scope["user"].id == self.user_1.id, communicator.scope["user"].id
-        assert self.board_1.A[1:49] == "'A1': '', 'A2': ' space 7.1', 'A3': ' space 7.1'", self.board_1.A[1:49]
+        board_1 = bitboard.CompactBoard.from_bytes(self.board_1.grid).to_columns()
+        assert (board_1["A"]["A1"], board_1["A"]["A2"], board_1["A"]["A3"]) == ("", " space 7.1", " space 7.1"), board_1["A"]
 
         test_data = {
             "type": "refresh_board", 
@@ -367,7 +398,7 @@ class TestLobbyConsumer(Config):
 
         await communicator.send_json_to(test_data)
         response = await communicator.receive_json_from()
-        services.clear_board(self.board_column_list)
+        mixins.RefreshBoardMixin._clear_board(self.board_column_list)
 
         test_response = {
             "type": "clear_board", 
@@ -392,7 +423,7 @@ class TestLobbyConsumer(Config):
         communicator = await self.launch_websocket_communicator(path=path)
         assert communicator.scope["user"].id == self.user_1.id, communicator.scope["user"].id
 
-        services.clear_board(self.board_column_list)
+        mixins.RefreshBoardMixin._clear_board(self.board_column_list)
         test_data = {
             "type": "drop_ship",
             "ship_id": 1,
@@ -428,6 +459,8 @@ class TestLobbyConsumer(Config):
         path = f"ws/lobby/{self.lobby_1.slug}/?token={self.token_1.access_token}"
         communicator = await self.launch_websocket_communicator(path=path)
         redis_instance.hset(name=str(self.lobby_1.slug), mapping={"current_turn": 0})
+        await database_sync_to_async(models.Board.objects.filter(id=1).update)(is_my_turn=True)
+        await database_sync_to_async(models.Board.objects.filter(id=2).update)(is_my_turn=False)
         assert communicator.scope["user"].id == self.user_1.id, communicator.scope["user"].id
 
         # miss
@@ -455,7 +488,7 @@ class TestLobbyConsumer(Config):
         
         assert response == data, response
 
-        # hit
+        # miss out of turn
         await communicator.send_json_to({
             "type": "take_shot", 
             "lobby_id": 1,
@@ -464,21 +497,28 @@ class TestLobbyConsumer(Config):
             "field_name": "A3", 
             "time_to_turn": 30
         })
-        response = await communicator.receive_json_from()
+        with self.assertLogs(level="WARNING"):
+            response = await communicator.receive_json_from()
 
-        if "bot_message" in response.keys():
-            response.pop("bot_message")
-        
-        data = {
-            "type": "send_shot", 
-            "field_name_dict": {"A3": "miss"}, 
-            "user_id": self.user_1.id, 
-            "is_my_turn": False, 
-            "enemy_ships": None, 
-            "time_left": 30
-        }
+        assert response == {"type": "shot_rejected", "field_name": "A3"}, response
 
-        assert response == data, response
+        # hit out of turn
+        await communicator.send_json_to({
+            "type": "take_shot", 
+            "lobby_id": 1,
+            "board_id": 1, 
+            "bot_level": "EASY",
+            "field_name": "C1", 
+            "time_to_turn": 30
+        })
+        with self.assertLogs(level="WARNING"):
+            response = await communicator.receive_json_from()
+
+        assert response == {"type": "shot_rejected", "field_name": "C1"}, response
+
+        await database_sync_to_async(models.Board.objects.filter(id=1).update)(is_my_turn=True)
+        await database_sync_to_async(models.Board.objects.filter(id=2).update)(is_my_turn=False)
+        redis_instance.hset(name=str(self.lobby_1.slug), key="turn_board_id", value=1)
 
         # hit (destroy ship)
         await communicator.send_json_to({
@@ -4,9 +4,11 @@ from copy import deepcopy
 from channels.db import database_sync_to_async
 from rest_framework.test import APITestCase, APITransactionTestCase
 
-from src.game import models, serializers
+from src.game import models, serializers, leaderboard
 from src.user import models as user_models
-from src.game.consumers import services, mixins, db_queries
+from src.game.consumers import mixins, db_queries
+from src.game.engine import bitboard, store
+from src.game.timers import deadlines, turns
 from .test_data import column_name_list, ship_count_dict
 from config.utilities import redis_instance
 
@@ -115,8 +117,8 @@ class TestDropShipOnBoardMixin(APITestCase):
 
         board_1 = {key: value for key, value in self.ser_board_1.items() if key in column_name_list}
         board_2 = {key: value for key, value in self.ser_board_2.items() if key in column_name_list}
-        services.clear_board(board_1)
-        services.clear_board(board_2)
+        mixins.RefreshBoardMixin._clear_board(board_1)
+        mixins.RefreshBoardMixin._clear_board(board_2)
         copy_board_1 = deepcopy(board_1)
         copy_board_2 = deepcopy(board_2)
 
@@ -158,9 +160,9 @@ class TestAddSpaceAroundShipMixin(APITestCase):
         board_1 = {key: value for key, value in self.ser_board_1.items() if key in column_name_list}
         board_2 = {key: value for key, value in self.ser_board_2.items() if key in column_name_list}
         board_3 = {key: value for key, value in self.ser_board_3.items() if key in column_name_list}
-        services.clear_board(board_1)
-        services.clear_board(board_2)
-        services.clear_board(board_3)
+        mixins.RefreshBoardMixin._clear_board(board_1)
+        mixins.RefreshBoardMixin._clear_board(board_2)
+        mixins.RefreshBoardMixin._clear_board(board_3)
         copy_board_1 = deepcopy(board_1)
         copy_board_2 = deepcopy(board_2)
         copy_board_3 = deepcopy(board_3)
@@ -169,19 +171,19 @@ class TestAddSpaceAroundShipMixin(APITestCase):
         assert copy_board_2["F"]["F1"] == "", copy_board_2["F"]["F1"]
         assert copy_board_3["H"]["H1"] == "", copy_board_3["H"]["H1"]
 
-        self.instance.insert_space_around_ship(" space 27.4", "horizontal", ["F1", "G1", "H1", "I1"], copy_board_1)
+        self.instance.insert_space_around_ship(" space 27.4", ["F1", "G1", "H1", "I1"], copy_board_1)
         assert copy_board_1 != board_1, copy_board_1
         assert copy_board_1["G"]["G2"] == " space 27.4", copy_board_1["G"]["G2"]
         assert copy_board_1["F"]["F5"] == "", copy_board_1["F"]["F5"]
         assert copy_board_1["H"]["H2"] == " space 27.4", copy_board_1["H"]["H2"]
 
-        self.instance.insert_space_around_ship(" space 27.3", "vertical", ["F1", "F2", "F3", "F4"], copy_board_2)
+        self.instance.insert_space_around_ship(" space 27.3", ["F1", "F2", "F3", "F4"], copy_board_2)
         assert copy_board_2 != board_2, copy_board_2
         assert copy_board_2["G"]["G2"] == " space 27.3", copy_board_2["G"]["G2"]
         assert copy_board_2["F"]["F5"] == " space 27.3", copy_board_2["F"]["F5"]
         assert copy_board_2["H"]["H2"] == "", copy_board_2["H"]["H2"]
 
-        self.instance.insert_space_around_ship(" space 27.2", "vertical", ["H1", "H2", "H3", "H4"], copy_board_3)
+        self.instance.insert_space_around_ship(" space 27.2", ["H1", "H2", "H3", "H4"], copy_board_3)
         assert copy_board_3 != board_3, copy_board_3
         assert copy_board_3["G"]["G2"] == " space 27.2", copy_board_3["G"]["G2"]
         assert copy_board_3["F"]["F5"] == "", copy_board_3["F"]["F5"]
@@ -413,17 +415,17 @@ class TestCreateNewGameMixin(APITransactionTestCase):
 
         new_lobby_slug = await self.instance.create_new_game(30, "test", 30, 30, 2)
         new_lobby = await db_queries.get_lobby_by_slug(new_lobby_slug)
-        new_board_list = await db_queries.get_lobby_boards(new_lobby_slug)
+        new_board_list = await db_queries.get_lobby_board_owners(new_lobby_slug)
         assert new_lobby.name == "test (1)", new_lobby.name
         assert new_lobby.id == 3, new_lobby.id
-        assert len(new_board_list) == 2, new_board_list
+        assert {owner_id for _, owner_id in new_board_list} == {self.user.id, 2}, new_board_list
 
         new_lobby_slug = await self.instance.create_new_game(30, "(1) qwe test (3)", 30, 30, 2)
         new_lobby = await db_queries.get_lobby_by_slug(new_lobby_slug)
-        new_board_list = await db_queries.get_lobby_boards(new_lobby_slug)
+        new_board_list = await db_queries.get_lobby_board_owners(new_lobby_slug)
         assert new_lobby.name == "(1) qwe test (4)", new_lobby.name
         assert new_lobby.id == 4, new_lobby.id
-        assert len(new_board_list) == 2, new_board_list
+        assert {owner_id for _, owner_id in new_board_list} == {self.user.id, 2}, new_board_list
     
     async def test_get_new_game(self):
         """Testing the get_new_game method"""
@@ -454,7 +456,8 @@ class TestCountDownTimerMixin(APITestCase):
     def tearDownClass(cls) -> None:
         info = f"{cls.__name__}: Number of keys in Redis database before closing: {len(redis_instance.keys())}"
         logging.info(info)
-        redis_instance.delete("celery", "_kombu.binding.celery", cls.lobby_slug)
+        redis_instance.delete(cls.lobby_slug)
+        deadlines.cancel(cls.lobby_slug)
         super().tearDownClass()
 
     async def test_countdown(self):
@@ -487,102 +490,79 @@ class TestCountDownTimerMixin(APITestCase):
         resposne = await self.instance._countdown(self.lobby_slug, None)
         current_turn = redis_instance.hget(self.lobby_slug, "current_turn")
         is_task_in_progress = redis_instance.hget(self.lobby_slug, "is_running")
-        assert resposne == {"type": "countdown", "time_left": 30}, resposne
+        assert resposne == {"type": "countdown", "time_left": 15}, resposne
         assert current_turn == "2", current_turn
         assert is_task_in_progress == "1", is_task_in_progress
 
 
-class TestTakeShotMixin(APITransactionTestCase):
-    """Testing the TakeShotMixin class methods"""
+class TestCalculateRatingAndCash(APITransactionTestCase):
+    """Testing the CalculateRatingAndCash class methods"""
 
     fixtures = ["./src/game/consumers/test/test_data.json"]
 
     def setUp(self) -> None:
         super().setUp()
+        self.user_1 = user_models.User.objects.get(id=1)
+        self.user_2 = user_models.User.objects.get(id=2)
 
-        self.lobby = models.Lobby.objects.prefetch_related("users", "boards").get(id=1)
-        self.board_1, self.board_2 = self.lobby.boards.all()
-        self.user_2, self.user_1 = self.lobby.users.all()
-
-        self.ser_board = serializers.BoardSerializer(self.board_1).data
-        self.board = {key: value for key, value in self.ser_board.items() if key in column_name_list}
-        self.lobby_slug = str(self.lobby.slug)
-
-        self.instance = mixins.TakeShotMixin()
-
-    def test_get_type_shot(self):
-        """Testing the _get_type_shot method"""
-
-        type_shot = self.instance._get_type_shot(self.board, "I4")
-        assert type_shot == "hit"
-
-        type_shot = self.instance._get_type_shot(self.board, "A1")
-        assert type_shot == "miss"
+        self.instance = mixins.CalculateRatingAndCash()
 
-        type_shot = self.instance._get_type_shot(self.board, "A2")
-        assert type_shot == "miss"
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(leaderboard.RATINGS_KEY, leaderboard.USERNAMES_KEY)
 
-        type_shot = self.instance._get_type_shot(self.board, "A1")
-        assert type_shot == "miss"
-    
-    def test_shot(self):
-        """Testing the _shot method"""
+    async def test_perform_update_user_statistics(self):
+        """Testing that games of a user that end at the same time are both counted"""
 
-        assert self.ser_board["F"]["F1"] == " space 19.1", self.board["F"]["F1"]
-        assert self.ser_board["A"]["A1"] == "", self.ser_board["A"]["A1"]
-        assert self.ser_board["G"]["G9"] == 1.1, self.ser_board["G"]["G9"]
+        # Both games read the users before either of them is written
+        await self.instance.perform_update_user_statistics(self.user_1, self.user_2, 25, 10)
+        await self.instance.perform_update_user_statistics(self.user_1, self.user_2, 30, 10)
 
-        field_value = self.instance._shot(self.board, "F1", "miss")
-        assert field_value == " space 19.1", field_value
-        assert self.board["F"]["F1"] == "miss", self.board["F"]["F1"]
+        user_1 = await database_sync_to_async(user_models.User.objects.get)(id=1)
+        user_2 = await database_sync_to_async(user_models.User.objects.get)(id=2)
+        assert (user_1.rating, user_1.cash, user_1.game_count, user_1.win_count) == (
+            self.user_1.rating + 55, self.user_1.cash + 20, self.user_1.game_count + 2, self.user_1.win_count + 2
+        ), user_1
+        assert (user_2.rating, user_2.cash, user_2.game_count, user_2.win_count) == (
+            self.user_2.rating - 55, self.user_2.cash - 20, self.user_2.game_count + 2, self.user_2.win_count
+        ), user_2
+        assert redis_instance.zscore(leaderboard.RATINGS_KEY, 1) == user_1.rating
 
-        field_value = self.instance._shot(self.board, "A1", "miss")
-        assert field_value == "", field_value
-        assert self.board["A"]["A1"] == "miss", self.board["A"]["A1"]
 
-        field_value = self.instance._shot(self.board, "G9", "hit")
-        assert field_value == 1.1, field_value
-        assert self.board["G"]["G9"] == "hit", self.board["G"]["G9"]
+class TestTakeShotMixin(APITransactionTestCase):
+    """Testing the TakeShotMixin class methods"""
 
-    def test_is_ship_has_sunk(self):
-        """Testing the _is_ship_has_sunk method"""
+    fixtures = ["./src/game/consumers/test/test_data.json"]
 
-        is_ship_has_sunk = self.instance._is_ship_has_sunk(1.1, self.board)
-        assert is_ship_has_sunk == False, is_ship_has_sunk
+    def setUp(self) -> None:
+        super().setUp()
 
-        is_ship_has_sunk = self.instance._is_ship_has_sunk(4.1, self.board)
-        assert is_ship_has_sunk == True, is_ship_has_sunk
+        self.lobby = models.Lobby.objects.prefetch_related("users", "boards").get(id=1)
+        self.board_1, self.board_2 = self.lobby.boards.all()
+        self.user_2, self.user_1 = self.lobby.users.all()
 
-        self.board["G"]["G9"] = "hit"
+        self.lobby_slug = str(self.lobby.slug)
 
-        is_ship_has_sunk = self.instance._is_ship_has_sunk(1.1, self.board)
-        assert is_ship_has_sunk == True, is_ship_has_sunk
-    
-    def test_add_misses_around_sunken_ship(self):
-        """Testing the _add_misses_around_sunken_ship method"""
+        self.instance = mixins.TakeShotMixin()
 
-        test_data = {"F8": "miss", "F9": "miss", "F10": "miss", "G8": "miss", 
-                     "G10": "miss", "H8": "miss", "H9": "miss", "H10": "miss"}
+    def tearDown(self) -> None:
+        super().tearDown()
+        store.delete(self.lobby_slug)
+        redis_instance.delete(self.lobby_slug)
 
-        assert self.ser_board["G"]["G8"] == " space 1.1", self.board["G"]["G8"]
-        assert self.ser_board["F"]["F8"] == " space 1.1", self.ser_board["F"]["F8"]
-        assert self.ser_board["G"]["G9"] == 1.1, self.ser_board["G"]["G9"]
+    @staticmethod
+    def get_columns(board: models.Board) -> dict:
+        """Get a board in the column format"""
 
-        field_name_dict = self.instance._add_misses_around_sunken_ship(1.1, self.board)
-        assert field_name_dict == test_data, field_name_dict
-        assert self.ser_board["G"]["G8"] == "miss", self.board["G"]["G8"]
-        assert self.ser_board["F"]["F8"] == "miss", self.ser_board["F"]["F8"]
-        assert self.ser_board["G"]["G9"] == 1.1, self.ser_board["G"]["G9"]
+        return bitboard.CompactBoard.from_bytes(board.grid).to_columns()
 
-        field_name_dict = self.instance._add_misses_around_sunken_ship(4.1, self.board)
-        assert field_name_dict == {} 
-    
     async def test_take_shot(self):
         """Testing the take_shot method"""
 
         self.instance.column_name_list = column_name_list
         self.instance.user = self.user_1
-        assert self.board_1.A[1:29] == "'A1': '', 'A2': ' space 7.1'", self.board_1.A[1:29]
+        board_1 = self.get_columns(self.board_1)
+        assert (board_1["A"]["A1"], board_1["A"]["A2"]) == ("", " space 7.1"), board_1["A"]
 
         response = await self.instance.take_shot(self.lobby_slug, self.board_1.id, "A1")
         updated_board_1 = await database_sync_to_async(models.Board.objects.get)(id=1)
@@ -591,11 +571,14 @@ class TestTakeShotMixin(APITransactionTestCase):
         assert self.board_1.is_my_turn != updated_board_1.is_my_turn, updated_board_1.is_my_turn
         assert self.board_2.is_my_turn != updated_board_2.is_my_turn, updated_board_2.is_my_turn
         assert self.board_1.is_my_turn == updated_board_2.is_my_turn, updated_board_2.is_my_turn
-        assert updated_board_1.A[1:33] == "'A1': 'miss', 'A2': ' space 7.1'", updated_board_1.A[1:33]
-        assert updated_board_1.A[1:33] != self.board_1.A[1:33], updated_board_1.A[1:33]
+        turn_board_id = updated_board_1.id if updated_board_1.is_my_turn else updated_board_2.id
+        assert redis_instance.hget(self.lobby_slug, "turn_board_id") == str(turn_board_id)
+        columns = store.get_board(self.lobby_slug, self.board_1.id).to_columns()
+        assert (columns["A"]["A1"], columns["A"]["A2"]) == ("miss", " space 7.1"), columns["A"]
 
         self.instance.user = self.user_2
-        assert self.board_2.A[1:32] == "'A1': ' space 26.3', 'A2': 26.3", self.board_2.A[1:32]
+        board_2 = self.get_columns(self.board_2)
+        assert (board_2["A"]["A1"], board_2["A"]["A2"]) == (" space 26.3", 26.3), board_2["A"]
 
         response = await self.instance.take_shot(self.lobby_slug, self.board_2.id, "A1")
         updated_board_1 = await database_sync_to_async(models.Board.objects.get)(id=1)
@@ -604,11 +587,11 @@ class TestTakeShotMixin(APITransactionTestCase):
         assert self.board_1.is_my_turn == updated_board_1.is_my_turn, updated_board_1.is_my_turn
         assert self.board_2.is_my_turn == updated_board_2.is_my_turn, updated_board_2.is_my_turn
         assert self.board_1.is_my_turn != updated_board_2.is_my_turn, updated_board_2.is_my_turn
-        assert updated_board_2.A[1:25] == "'A1': 'miss', 'A2': 26.3", updated_board_2.A[1:25]
-        assert updated_board_2.A[1:25] != self.board_1.A[1:25], updated_board_2.A[1:25]
+        columns = store.get_board(self.lobby_slug, self.board_2.id).to_columns()
+        assert (columns["A"]["A1"], columns["A"]["A2"]) == ("miss", 26.3), columns["A"]
 
         self.instance.suer = self.user_2
-        assert self.board_1.C[1:50] == "'C1': 1.2, 'C2': ' space 1.2 space 7.1 space 7.3'", self.board_1.C[1:50]
+        assert (board_1["C"]["C1"], board_1["C"]["C2"]) == (1.2, " space 1.2 space 7.1 space 7.3"), board_1["C"]
 
         response = await self.instance.take_shot(self.lobby_slug, self.board_1.id, "C1")
         updated_board_1 = await database_sync_to_async(models.Board.objects.get)(id=1)
@@ -617,10 +600,10 @@ class TestTakeShotMixin(APITransactionTestCase):
         assert self.board_1.is_my_turn == updated_board_1.is_my_turn, updated_board_1.is_my_turn
         assert self.board_2.is_my_turn == updated_board_2.is_my_turn, updated_board_2.is_my_turn
         assert self.board_1.is_my_turn != updated_board_2.is_my_turn, updated_board_2.is_my_turn
-        assert updated_board_1.C[1:26] == "'C1': 'hit', 'C2': 'miss'", updated_board_1.C[1:26]
-        assert updated_board_1.C[1:26] != self.board_1.C[1:26], updated_board_1.C[1:26]
+        columns = store.get_board(self.lobby_slug, self.board_1.id).to_columns()
+        assert (columns["C"]["C1"], columns["C"]["C2"]) == ("hit", "miss"), columns["C"]
 
-        assert self.board_1.H[1:32] == "'H1': 'hit', 'H2': ' space 19.1", self.board_1.H[1:32]
+        assert (board_1["H"]["H1"], board_1["H"]["H2"]) == ("hit", " space 19.1"), board_1["H"]
 
         response = await self.instance.take_shot(self.lobby_slug, self.board_1.id, "G1")
         updated_board_1 = await database_sync_to_async(models.Board.objects.get)(id=1)
@@ -629,8 +612,28 @@ class TestTakeShotMixin(APITransactionTestCase):
         assert self.board_1.is_my_turn == updated_board_1.is_my_turn, updated_board_1.is_my_turn
         assert self.board_2.is_my_turn == updated_board_2.is_my_turn, updated_board_2.is_my_turn
         assert self.board_1.is_my_turn != updated_board_2.is_my_turn, updated_board_2.is_my_turn
-        assert updated_board_1.G[1:33] == "'G1': 'hit', 'G2': ' space 19.1'", updated_board_1.H[1:33]
-        assert updated_board_1.G[1:33] != self.board_1.G[1:33], updated_board_1.G[1:33]
+        columns = store.get_board(self.lobby_slug, self.board_1.id).to_columns()
+        assert (columns["G"]["G1"], columns["G"]["G2"]) == ("hit", " space 19.1"), columns["G"]
+
+    async def test_take_shot_out_of_turn(self):
+        """Testing that a hit out of turn is rejected before the board is touched"""
+
+        self.instance.user = self.user_2
+        board_2 = self.get_columns(self.board_2)
+        assert board_2["A"]["A2"] == 26.3, board_2["A"]
+
+        with self.assertLogs(level="WARNING"):
+            response = await self.instance.take_shot(self.lobby_slug, self.board_2.id, "A2")
+        assert response is None, response
+        assert store.get_board(self.lobby_slug, self.board_2.id) is None
+
+        # A shot during another shot of the lobby is rejected too
+        self.instance.user = self.user_1
+        token, _ = await turns.lock_shot(self.lobby_slug)
+        with self.assertLogs(level="WARNING"):
+            response = await self.instance.take_shot(self.lobby_slug, self.board_1.id, "A1")
+        await turns.unlock_shot(self.lobby_slug, token)
+        assert response is None, response
 
 
 class TestRandomPlacementMixin(APITestCase):
@@ -649,87 +652,20 @@ class TestRandomPlacementMixin(APITestCase):
         self.board = {key: value for key, value in self.ser_board.items() if key in column_name_list}
 
         self.instance = mixins.RandomPlacementMixin()
-        self.instance.column_name_list = column_name_list
-        self.instance.string_number_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         self.instance.ship_count_dict = ship_count_dict
-
-    def test_is_put_on_board(self):
-        """Testing the _is_put_on_board method"""
-
-        is_put = self.instance._is_put_on_board(["A1", "A2", "A3"], self.board)
-        assert is_put == False
-
-        is_put = self.instance._is_put_on_board(["G3", "G4", "G5"], self.board)
-        assert is_put == True
-
-        is_put = self.instance._is_put_on_board(["A1"], self.board)
-        assert is_put == True
-
-        is_put = self.instance._is_put_on_board(["A3"], self.board)
-        assert is_put == False
-
-    def test_put_ship_on_board(self):
-        """Testing the _put_ship_on_board method"""
-
-        test_data = (self.board["F"]["F6"], self.board["G"]["G6"], self.board["H"]["H6"])
-        assert test_data == ("", "", ""), test_data
-
-        self.instance._put_ship_on_board(3, 1, ["F6", "G6", "H6"], self.board)
-        test_data = (self.board["F"]["F6"], self.board["G"]["G6"], self.board["H"]["H6"])
-        assert test_data == (3.1, 3.1, 3.1), test_data
-
-        self.instance._put_ship_on_board(1, 4, ["G3", "G4", "G5"], self.board)
-        test_data = (self.board["G"]["G3"], self.board["G"]["G4"], self.board["G"]["G5"])
-        assert test_data == (1.4, 1.4, 1.4), test_data
-    
-    def test_get_field_list_horizontally(self):
-        """Testing the get_field_list_horizontally method"""
-
-        field_list = self.instance.get_field_list_horizontally(3, "A", 3, column_name_list)
-        assert field_list == ["A3", "B3", "C3"]
-
-        field_list = self.instance.get_field_list_horizontally(3, "J", 3, column_name_list)
-        assert field_list == ["J3", "I3", "H3"]
-
-        field_list = self.instance.get_field_list_horizontally(3, "I", 3, column_name_list)
-        assert field_list == ["I3", "H3", "G3"]
-    
-    def test_get_field_list_vertically(self):
-        """Testing the get_field_list_vertically method"""
-
-        field_list = self.instance.get_field_list_vertically(1, "A", 3)
-        assert field_list == ["A1", "A2", "A3"]
-
-        field_list = self.instance.get_field_list_vertically(10, "A", 3)
-        assert field_list == ["A10", "A9", "A8"]
-
-        field_list = self.instance.get_field_list_vertically(9, "E", 3)
-        assert field_list == ["E9", "E8", "E7"]
-    
-    async def test_get_field_list(self):
-        """Testing the get_field_list method"""
-
-        old_board = deepcopy(self.board)
-
-        with self.assertLogs():
-            new_board = await self.instance.get_field_list("horizontal", 4, self.board, self.ships)
-        assert type(new_board) == dict
-        assert new_board == self.board
-        assert new_board != old_board
     
     async def test_random_placement(self):
         """Testing the random_placement method"""
 
         old_board = deepcopy(self.board)
 
-        with self.assertLogs():
-            new_board = await self.instance.get_field_list("horizontal", 4, self.board, self.ships)
+        new_board = await self.instance.random_placement(self.board, self.ships)
         assert type(new_board) == dict
         assert new_board == self.board
         assert new_board != old_board
 
-        is_full = sum(1 for column_name in column_name_list if new_board[column_name][f"{column_name}1"])
-        assert is_full > 0
+        placed_board = bitboard.CompactBoard.from_columns(new_board)
+        assert placed_board.count_living_ships() == 10, placed_board.labels
 
 
 class TestChooseWhoWillShotFirstMixin(APITransactionTestCase):
@@ -755,14 +691,9 @@ class TestChooseWhoWillShotFirstMixin(APITransactionTestCase):
         self.instance = mixins.ChooseWhoWillShotFirstMixin()
         self.instance.user = self.user_1
 
-    async def test_is_turn_determined(self):
-        """Testing the is_turn_determined method"""
-
-        is_turn_determined = await self.instance.is_turn_determined(self.board_1, self.board_2)
-        assert is_turn_determined == True, is_turn_determined
-
-        is_turn_determined = await self.instance.is_turn_determined(self.board_3, self.board_4)
-        assert is_turn_determined == False, is_turn_determined
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(self.lobby_1_slug, self.lobby_2_slug)
 
     async def test_choose_first_shooter(self):
         """Testing the choose_first_shooter method"""
@@ -772,3 +703,63 @@ class TestChooseWhoWillShotFirstMixin(APITransactionTestCase):
 
         response = await self.instance.choose_first_shooter(self.lobby_2_slug)
         assert type(response) == bool, response
+
+        response = await self.instance.choose_first_shooter(self.lobby_2_slug)
+        assert response is None, response
+
+
+class TestLobbyBoardsMixin(APITransactionTestCase):
+    """Testing the LobbyBoardsMixin class methods"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.user_1 = user_models.User.objects.get(id=1)
+        self.user_2 = user_models.User.objects.get(id=2)
+        self.lobby_1_slug = str(models.Lobby.objects.get(id=1).slug)
+
+        self.instance = mixins.LobbyBoardsMixin()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(self.lobby_1_slug)
+
+    async def get_turns(self) -> list:
+        return await database_sync_to_async(
+            lambda: list(models.Board.objects.filter(id__in=(1, 2)).values_list("is_my_turn", flat=True))
+        )()
+
+    async def test_get_lobby_board_ids(self):
+        """Testing the get_lobby_board_ids method"""
+
+        board_ids = await self.instance.get_lobby_board_ids(self.lobby_1_slug, self.user_1)
+        assert board_ids == (1, 2), board_ids
+        assert self.instance.lobby_board_ids == {(self.lobby_1_slug, 1): (1, 2)}, self.instance.lobby_board_ids
+
+        board_ids = await mixins.LobbyBoardsMixin().get_lobby_board_ids(self.lobby_1_slug, self.user_2)
+        assert board_ids == (2, 1), board_ids
+
+    async def test_hand_over_turn(self):
+        """Testing the hand_over_turn method"""
+
+        assert await self.get_turns() == [False, True]
+
+        is_handed_over = await self.instance.hand_over_turn(self.lobby_1_slug, self.user_1, True)
+        assert is_handed_over == True, is_handed_over
+        assert await self.get_turns() == [True, False]
+        assert redis_instance.hget(self.lobby_1_slug, "turn_board_id") == "1"
+
+        is_handed_over = await self.instance.hand_over_turn(self.lobby_1_slug, self.user_1, False)
+        assert is_handed_over == True, is_handed_over
+        assert await self.get_turns() == [False, True]
+
+        # A stale second hand over doesn't give the turn back
+        is_handed_over = await self.instance.hand_over_turn(self.lobby_1_slug, self.user_1, False)
+        assert is_handed_over == False, is_handed_over
+        assert await self.get_turns() == [False, True]
+        assert redis_instance.hget(self.lobby_1_slug, "turn_board_id") == "2"
+
+        is_handed_over = await self.instance.hand_over_turn(self.lobby_1_slug, self.user_2, True, is_first_turn=True)
+        assert is_handed_over == False, is_handed_over
+        assert await self.get_turns() == [False, True]
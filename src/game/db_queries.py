@@ -1,3 +1,7 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
 from . import models
 
 
@@ -23,4 +27,82 @@ def create_ships_for_boards(first_board_id: int, second_board_id: int) -> None:
         models.Ship(name="doubledeck", size=2, count=3, board_id_id=second_board_id),
         models.Ship(name="tripledeck", size=3, count=2, board_id_id=second_board_id),
         models.Ship(name="fourdeck", size=4, count=1, board_id_id=second_board_id),
-    ])
\ No newline at end of file
+    ])
+
+
+def get_lobby_grids(lobby_slug: str) -> dict[int, bytes]:
+    """Get packed boards of a lobby"""
+
+    query = models.Board.objects.filter(lobby_id__slug=lobby_slug).values_list("id", "grid")
+    return {board_id: bytes(grid) for board_id, grid in query}
+
+
+def update_board_grids(grids: dict[int, bytes]) -> None:
+    """Write packed boards in one query"""
+
+    models.Board.objects.bulk_update([models.Board(id=board_id, grid=grid) for board_id, grid in grids.items()], ["grid"])
+
+
+def get_open_lobbies() -> QuerySet:
+    """Get lobbies that wait for a second player"""
+
+    return models.Lobby.objects.filter(is_open=True, is_play_with_a_bot__isnull=True).prefetch_related("users")
+
+
+def add_users_to_lobby(lobby_id: int, users) -> bool:
+    """
+    Add users to a lobby and count them in one transaction, users that are already in the lobby aren't counted.
+    The count is raised by a conditional update, so concurrent joins can't put more than two players to a lobby.
+    Return False if the lobby has no room for the users.
+    """
+
+    with transaction.atomic():
+        user_ids = set(models.Lobby.users.through.objects.filter(lobby_id=lobby_id).values_list("user_id", flat=True))
+        new_users = [user for user in users if user.id not in user_ids]
+
+        if not new_users:
+            return True
+
+        count = models.Lobby.objects.filter(id=lobby_id, player_count__lte=2 - len(new_users)).update(
+            player_count=F("player_count") + len(new_users), is_open=Q(player_count=1 - len(new_users))
+        )
+
+        if count:
+            models.Lobby(id=lobby_id).users.add(*new_users)
+
+    return bool(count)
+
+
+def remove_user_from_lobbies(user_id: int) -> list[int]:
+    """
+    Remove a user from all lobbies and uncount them in one transaction, a lobby that is left with one player opens again
+    unless its game has finished. Return ids of the lobbies.
+    """
+
+    memberships = models.Lobby.users.through.objects.filter(user_id=user_id)
+
+    with transaction.atomic():
+        lobby_ids = list(memberships.values_list("lobby_id", flat=True))
+        memberships.delete()
+        models.Lobby.objects.filter(id__in=lobby_ids, player_count__gt=0).update(
+            player_count=F("player_count") - 1, is_open=Q(player_count=2, finished_in__isnull=True)
+        )
+
+    return lobby_ids
+
+
+def count_players_of_lobbies() -> int:
+    """
+    Set player_count and is_open of all lobbies from their users, lobbies of finished games stay closed.
+    Return the number of lobbies.
+    """
+
+    user_count = models.Lobby.users.through.objects.filter(lobby_id=OuterRef("id")).values("lobby_id").annotate(
+        count=Count("id")
+    ).values("count")
+
+    with transaction.atomic():
+        count = models.Lobby.objects.update(player_count=Coalesce(Subquery(user_count), 0))
+        models.Lobby.objects.update(is_open=Q(player_count=1, finished_in__isnull=True))
+
+    return count
@@ -0,0 +1,326 @@
+import struct
+
+
+COLUMN_NAMES = ("A", "B", "C", "D", "E", "F", "G", "H", "I", "J")
+BOARD_SIZE = 10
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+PLANE_LENGTH = 13  # number of bytes that hold a 100-bit plane
+
+FIELD_NAMES = tuple(f"{column}{row}" for column in COLUMN_NAMES for row in range(1, BOARD_SIZE + 1))
+FIELD_INDEXES = {field_name: index for index, field_name in enumerate(FIELD_NAMES)}
+
+
+def _get_neighbours(index: int) -> int:
+    """Calculate a plane of fields around a field (diagonals included)"""
+
+    column, row = divmod(index, BOARD_SIZE)
+    mask = 0
+
+    for _column in range(max(column - 1, 0), min(column + 2, BOARD_SIZE)):
+        for _row in range(max(row - 1, 0), min(row + 2, BOARD_SIZE)):
+            mask |= 1 << (_column * BOARD_SIZE + _row)
+
+    return mask & ~(1 << index)
+
+
+NEIGHBOURS = tuple(_get_neighbours(index) for index in range(CELL_COUNT))
+
+_header = struct.Struct(">B")
+_slot = struct.Struct(f">IB{PLANE_LENGTH}s")
+_planes = struct.Struct(f">{PLANE_LENGTH}s{PLANE_LENGTH}s")
+
+
+def field_index(field_name: str) -> int:
+    """Get an index of a field (column-major: A1 - 0, A2 - 1, ..., J10 - 99)"""
+
+    return FIELD_INDEXES[field_name]
+
+
+def field_name(index: int) -> str:
+    """Get a field name by its index"""
+
+    return FIELD_NAMES[index]
+
+
+def iter_indexes(mask: int):
+    """Iterate over indexes of the set bits of a plane"""
+
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+def neighbours(index: int) -> int:
+    """Get a plane of fields around a field (diagonals included)"""
+
+    return NEIGHBOURS[index]
+
+
+def get_mask(field_name_list) -> int:
+    """Get a plane of fields by their names"""
+
+    mask = 0
+    for _field_name in field_name_list:
+        mask |= 1 << FIELD_INDEXES[_field_name]
+    return mask
+
+
+def get_halo(mask: int) -> int:
+    """Get a plane of fields around a ship (the space where other ships can't stand)"""
+
+    halo = 0
+    for index in iter_indexes(mask):
+        halo |= NEIGHBOURS[index]
+    return halo & ~mask
+
+
+def ship_label(ship_id: int, ship_number: int) -> float:
+    """Get a ship value as the client knows it: <ship_id>.<serial number of a ship of this type>"""
+
+    return float(f"{ship_id}.{ship_number}")
+
+
+def parse_ship_label(value: float) -> tuple[int, int]:
+    """Split a ship value into ship_id and a serial number of a ship of this type"""
+
+    ship_id, ship_number = str(value).split(".")
+    return int(ship_id), int(ship_number)
+
+
+class CompactBoard:
+    """
+    Game board packed into bit planes.
+    Each ship is a 100-bit mask of the fields it stands on, shots are kept in the hit and miss planes.
+    The space around ships isn't stored, it is looked up in the neighbour table once per ship.
+    Decks left to every ship and the number of living ships are counted once on loading
+    and then updated by each hit.
+    """
+
+    __slots__ = ("labels", "ships", "hits", "misses", "halos", "decks", "living_ships")
+
+    def __init__(self, labels: list | None = None, ships: list | None = None, hits: int = 0, misses: int = 0) -> None:
+        self.labels: list[tuple[int, int]] = labels if labels is not None else []
+        self.ships: list[int] = ships if ships is not None else []
+        self.hits: int = hits
+        self.misses: int = misses
+        self.halos: list[int] = [get_halo(mask) for mask in self.ships]
+        self.decks: list[int] = [(mask & ~hits).bit_count() for mask in self.ships]
+        self.living_ships: int = sum(1 for deck_count in self.decks if deck_count)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactBoard):
+            return NotImplemented
+        return (self.labels, self.ships, self.hits, self.misses) == (other.labels, other.ships,
+                                                                     other.hits, other.misses)
+
+    def __repr__(self) -> str:
+        return f"CompactBoard(ships={len(self.ships)}, hits={self.hits.bit_count()}, misses={self.misses.bit_count()})"
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview | None) -> "CompactBoard":
+        """Load a board from the Board.grid column"""
+
+        if not data:
+            return cls()
+
+        data = bytes(data)
+        (slot_count,) = _header.unpack_from(data, 0)
+        offset = _header.size
+        labels, ships = [], []
+
+        for _ in range(slot_count):
+            ship_id, ship_number, mask = _slot.unpack_from(data, offset)
+            labels.append((ship_id, ship_number))
+            ships.append(int.from_bytes(mask, "big"))
+            offset += _slot.size
+
+        hits, misses = _planes.unpack_from(data, offset)
+        return cls(labels, ships, int.from_bytes(hits, "big"), int.from_bytes(misses, "big"))
+
+    def to_bytes(self) -> bytes:
+        """Dump a board to store in the Board.grid column"""
+
+        chunks = [_header.pack(len(self.ships))]
+
+        for (ship_id, ship_number), mask in zip(self.labels, self.ships):
+            chunks.append(_slot.pack(ship_id, ship_number, mask.to_bytes(PLANE_LENGTH, "big")))
+
+        chunks.append(_planes.pack(self.hits.to_bytes(PLANE_LENGTH, "big"), self.misses.to_bytes(PLANE_LENGTH, "big")))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "CompactBoard":
+        """
+        Create a board from the column format used by clients: {"A": {"A1": <value>, ...}, ...}.
+        A hit field is assigned to the ship whose fields it touches, the space values are skipped.
+        """
+
+        ship_fields, hit_fields, misses = {}, [], 0
+
+        for index, _field_name in enumerate(FIELD_NAMES):
+            value = columns[_field_name[0]][_field_name]
+
+            if type(value) == float:
+                ship_fields.setdefault(parse_ship_label(value), []).append(index)
+            elif value == "hit":
+                hit_fields.append(index)
+            elif value == "miss":
+                misses |= 1 << index
+
+        board = cls(misses=misses)
+
+        for label in sorted(ship_fields):
+            board.place_ship(*label, (FIELD_NAMES[index] for index in ship_fields[label]))
+
+        for index in hit_fields:
+            slot = board._find_hit_ship(index, hit_fields)
+            if slot is not None:
+                board.ships[slot] |= 1 << index
+                board.halos[slot] = get_halo(board.ships[slot])
+            board.hits |= 1 << index
+
+        return board
+
+    def _find_hit_ship(self, index: int, hit_fields: list) -> int | None:
+        """Find a ship to which a hit field belongs, walking along the hit fields in a line"""
+
+        column, row = divmod(index, BOARD_SIZE)
+
+        for step_column, step_row in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            _column, _row = column + step_column, row + step_row
+
+            while 0 <= _column < BOARD_SIZE and 0 <= _row < BOARD_SIZE:
+                _index = _column * BOARD_SIZE + _row
+                slot = self.slot_at(_index)
+
+                if slot is not None:
+                    return slot
+                if _index not in hit_fields:
+                    break
+
+                _column, _row = _column + step_column, _row + step_row
+
+    def to_columns(self) -> dict:
+        """Get a board in the column format used by clients"""
+
+        slots = [None] * CELL_COUNT
+        spaces = [""] * CELL_COUNT
+
+        for slot in sorted(range(len(self.ships)), key=self.labels.__getitem__):
+            for index in iter_indexes(self.ships[slot]):
+                slots[index] = slot
+            space_name = f" space {self.labels[slot][0]}.{self.labels[slot][1]}"
+            for index in iter_indexes(self.halos[slot]):
+                spaces[index] += space_name
+
+        columns = {column_name: {} for column_name in COLUMN_NAMES}
+
+        for index, _field_name in enumerate(FIELD_NAMES):
+            bit = 1 << index
+
+            if self.hits & bit:
+                value = "hit"
+            elif self.misses & bit:
+                value = "miss"
+            elif slots[index] is not None:
+                value = ship_label(*self.labels[slots[index]])
+            else:
+                value = spaces[index]
+
+            columns[_field_name[0]][_field_name] = value
+
+        return columns
+
+    @property
+    def ship_mask(self) -> int:
+        """A plane of all fields occupied by ships"""
+
+        mask = 0
+        for ship in self.ships:
+            mask |= ship
+        return mask
+
+    def clear(self) -> None:
+        """Remove all ships and shots from a board"""
+
+        self.labels, self.ships, self.hits, self.misses = [], [], 0, 0
+        self.halos, self.decks, self.living_ships = [], [], 0
+
+    def place_ship(self, ship_id: int, ship_number: int, field_name_list) -> int:
+        """Put a ship on a board and return its slot"""
+
+        return self.place_ship_mask(ship_id, ship_number, get_mask(field_name_list))
+
+    def place_ship_mask(self, ship_id: int, ship_number: int, mask: int) -> int:
+        """Put a ship given by a plane of its fields on a board and return its slot"""
+
+        deck_count = (mask & ~self.hits).bit_count()
+
+        self.labels.append((ship_id, ship_number))
+        self.ships.append(mask)
+        self.halos.append(get_halo(mask))
+        self.decks.append(deck_count)
+        self.living_ships += 1 if deck_count else 0
+        return len(self.ships) - 1
+
+    def slot_at(self, index: int) -> int | None:
+        """Get a slot of a ship standing on a field"""
+
+        bit = 1 << index
+        for slot, mask in enumerate(self.ships):
+            if mask & bit:
+                return slot
+
+    def label(self, slot: int) -> float:
+        """Get a ship value by its slot"""
+
+        return ship_label(*self.labels[slot])
+
+    def space(self, slot: int) -> int:
+        """Get a plane of fields around a ship"""
+
+        return self.halos[slot]
+
+    def shoot(self, field_name: str) -> tuple[str, int | None]:
+        """Take a shot at a field. Return a shot type and a slot of the hit ship"""
+
+        index = FIELD_INDEXES[field_name]
+        bit = 1 << index
+        slot = self.slot_at(index)
+
+        if slot is not None and not self.hits & bit:
+            self.hits |= bit
+            self.decks[slot] -= 1
+            if not self.decks[slot]:
+                self.living_ships -= 1
+            return "hit", slot
+
+        if not self.hits & bit:
+            self.misses |= bit
+        return "miss", None
+
+    def is_sunk(self, slot: int) -> bool:
+        """Check if a ship has sunk"""
+
+        return not self.decks[slot]
+
+    def reveal_space(self, slot: int) -> dict:
+        """Add misses around a sunken ship and return them as {<field name>: "miss"}"""
+
+        space = self.halos[slot] & ~self.ship_mask & ~self.misses & ~self.hits
+        self.misses |= space
+        return {FIELD_NAMES[index]: "miss" for index in iter_indexes(space)}
+
+    def count_living_ships(self) -> int:
+        """Get a number of ships that have at least one field that wasn't hit"""
+
+        return self.living_ships
+
+    def get_living_ship_dict(self) -> dict:
+        """
+        Get living ships in the following format:
+            {<ship_id>.<serial number of a ship of this type>: <number of fields that weren't hit>}.
+        """
+
+        return {self.label(slot): deck_count for slot, deck_count in enumerate(self.decks) if deck_count}
@@ -0,0 +1,70 @@
+import random
+import logging
+
+from config import settings
+from config.utilities import redis_instance, async_redis_instance
+from . import bitboard, placement
+
+
+def get_key(ship_sizes: tuple) -> str:
+    """Get a redis key of a pool of layouts for a fleet of the given ship sizes"""
+
+    return f"layout_pool:{'.'.join(str(ship_size) for ship_size in ship_sizes)}"
+
+
+def get_refill_key(ship_sizes: tuple) -> str:
+    """Get a redis key that is set while a pool is being refilled"""
+
+    return f"{get_key(ship_sizes)}:refill"
+
+
+def encode(position_indexes: list) -> str:
+    """Pack a layout into a string: a byte per ship with an index of its position"""
+
+    return bytes(position_indexes).hex()
+
+
+def decode(layout: str) -> list:
+    """Unpack a layout"""
+
+    return list(bytes.fromhex(layout))
+
+
+def fill(ship_sizes: tuple, size: int | None = None) -> int:
+    """Top a pool up to the given size with new layouts. Return the number of added layouts"""
+
+    size = size or settings.LAYOUT_POOL_SETTINGS["SIZE"]
+    key = get_key(ship_sizes)
+    count = max(size - redis_instance.llen(key), 0)
+    rng = random.Random()
+
+    for start in range(0, count, 1000):
+        layouts = [encode(placement.draw_positions(ship_sizes, rng)) for _ in range(min(1000, count - start))]
+        redis_instance.rpush(key, *layouts)
+
+    redis_instance.delete(get_refill_key(ship_sizes))
+    logging.info(msg=f"Layout pool {key}: {count} layouts were added.")
+    return count
+
+
+async def pop(fleet: list) -> tuple[bitboard.CompactBoard, bool]:
+    """
+    Get a board with a fleet placed by a layout from a pool.
+    The layout is drawn on the spot if the pool is empty.
+    Return the board and True if the pool went below the watermark and a caller has to start its refill.
+    """
+
+    ship_sizes = placement.get_ship_sizes(fleet)
+    key = get_key(ship_sizes)
+
+    pipeline = async_redis_instance.pipeline()
+    pipeline.lpop(key)
+    pipeline.llen(key)
+    layout, pool_size = await pipeline.execute()
+
+    is_refill_needed = pool_size < settings.LAYOUT_POOL_SETTINGS["WATERMARK"] and bool(
+        await async_redis_instance.set(get_refill_key(ship_sizes), 1, nx=True, ex=settings.LAYOUT_POOL_SETTINGS["REFILL_TIMEOUT"])
+    )
+
+    position_indexes = decode(layout) if layout is not None else placement.draw_positions(ship_sizes)
+    return placement.build_board(fleet, position_indexes), is_refill_needed
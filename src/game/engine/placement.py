@@ -0,0 +1,100 @@
+import random
+
+from . import bitboard
+
+
+def _get_positions(ship_size: int) -> tuple:
+    """
+    Calculate all positions of a ship of the given size on an empty board.
+    Return a tuple of (<plane of the ship fields>, <plane of the ship fields and the space around it>).
+    """
+
+    positions = []
+
+    for column in range(bitboard.BOARD_SIZE):
+        for row in range(bitboard.BOARD_SIZE):
+            if row + ship_size <= bitboard.BOARD_SIZE:
+                positions.append(sum(1 << (column * bitboard.BOARD_SIZE + row + deck) for deck in range(ship_size)))
+
+            if ship_size > 1 and column + ship_size <= bitboard.BOARD_SIZE:
+                positions.append(sum(1 << ((column + deck) * bitboard.BOARD_SIZE + row) for deck in range(ship_size)))
+
+    return tuple((mask, mask | bitboard.get_halo(mask)) for mask in positions)
+
+
+POSITIONS = {ship_size: _get_positions(ship_size) for ship_size in range(1, bitboard.BOARD_SIZE + 1)}
+
+
+def get_fleet(ships: list, ship_count_dict: dict) -> list:
+    """
+    Get a fleet to place from serialized ships.
+    Return a list of (<ship_id>, <serial number of a ship of this type>, <ship size>), the biggest ships go first.
+    """
+
+    fleet = [
+        (ship["id"], ship_number, ship["size"])
+        for ship in ships for ship_number in range(1, ship_count_dict[ship["name"]] + 1)
+    ]
+    return sorted(fleet, key=lambda ship: ship[2], reverse=True)
+
+
+def get_ship_sizes(fleet: list) -> tuple:
+    """Get sizes of fleet ships in the order of placement"""
+
+    return tuple(ship_size for _, _, ship_size in fleet)
+
+
+def draw_positions(ship_sizes: tuple, rng: random.Random = random) -> list:
+    """
+    Draw positions for ships of the given sizes. Return indexes of the positions in POSITIONS[<ship size>].
+    A ship is drawn only from the positions that don't touch the ships placed before it, so a classic fleet
+    is placed in a single pass. When a ship has no free position left the previous ship is moved to its next
+    candidate position, so the search always ends.
+    """
+
+    candidate_stack, chosen_positions, occupied_stack = [], [], [0]
+
+    while len(chosen_positions) < len(ship_sizes):
+        level = len(chosen_positions)
+        positions = POSITIONS[ship_sizes[level]]
+
+        if len(candidate_stack) == level:
+            occupied = occupied_stack[level]
+            candidate_stack.append([index for index, (mask, _) in enumerate(positions) if not mask & occupied])
+
+        candidates = candidate_stack[level]
+
+        if candidates:
+            # Draw without replacement: the drawn position is swapped with the last one and popped
+            index = rng.randrange(len(candidates))
+            candidates[index], candidates[-1] = candidates[-1], candidates[index]
+            position_index = candidates.pop()
+            chosen_positions.append(position_index)
+            occupied_stack.append(occupied_stack[level] | positions[position_index][1])
+            continue
+
+        if not level:
+            raise ValueError("The fleet doesn't fit on the board")
+
+        candidate_stack.pop()
+        chosen_positions.pop()
+        occupied_stack.pop()
+
+    return chosen_positions
+
+
+def build_board(fleet: list, position_indexes: list) -> bitboard.CompactBoard:
+    """Put fleet ships on an empty board at the drawn positions"""
+
+    board = bitboard.CompactBoard()
+
+    for (ship_id, ship_number, ship_size), position_index in zip(fleet, position_indexes):
+        board.place_ship_mask(ship_id, ship_number, POSITIONS[ship_size][position_index][0])
+
+    return board
+
+
+def place_fleet(fleet: list, rng: random.Random = random) -> bitboard.CompactBoard:
+    """Place a fleet on an empty board"""
+
+    return build_board(fleet, draw_positions(get_ship_sizes(fleet), rng))
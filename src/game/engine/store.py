@@ -0,0 +1,128 @@
+import uuid
+import logging
+
+from config import settings
+from config.utilities import redis_instance, async_redis_instance
+from . import bitboard
+from .. import db_queries
+
+
+DIRTY_LOBBIES_KEY = "game_state:dirty"
+
+
+def get_key(lobby_slug: uuid.uuid4) -> str:
+    """Get a redis key of a lobby game state"""
+
+    return f"game_state:{lobby_slug}"
+
+
+def _load_board(grid: str | None) -> bitboard.CompactBoard | None:
+    """Unpack a board stored in a game state"""
+
+    return bitboard.CompactBoard.from_bytes(bytes.fromhex(grid)) if grid is not None else None
+
+
+def _queue_set_boards(pipeline, lobby_slug: uuid.uuid4, boards: dict, is_dirty: bool):
+    """Add commands that put boards to a lobby game state to a sync or async pipeline"""
+
+    key = get_key(lobby_slug)
+    pipeline.hset(key, mapping={board_id: board.to_bytes().hex() for board_id, board in boards.items()})
+    pipeline.expire(key, settings.GAME_STATE_SETTINGS["EXPIRY"])
+
+    if is_dirty:
+        pipeline.sadd(DIRTY_LOBBIES_KEY, str(lobby_slug))
+
+    return pipeline
+
+
+def _queue_delete(pipeline, lobby_slug: uuid.uuid4):
+    """Add commands that remove a lobby game state to a sync or async pipeline"""
+
+    pipeline.delete(get_key(lobby_slug))
+    pipeline.srem(DIRTY_LOBBIES_KEY, str(lobby_slug))
+    return pipeline
+
+
+def get_board(lobby_slug: uuid.uuid4, board_id: int) -> bitboard.CompactBoard | None:
+    """Get a board from a lobby game state, None if the board isn't loaded"""
+
+    return _load_board(redis_instance.hget(get_key(lobby_slug), board_id))
+
+
+async def aget_board(lobby_slug: uuid.uuid4, board_id: int) -> bitboard.CompactBoard | None:
+    """Async version of get_board"""
+
+    return _load_board(await async_redis_instance.hget(get_key(lobby_slug), board_id))
+
+
+def get_boards(lobby_slug: uuid.uuid4) -> dict[int, bitboard.CompactBoard]:
+    """Get all loaded boards of a lobby game state"""
+
+    grids = redis_instance.hgetall(get_key(lobby_slug))
+    return {int(board_id): _load_board(grid) for board_id, grid in grids.items()}
+
+
+def set_boards(lobby_slug: uuid.uuid4, boards: dict, is_dirty: bool = True) -> None:
+    """
+    Put boards to a lobby game state.
+    Dirty boards will be written to the database by the next flush.
+    """
+
+    _queue_set_boards(redis_instance.pipeline(), lobby_slug, boards, is_dirty).execute()
+
+
+async def aset_boards(lobby_slug: uuid.uuid4, boards: dict, is_dirty: bool = True) -> None:
+    """Async version of set_boards"""
+
+    await _queue_set_boards(async_redis_instance.pipeline(), lobby_slug, boards, is_dirty).execute()
+
+
+def set_board(lobby_slug: uuid.uuid4, board_id: int, board: bitboard.CompactBoard, is_dirty: bool = True) -> None:
+    """Put a board to a lobby game state"""
+
+    set_boards(lobby_slug, {board_id: board}, is_dirty)
+
+
+async def aset_board(
+        lobby_slug: uuid.uuid4, board_id: int, board: bitboard.CompactBoard, is_dirty: bool = True
+    ) -> None:
+    """Async version of set_board"""
+
+    await aset_boards(lobby_slug, {board_id: board}, is_dirty)
+
+
+def delete(lobby_slug: uuid.uuid4) -> None:
+    """Remove a lobby game state"""
+
+    _queue_delete(redis_instance.pipeline(), lobby_slug).execute()
+
+
+async def adelete(lobby_slug: uuid.uuid4) -> None:
+    """Async version of delete"""
+
+    await _queue_delete(async_redis_instance.pipeline(), lobby_slug).execute()
+
+
+def flush(lobby_slug: uuid.uuid4) -> int:
+    """Write boards of a lobby game state to the database. Return the number of written boards"""
+
+    # The lobby is unmarked before reading, so shots taken during the flush will mark it again
+    redis_instance.srem(DIRTY_LOBBIES_KEY, str(lobby_slug))
+    boards = get_boards(lobby_slug)
+
+    if boards:
+        db_queries.update_board_grids({board_id: board.to_bytes() for board_id, board in boards.items()})
+
+    return len(boards)
+
+
+def flush_all() -> int:
+    """Write all dirty lobby game states to the database. Return the number of written boards"""
+
+    count = 0
+
+    for lobby_slug in redis_instance.smembers(DIRTY_LOBBIES_KEY):
+        count += flush(lobby_slug)
+
+    logging.info(msg=f"Game state: {count} boards were written to the database.")
+    return count
@@ -0,0 +1,71 @@
+import random
+
+from collections import Counter
+
+from . import bitboard, placement
+
+
+# Indexes of the fields of every position, a heat map is counted by them without walking the bits of masks
+POSITION_CELLS = {
+    ship_size: tuple(tuple(bitboard.iter_indexes(mask)) for mask, _ in positions)
+    for ship_size, positions in placement.POSITIONS.items()
+}
+
+
+def get_visible_state(board: bitboard.CompactBoard) -> tuple[int, int, Counter]:
+    """
+    Get what a shooter knows about a board.
+    Return a plane of fields where no ship can stand, a plane of hits on living ships
+    and a counter of sizes of living ships.
+    """
+
+    blocked, wounded, ship_sizes = board.misses, 0, Counter()
+
+    for slot, mask in enumerate(board.ships):
+        if board.is_sunk(slot):
+            blocked |= mask | board.halos[slot]
+        else:
+            wounded |= mask & board.hits
+            ship_sizes[mask.bit_count()] += 1
+
+    return blocked, wounded, ship_sizes
+
+
+def get_heat_map(board: bitboard.CompactBoard) -> list[int]:
+    """
+    Count for every field how many legal positions of living ships cover it.
+    While a ship is wounded only the positions that cover its hits are counted.
+    """
+
+    blocked, wounded, ship_sizes = get_visible_state(board)
+    heat_map = [0] * bitboard.CELL_COUNT
+
+    for ship_size, ship_count in ship_sizes.items():
+        for (mask, area), cells in zip(placement.POSITIONS[ship_size], POSITION_CELLS[ship_size]):
+            # A position can't cover a blocked field or touch a hit of another ship
+            if mask & blocked or (area & ~mask) & wounded:
+                continue
+            if wounded and not mask & wounded:
+                continue
+
+            for index in cells:
+                heat_map[index] += ship_count
+
+    return heat_map
+
+
+def select_field(board: bitboard.CompactBoard, rng: random.Random = random) -> str | None:
+    """Get a field that is covered by the most positions of living ships, ties are broken at random"""
+
+    heat_map = get_heat_map(board)
+    shot_fields = board.hits | board.misses
+    best_indexes, best_count = [], 0
+
+    for index, count in enumerate(heat_map):
+        if count < best_count or not count or shot_fields >> index & 1:
+            continue
+        if count > best_count:
+            best_indexes, best_count = [], count
+        best_indexes.append(index)
+
+    return bitboard.field_name(rng.choice(best_indexes)) if best_indexes else None
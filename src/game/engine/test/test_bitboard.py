@@ -0,0 +1,138 @@
+import pytest
+
+from copy import deepcopy
+
+from src.game.engine import bitboard
+from src.game.consumers.test.test_data import board
+
+
+@pytest.fixture
+def compact_board():
+    return bitboard.CompactBoard.from_columns(deepcopy(board))
+
+
+class TestFieldIndex:
+    """Testing the field_index and field_name functions"""
+
+    @pytest.mark.parametrize("test_input, output", [("A1", 0), ("A10", 9), ("B1", 10), ("J10", 99)])
+    def test_field_index(self, test_input: str, output: int):
+        """Testing the field_index function"""
+
+        assert bitboard.field_index(test_input) == output
+        assert bitboard.field_name(output) == test_input
+
+    @pytest.mark.parametrize(
+        "test_input, output",
+        [("A1", ["A2", "B1", "B2"]), ("E5", ["D4", "D5", "D6", "E4", "E6", "F4", "F5", "F6"]), ("J10", ["I9", "I10", "J9"])]
+    )
+    def test_neighbours(self, test_input: str, output: list):
+        """Testing the neighbours function"""
+
+        mask = bitboard.neighbours(bitboard.field_index(test_input))
+        field_name_list = [bitboard.field_name(index) for index in bitboard.iter_indexes(mask)]
+        assert field_name_list == output
+
+
+class TestCompactBoard:
+    """Testing the CompactBoard class methods"""
+
+    def test_from_columns(self, compact_board: bitboard.CompactBoard):
+        """Testing the from_columns and to_columns methods"""
+
+        assert compact_board.to_columns() == board
+        assert len(compact_board.ships) == 11, compact_board.labels
+        assert compact_board.labels[0] == (27, 1), compact_board.labels
+
+        # the hit field B1 belongs to the ship 27.4
+        slot = compact_board.labels.index((27, 4))
+        assert compact_board.slot_at(bitboard.field_index("B1")) == slot
+
+    def test_to_bytes(self, compact_board: bitboard.CompactBoard):
+        """Testing the to_bytes and from_bytes methods"""
+
+        data = compact_board.to_bytes()
+        assert len(data) == 1 + 18 * 11 + 26, len(data)
+        assert bitboard.CompactBoard.from_bytes(data) == compact_board
+        assert bitboard.CompactBoard.from_bytes(memoryview(data)) == compact_board
+        assert bitboard.CompactBoard.from_bytes(b"") == bitboard.CompactBoard()
+
+    def test_empty_board(self):
+        """Testing an empty board"""
+
+        columns = bitboard.CompactBoard().to_columns()
+        assert list(columns) == list(bitboard.COLUMN_NAMES)
+        assert columns["A"] == {f"A{number}": "" for number in range(1, 11)}
+
+    def test_place_ship(self):
+        """Testing the place_ship method"""
+
+        compact_board = bitboard.CompactBoard()
+        slot = compact_board.place_ship(3, 1, ["A5", "A6", "A7"])
+        columns = compact_board.to_columns()
+
+        assert slot == 0
+        assert (columns["A"]["A5"], columns["A"]["A6"], columns["A"]["A7"]) == (3.1, 3.1, 3.1)
+        assert (columns["A"]["A4"], columns["A"]["A8"], columns["B"]["B6"]) == (" space 3.1",) * 3
+        assert columns["C"]["C6"] == ""
+
+    @pytest.mark.parametrize("test_input, output", [("F1", "hit"), ("A5", "miss"), ("F2", "miss"), ("B1", "miss")])
+    def test_shoot(self, test_input: str, output: str, compact_board: bitboard.CompactBoard):
+        """Testing the shoot method"""
+
+        shot_type, slot = compact_board.shoot(test_input)
+        assert shot_type == output
+        assert (slot is not None) == (output == "hit")
+        assert compact_board.to_columns()[test_input[0]][test_input] in ("hit", "miss")
+
+    def test_is_sunk(self, compact_board: bitboard.CompactBoard):
+        """Testing the is_sunk method"""
+
+        slot = compact_board.labels.index((45, 1))
+        assert compact_board.is_sunk(slot) == False
+
+        compact_board.shoot("H10")
+        assert compact_board.is_sunk(slot) == True
+
+    def test_reveal_space(self, compact_board: bitboard.CompactBoard):
+        """Testing the reveal_space method"""
+
+        slot = compact_board.labels.index((45, 1))
+        compact_board.shoot("H10")
+
+        field_name_dict = compact_board.reveal_space(slot)
+        assert field_name_dict == {"G9": "miss", "G10": "miss", "H9": "miss", "I9": "miss", "I10": "miss"}
+        assert compact_board.to_columns()["G"]["G9"] == "miss"
+        assert compact_board.reveal_space(slot) == {}
+
+    def test_count_living_ships(self, compact_board: bitboard.CompactBoard):
+        """Testing the count_living_ships method"""
+
+        assert compact_board.count_living_ships() == 11
+
+        compact_board.shoot("H10")
+        assert compact_board.count_living_ships() == 10
+
+        compact_board.clear()
+        assert compact_board.count_living_ships() == 0
+
+    def test_get_living_ship_dict(self, compact_board: bitboard.CompactBoard):
+        """Testing the get_living_ship_dict method"""
+
+        ship_dict = compact_board.get_living_ship_dict()
+        assert (ship_dict[27.4], ship_dict[45.1], len(ship_dict)) == (3, 1, 11), ship_dict
+
+        compact_board.shoot("H10")
+        compact_board = bitboard.CompactBoard.from_bytes(compact_board.to_bytes())
+        ship_dict = compact_board.get_living_ship_dict()
+        assert 45.1 not in ship_dict, ship_dict
+        assert compact_board.count_living_ships() == len(ship_dict) == 10
+
+    def test_halos(self, compact_board: bitboard.CompactBoard):
+        """Testing that the space around ships is taken from the neighbour table"""
+
+        slot = compact_board.labels.index((27, 4))
+        assert compact_board.space(slot) == bitboard.get_halo(compact_board.ships[slot])
+
+        mask = bitboard.get_mask(["A5", "A6", "A7"])
+        halo = [bitboard.field_name(index) for index in bitboard.iter_indexes(bitboard.get_halo(mask))]
+        assert halo == ["A4", "A8", "B4", "B5", "B6", "B7", "B8"]
@@ -0,0 +1,46 @@
+import random
+import pytest
+
+from src.game.engine import layout_pool, placement
+from src.game.consumers.test.test_data import ships, ship_count_dict
+from config.utilities import redis_instance
+
+
+@pytest.fixture
+def fleet():
+    return placement.get_fleet(ships, ship_count_dict)
+
+
+class TestLayoutPool:
+    """Testing the layout pool functions"""
+
+    def test_encode(self, fleet: list):
+        """Testing the encode and decode functions"""
+
+        position_indexes = placement.draw_positions(placement.get_ship_sizes(fleet), random.Random(0))
+        layout = layout_pool.encode(position_indexes)
+
+        assert len(layout) == 20, layout
+        assert layout_pool.decode(layout) == position_indexes
+        assert placement.build_board(fleet, layout_pool.decode(layout)) == placement.place_fleet(fleet, random.Random(0))
+
+    @pytest.mark.asyncio
+    async def test_pop(self, fleet: list):
+        """Testing the fill and pop functions"""
+
+        ship_sizes = placement.get_ship_sizes(fleet)
+        redis_instance.delete(layout_pool.get_key(ship_sizes), layout_pool.get_refill_key(ship_sizes))
+
+        board, is_refill_needed = await layout_pool.pop(fleet)
+        assert board.count_living_ships() == 10
+        assert is_refill_needed == True
+
+        board, is_refill_needed = await layout_pool.pop(fleet)
+        assert is_refill_needed == False
+
+        assert layout_pool.fill(ship_sizes, 5) == 5
+        board, _ = await layout_pool.pop(fleet)
+        assert board.count_living_ships() == 10
+        assert redis_instance.llen(layout_pool.get_key(ship_sizes)) == 4
+
+        redis_instance.delete(layout_pool.get_key(ship_sizes), layout_pool.get_refill_key(ship_sizes))
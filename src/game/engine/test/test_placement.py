@@ -0,0 +1,54 @@
+import random
+import pytest
+
+from src.game.engine import bitboard, placement
+from src.game.consumers.test.test_data import ships, ship_count_dict
+
+
+@pytest.fixture
+def fleet():
+    return placement.get_fleet(ships, ship_count_dict)
+
+
+class TestPlacement:
+    """Testing the placement engine functions"""
+
+    @pytest.mark.parametrize("test_input, output", [(1, 100), (2, 180), (3, 160), (4, 140)])
+    def test_positions(self, test_input: int, output: int):
+        """Testing the precomputed ship positions"""
+
+        assert len(placement.POSITIONS[test_input]) == output
+        assert all(mask.bit_count() == test_input for mask, _ in placement.POSITIONS[test_input])
+
+    def test_get_fleet(self, fleet: list):
+        """Testing the get_fleet function"""
+
+        assert len(fleet) == 10, fleet
+        assert fleet[0] == (27, 1, 4), fleet
+        assert fleet[-1][2] == 1, fleet
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_place_fleet(self, seed: int, fleet: list):
+        """Testing that ships of a placed fleet don't touch each other"""
+
+        board = placement.place_fleet(fleet, random.Random(seed))
+        assert sorted(board.labels) == sorted((ship_id, ship_number) for ship_id, ship_number, _ in fleet)
+
+        for slot, mask in enumerate(board.ships):
+            other_ships = board.ship_mask & ~mask
+            assert not (mask | board.space(slot)) & other_ships, board.labels[slot]
+
+        assert bitboard.CompactBoard.from_columns(board.to_columns()) == board
+
+    def test_place_fleet_backtracking(self):
+        """Testing that the engine moves previous ships when the next one has no free position"""
+
+        # five ten-deck ships fit only when all of them lie along the same axis with a line between them
+        fleet = [(ship_id, 1, 10) for ship_id in range(5)]
+
+        for seed in range(10):
+            board = placement.place_fleet(fleet, random.Random(seed))
+            assert board.count_living_ships() == 5
+
+        with pytest.raises(ValueError):
+            placement.place_fleet(fleet + [(5, 1, 10)], random.Random(0))
@@ -0,0 +1,43 @@
+import pytest
+
+from copy import deepcopy
+
+from src.game.engine import bitboard, store
+from src.game.consumers.test.test_data import board
+from config.utilities import redis_instance
+
+
+LOBBY_SLUG = "2f5e1c6a-2b0e-4d8e-9a51-0c4d7f0a8f11"
+
+
+@pytest.fixture
+def compact_board():
+    yield bitboard.CompactBoard.from_columns(deepcopy(board))
+    store.delete(LOBBY_SLUG)
+
+
+class TestStore:
+    """Testing the game state store functions"""
+
+    def test_set_board(self, compact_board: bitboard.CompactBoard):
+        """Testing the set_board and get_board functions"""
+
+        assert store.get_board(LOBBY_SLUG, 1) is None
+
+        store.set_board(LOBBY_SLUG, 1, compact_board, is_dirty=False)
+        assert store.get_board(LOBBY_SLUG, 1) == compact_board
+        assert redis_instance.sismember(store.DIRTY_LOBBIES_KEY, LOBBY_SLUG) == False
+
+        compact_board.shoot("A1")
+        store.set_board(LOBBY_SLUG, 2, compact_board)
+        assert store.get_boards(LOBBY_SLUG)[2] == compact_board
+        assert redis_instance.sismember(store.DIRTY_LOBBIES_KEY, LOBBY_SLUG) == True
+
+    def test_delete(self, compact_board: bitboard.CompactBoard):
+        """Testing the delete function"""
+
+        store.set_board(LOBBY_SLUG, 1, compact_board)
+        store.delete(LOBBY_SLUG)
+
+        assert store.get_boards(LOBBY_SLUG) == {}
+        assert redis_instance.sismember(store.DIRTY_LOBBIES_KEY, LOBBY_SLUG) == False
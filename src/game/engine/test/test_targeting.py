@@ -0,0 +1,59 @@
+import random
+import pytest
+
+from src.game.engine import bitboard, placement, targeting
+from src.game.consumers.test.test_data import ships, ship_count_dict
+
+
+@pytest.fixture
+def compact_board():
+    fleet = placement.get_fleet(ships, ship_count_dict)
+    return placement.place_fleet(fleet, random.Random(0))
+
+
+def play(board: bitboard.CompactBoard, rng: random.Random) -> int:
+    """Shoot at a board with the targeting engine until all ships sink. Return the number of shots"""
+
+    shot_count = 0
+
+    while board.count_living_ships():
+        shot_type, slot = board.shoot(targeting.select_field(board, rng))
+        shot_count += 1
+
+        if shot_type == "hit" and board.is_sunk(slot):
+            board.reveal_space(slot)
+
+    return shot_count
+
+
+class TestTargeting:
+    """Testing the targeting functions"""
+
+    def test_get_heat_map(self, compact_board: bitboard.CompactBoard):
+        """Testing the get_heat_map function on an empty board"""
+
+        heat_map = targeting.get_heat_map(compact_board)
+
+        # 4 single-deck ships can stand on a corner field, every other ship can cover it in 2 ways
+        assert heat_map[bitboard.field_index("A1")] == 4 + 3 * 2 + 2 * 2 + 1 * 2, heat_map
+        assert max(heat_map) > heat_map[bitboard.field_index("A1")]
+        assert heat_map == heat_map[::-1], heat_map
+
+    def test_wounded_ship(self, compact_board: bitboard.CompactBoard):
+        """Testing that the fields next to a hit of a living ship are shot first"""
+
+        slot = max(range(len(compact_board.ships)), key=lambda slot: compact_board.ships[slot].bit_count())
+        index = next(bitboard.iter_indexes(compact_board.ships[slot]))
+        compact_board.shoot(bitboard.field_name(index))
+
+        field_index = bitboard.field_index(targeting.select_field(compact_board, random.Random(0)))
+        assert field_index in (index - 1, index + 1, index - bitboard.BOARD_SIZE, index + bitboard.BOARD_SIZE), field_index
+
+    def test_select_field(self):
+        """Testing that a game is finished without repeated shots and faster than random shooting"""
+
+        shot_counts = [play(placement.place_fleet(placement.get_fleet(ships, ship_count_dict), random.Random(seed)),
+                            random.Random(seed)) for seed in range(20)]
+
+        assert max(shot_counts) < 100, shot_counts
+        assert sum(shot_counts) / len(shot_counts) < 70, shot_counts
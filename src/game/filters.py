@@ -1,5 +1,7 @@
 import django_filters as filters
 
+from django_filters import utils
+
 from .models import Lobby
 
 
@@ -24,3 +26,36 @@ class LobbyFilter(filters.FilterSet):
     class Meta:
         model = Lobby
         fields = ["name", "bet", "time_to_move", "time_to_placement", "is_private"]
+
+
+def get_lobby_matcher(data, search_terms: list):
+    """
+    Get a function that checks a serialized lobby in memory against the parameters of LobbyFilter
+    and search terms of a name. The parameters are validated by the form of LobbyFilter.
+    """
+
+    form = LobbyFilter(data, queryset=Lobby.objects.none()).form
+
+    if not form.is_valid():
+        raise utils.translate_validation(form.errors)
+
+    name, is_private = form.cleaned_data["name"].lower(), form.cleaned_data["is_private"]
+    ranges = {field: form.cleaned_data[field] for field in ("bet", "time_to_move", "time_to_placement")}
+    name_parts = [term.lower() for term in search_terms] + ([name] if name else [])
+
+    def is_matched(lobby: dict) -> bool:
+        if any(name_part not in lobby["name"].lower() for name_part in name_parts):
+            return False
+        if is_private is not None and bool(lobby["password"]) != is_private:
+            return False
+
+        for field, value in ranges.items():
+            if value is None:
+                continue
+            if value.start is not None and lobby[field] < value.start:
+                return False
+            if value.stop is not None and lobby[field] > value.stop:
+                return False
+        return True
+
+    return is_matched
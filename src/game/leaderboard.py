@@ -0,0 +1,164 @@
+from config.utilities import redis_instance, async_redis_instance
+from ..user import models as user_models
+
+
+RATINGS_KEY = "leaderboard:ratings"
+USERNAMES_KEY = "leaderboard:usernames"
+IS_BUILT_KEY = "leaderboard:is_built"
+
+# A build holds the lock, ratings updated during a build are put to the keys of the build too
+BUILD_LOCK_KEY = "leaderboard:build_lock"
+BUILD_RATINGS_KEY = f"{RATINGS_KEY}:build"
+BUILD_USERNAMES_KEY = f"{USERNAMES_KEY}:build"
+
+BUILD_CHUNK_SIZE = 2000
+BUILD_TIMEOUT = 600
+
+# KEYS: the ratings, the usernames, the ratings of a build, the usernames of a build, the build lock
+# ARGV: <user id>, <rating>, <username> of every user
+_UPDATE_USERS = """
+local targets = {{KEYS[1], KEYS[2]}}
+
+if redis.call('EXISTS', KEYS[5]) == 1 then
+    table.insert(targets, {KEYS[3], KEYS[4]})
+end
+
+for _, target in ipairs(targets) do
+    for i = 1, #ARGV, 3 do
+        redis.call('ZADD', target[1], ARGV[i + 1], ARGV[i])
+        redis.call('HSET', target[2], ARGV[i], ARGV[i + 2])
+    end
+end
+"""
+
+# KEYS: the ratings, the usernames, the ratings of a build, the usernames of a build, the built flag, the build lock
+_SWAP_BUILD = """
+for i = 1, 2 do
+    if redis.call('EXISTS', KEYS[i + 2]) == 1 then
+        redis.call('RENAME', KEYS[i + 2], KEYS[i])
+    else
+        redis.call('DEL', KEYS[i])
+    end
+end
+redis.call('SET', KEYS[5], 1)
+redis.call('DEL', KEYS[6])
+"""
+
+update_users_script = redis_instance.register_script(_UPDATE_USERS)
+aupdate_users_script = async_redis_instance.register_script(_UPDATE_USERS)
+swap_build_script = redis_instance.register_script(_SWAP_BUILD)
+
+UPDATE_KEYS = [RATINGS_KEY, USERNAMES_KEY, BUILD_RATINGS_KEY, BUILD_USERNAMES_KEY, BUILD_LOCK_KEY]
+
+
+def build() -> int | None:
+    """
+    Put ratings of all users to the leaderboard. Return the number of users, None if another build is running.
+    The leaderboard is built under temporary keys and swapped in, readers never see it half built.
+    Ratings that are updated during the build are put to the temporary keys too and aren't overwritten by the build,
+    they are newer than the rows it reads.
+    """
+
+    if not redis_instance.set(BUILD_LOCK_KEY, 1, nx=True, ex=BUILD_TIMEOUT):
+        return None
+
+    # Updates written before the keys are cleared are committed to the database already, the build reads them
+    redis_instance.delete(BUILD_RATINGS_KEY, BUILD_USERNAMES_KEY)
+
+    users = user_models.User.objects.values_list("id", "username", "rating").iterator(chunk_size=BUILD_CHUNK_SIZE)
+    count, pipeline = 0, redis_instance.pipeline()
+
+    for user_id, username, rating in users:
+        pipeline.zadd(BUILD_RATINGS_KEY, {user_id: rating}, nx=True)
+        pipeline.hsetnx(BUILD_USERNAMES_KEY, user_id, username)
+        count += 1
+
+        if count % BUILD_CHUNK_SIZE == 0:
+            pipeline.execute()
+
+    pipeline.execute()
+    swap_build_script(keys=[RATINGS_KEY, USERNAMES_KEY, BUILD_RATINGS_KEY, BUILD_USERNAMES_KEY, IS_BUILT_KEY, BUILD_LOCK_KEY])
+
+    return count
+
+
+def build_if_missing() -> int | None:
+    """
+    Build the leaderboard if it isn't built, e.g. after Redis has lost it.
+    Return the number of users, None if no build ran.
+    Readers don't build it, they serve what is there until a build is swapped in.
+    """
+
+    if redis_instance.exists(IS_BUILT_KEY):
+        return None
+    return build()
+
+
+def _get_entries(first_position: int, last_position: int) -> list[dict]:
+    """Get entries of the leaderboard between two positions counted from 0, the highest rating first"""
+
+    ratings = redis_instance.zrevrange(RATINGS_KEY, first_position, last_position, withscores=True)
+
+    if not ratings:
+        return []
+
+    usernames = redis_instance.hmget(USERNAMES_KEY, [user_id for user_id, _ in ratings])
+    return [
+        {"rank": first_position + index + 1, "username": username, "rating": int(rating)}
+        for index, ((_, rating), username) in enumerate(zip(ratings, usernames))
+    ]
+
+
+def get_top(count: int) -> list[dict]:
+    """Get the users with the highest rating"""
+
+    return _get_entries(0, count - 1)
+
+
+def _get_position(user: user_models.User) -> int:
+    """Get a position of a user counted from 0. A user that isn't on the leaderboard yet is added"""
+
+    position = redis_instance.zrevrank(RATINGS_KEY, user.id)
+
+    if position is None:
+        update_users(user)
+        position = redis_instance.zrevrank(RATINGS_KEY, user.id)
+
+    return position
+
+
+def get_rank(user: user_models.User) -> dict:
+    """Get an entry of a user"""
+
+    position = _get_position(user)
+    return _get_entries(position, position)[0]
+
+
+def get_around(user: user_models.User, radius: int) -> list[dict]:
+    """Get entries of a user and of up to <radius> users above and below the user"""
+
+    position = _get_position(user)
+    return _get_entries(max(position - radius, 0), position + radius)
+
+
+def _get_update_args(users) -> list:
+    return [value for user in users for value in (user.id, user.rating, user.username)]
+
+
+def update_users(*users: user_models.User) -> None:
+    """Put current ratings of users to the leaderboard"""
+
+    update_users_script(keys=UPDATE_KEYS, args=_get_update_args(users))
+
+
+async def aupdate_users(*users: user_models.User) -> None:
+    """Put current ratings of users to the leaderboard, from consumers"""
+
+    await aupdate_users_script(keys=UPDATE_KEYS, args=_get_update_args(users))
+
+
+def remove_user(user_id: int) -> None:
+    pipeline = redis_instance.pipeline()
+    pipeline.zrem(RATINGS_KEY, user_id)
+    pipeline.hdel(USERNAMES_KEY, user_id)
+    pipeline.execute()
@@ -0,0 +1,157 @@
+import json
+import datetime
+
+from channels.db import database_sync_to_async
+
+from config import settings
+from config.utilities import redis_instance, async_redis_instance
+from . import db_queries, serializers
+
+
+# Entries of lobbies by lobby id, and lobby ids sorted by (created_in, id), the key KeysetPagination pages on
+LOBBIES_KEY = "lobby_list:lobbies"
+ORDER_KEY = "lobby_list:order"
+IS_BUILT_KEY = "lobby_list:is_built"
+
+# Scores are microseconds since the epoch, they stay below 2 ** 53, so a sorted set keeps them exact.
+# Members are ids padded with zeros, so lobbies created in the same microsecond are sorted by id
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+MEMBER_WIDTH = 12
+
+
+def get_score(created_in: datetime.datetime) -> int:
+    """Get a score of the time a lobby was created in"""
+
+    return (created_in - EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _get_member(lobby_id: int) -> str:
+    return f"{lobby_id:0{MEMBER_WIDTH}d}"
+
+
+def _dump_lobbies(lobbies) -> dict[int, tuple[str, int]]:
+    """Serialize lobbies to entries of the index and their scores, urls are kept relative to a host"""
+
+    lobbies = list(lobbies)
+    data = serializers.ListLobbySerializer(lobbies, many=True, context={"request": None}).data
+    return {lobby.id: (json.dumps(entry), get_score(lobby.created_in)) for lobby, entry in zip(lobbies, data)}
+
+
+@database_sync_to_async
+def _dump_open_lobby(lobby_id: int) -> tuple[str, int] | None:
+    """Serialize a lobby to an entry of the index and its score, None if the lobby isn't open"""
+
+    return _dump_lobbies(db_queries.get_open_lobbies().filter(id=lobby_id)).get(lobby_id)
+
+
+def _put_lobby(pipeline, lobby_id: int, dump: tuple[str, int] | None) -> None:
+    """Put a lobby to the index on a pipeline, a lobby without an entry leaves the index"""
+
+    if dump is None:
+        pipeline.hdel(LOBBIES_KEY, lobby_id)
+        pipeline.zrem(ORDER_KEY, _get_member(lobby_id))
+    else:
+        pipeline.hset(LOBBIES_KEY, lobby_id, dump[0])
+        pipeline.zadd(ORDER_KEY, {_get_member(lobby_id): dump[1]})
+
+
+def build() -> int:
+    """Put all open lobbies to the index. Return the number of them"""
+
+    dumps = _dump_lobbies(db_queries.get_open_lobbies())
+
+    pipeline = redis_instance.pipeline()
+    pipeline.delete(LOBBIES_KEY, ORDER_KEY)
+    if dumps:
+        pipeline.hset(LOBBIES_KEY, mapping={lobby_id: entry for lobby_id, (entry, _) in dumps.items()})
+        pipeline.zadd(ORDER_KEY, {_get_member(lobby_id): score for lobby_id, (_, score) in dumps.items()})
+    pipeline.set(IS_BUILT_KEY, 1, ex=settings.LOBBY_LIST_SETTINGS["EXPIRY"])
+    pipeline.execute()
+
+    return len(dumps)
+
+
+class OpenLobbies:
+    """
+    Open lobbies of the index that pass a filter, KeysetPagination pages them by get_page.
+    A page is read from the sorted set from the key of a cursor, entries are read only for ids of the page.
+    """
+
+    def __init__(self, is_matched=None) -> None:
+        self.is_matched = is_matched
+
+    @staticmethod
+    def is_after(key: tuple[int, int] | None, score: float, member: str, is_reversed: bool) -> bool:
+        """Check whether a member of the sorted set comes after the key of a cursor"""
+
+        if key is None:
+            return True
+        return (int(score), int(member)) > key if is_reversed else (int(score), int(member)) < key
+
+    def get_page(
+            self, created_in: datetime.datetime | None, lobby_id: int | None, is_reversed: bool, count: int
+        ) -> list[dict]:
+        """
+        Get up to <count> lobbies after the key (created_in, lobby_id), from the newest or, reversed, from the oldest.
+        The index is built from the database if it has expired.
+        """
+
+        if not redis_instance.exists(IS_BUILT_KEY):
+            build()
+
+        if created_in is None:
+            bound, key = ("-inf" if is_reversed else "+inf"), None
+        else:
+            bound = get_score(created_in)
+            key = (bound, lobby_id)
+
+        read_members = redis_instance.zrangebyscore if is_reversed else redis_instance.zrevrangebyscore
+        end = "+inf" if is_reversed else "-inf"
+
+        # The bound is inclusive, so a batch has one more id for the lobby of the cursor that is read again
+        batch_size = count + 1
+        lobbies, offset = [], 0
+
+        while len(lobbies) < count:
+            members = read_members(ORDER_KEY, bound, end, start=offset, num=batch_size, withscores=True)
+            offset += len(members)
+
+            lobby_ids = [int(member) for member, score in members if self.is_after(key, score, member, is_reversed)]
+
+            # A lobby that left the index between the two reads has no entry anymore
+            for entry in redis_instance.hmget(LOBBIES_KEY, lobby_ids) if lobby_ids else []:
+                if entry is not None:
+                    lobby = json.loads(entry)
+                    if self.is_matched is None or self.is_matched(lobby):
+                        lobbies.append(lobby)
+
+            if len(members) < batch_size:
+                break
+
+        return lobbies[:count]
+
+
+def refresh(lobby_id: int) -> None:
+    """Update an entry of a lobby from the database, from views"""
+
+    pipeline = redis_instance.pipeline()
+    _put_lobby(pipeline, lobby_id, _dump_lobbies(db_queries.get_open_lobbies().filter(id=lobby_id)).get(lobby_id))
+    pipeline.execute()
+
+
+async def arefresh(lobby_id: int) -> None:
+    """Update an entry of a lobby from the database, the lobby leaves the index when it isn't open anymore"""
+
+    dump = await _dump_open_lobby(lobby_id)
+
+    pipeline = async_redis_instance.pipeline()
+    _put_lobby(pipeline, lobby_id, dump)
+    await pipeline.execute()
+
+
+async def aremove(lobby_id: int) -> None:
+    """Remove a deleted lobby from the index"""
+
+    pipeline = async_redis_instance.pipeline()
+    _put_lobby(pipeline, lobby_id, None)
+    await pipeline.execute()
@@ -0,0 +1,98 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.game import services
+from src.game.engine import bitboard, placement
+
+
+SHIPS = [
+    {"id": 1, "name": "fourdeck", "size": 4},
+    {"id": 2, "name": "tripledeck", "size": 3},
+    {"id": 3, "name": "doubledeck", "size": 2},
+    {"id": 4, "name": "singledeck", "size": 1},
+]
+
+
+def legacy_random_placement(ships: list, ship_count_dict: dict) -> dict:
+    """
+    The placement that was used before the placement engine: up to 100 random positions per ship,
+    the whole fleet is placed again from scratch if a ship doesn't fit.
+    """
+
+    while True:
+        board = _legacy_try_placement(ships, ship_count_dict)
+        if board is not None:
+            return board
+
+
+def _legacy_try_placement(ships: list, ship_count_dict: dict) -> dict | None:
+    """Place a fleet on an empty board, None if some ship didn't fit"""
+
+    board = bitboard.CompactBoard().to_columns()
+
+    for ship in ships:
+        for ship_number in range(1, ship_count_dict[ship["name"]] + 1):
+            for _ in range(100):
+                field_list = _legacy_field_list(random.choice(("horizontal", "vertical")), ship["size"])
+                if all(not board[field_name[0]][field_name] for field_name in field_list):
+                    break
+            else:
+                return None
+
+            for field_name in field_list:
+                board[field_name[0]][field_name] = bitboard.ship_label(ship["id"], ship_number)
+
+            for index in bitboard.iter_indexes(bitboard.get_halo(bitboard.get_mask(field_list))):
+                field_name = bitboard.field_name(index)
+                board[field_name[0]][field_name] += f" space {ship['id']}.{ship_number}"
+
+    return board
+
+
+def _legacy_field_list(plane: str, ship_size: int) -> list:
+    """Get fields of a ship from a random field the way the legacy placement did"""
+
+    column_name_list = list(bitboard.COLUMN_NAMES)
+    number = random.randint(1, 10)
+    index = random.randrange(10)
+
+    if plane == "vertical":
+        step = 1 if number + ship_size <= 10 else -1
+        return [f"{column_name_list[index]}{number + step * deck}" for deck in range(ship_size)]
+
+    step = 1 if index + ship_size <= 9 else -1
+    return [f"{column_name_list[index + step * deck]}{number}" for deck in range(ship_size)]
+
+
+class Command(BaseCommand):
+    help = "Compare latency of the placement engine with the legacy random placement"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rounds", type=int, default=2000, help="Number of placed fleets per implementation")
+
+    def handle(self, *args, **options):
+        rounds = options["rounds"]
+        fleet = placement.get_fleet(SHIPS, services.ship_count_dict)
+
+        self.report("engine", self.measure(lambda: placement.place_fleet(fleet).to_columns(), rounds))
+        self.report("legacy", self.measure(lambda: legacy_random_placement(SHIPS, services.ship_count_dict), rounds))
+
+    @staticmethod
+    def measure(function, rounds: int) -> list:
+        """Get sorted durations of calls in milliseconds"""
+
+        durations = []
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+            function()
+            durations.append((time.perf_counter() - start) * 1000)
+
+        return sorted(durations)
+
+    def report(self, name: str, durations: list) -> None:
+        p50 = durations[len(durations) // 2]
+        p99 = durations[int(len(durations) * 0.99)]
+        self.stdout.write(f"{name}: p50 {p50:.3f} ms, p99 {p99:.3f} ms, max {durations[-1]:.3f} ms")
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from src.game import db_queries, lobby_list
+
+
+class Command(BaseCommand):
+    help = "Count players of existing lobbies to their player_count and is_open fields, and rebuild the lobby list"
+
+    def handle(self, *args, **options):
+        count = db_queries.count_players_of_lobbies()
+        lobby_list.build()
+        self.stdout.write(f"Players of {count} lobbies were counted")
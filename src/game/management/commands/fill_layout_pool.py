@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from src.game import services
+from src.game.engine import layout_pool, placement
+
+
+class Command(BaseCommand):
+    help = "Fill the pool of fleet layouts that is used by random placement"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=None, help="Number of layouts in the pool")
+
+    def handle(self, *args, **options):
+        ships = [{"id": 0, "name": name, "size": size} for name, size in services.ship_size_dict.items()]
+        ship_sizes = placement.get_ship_sizes(placement.get_fleet(ships, services.ship_count_dict))
+
+        count = layout_pool.fill(ship_sizes, options["size"])
+        self.stdout.write(f"{count} layouts were added to {layout_pool.get_key(ship_sizes)}")
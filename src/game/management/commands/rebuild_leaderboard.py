@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from src.game import leaderboard
+
+
+class Command(BaseCommand):
+    help = "Rebuild the leaderboard in Redis from ratings of users in the database"
+
+    def handle(self, *args, **options):
+        count = leaderboard.build()
+
+        if count is None:
+            return self.stdout.write("The leaderboard is being built by another process")
+        self.stdout.write(f"{count} users were put to {leaderboard.RATINGS_KEY}")
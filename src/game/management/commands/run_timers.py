@@ -0,0 +1,12 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from src.game.timers import service
+
+
+class Command(BaseCommand):
+    help = "Run the timer service that fires turn deadlines of all lobbies"
+
+    def handle(self, *args, **options):
+        asyncio.run(service.serve())
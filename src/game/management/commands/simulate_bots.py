@@ -0,0 +1,56 @@
+import os
+import itertools
+
+from multiprocessing import Pool
+from django.core.management.base import BaseCommand
+
+from src.game.bots import simulation
+
+
+class Command(BaseCommand):
+    help = "Play bot levels against each other in memory and report win rates, shots to win and decision latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=1000, help="Number of games per pair of bot levels")
+        parser.add_argument("--levels", nargs="+", choices=simulation.BOT_LEVELS, default=simulation.BOT_LEVELS,
+                            help="Bot levels to play, every pair of them plays")
+        parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Number of processes that play games")
+        parser.add_argument("--seed", type=int, default=None, help="Seed of layouts and shots")
+
+    def handle(self, *args, **options):
+        pairs = list(itertools.combinations(options["levels"], 2)) or [(options["levels"][0],) * 2]
+        processes = options["processes"]
+        jobs = []
+
+        for pair in pairs:
+            for process in range(processes):
+                game_count = options["games"] // processes + (process < options["games"] % processes)
+                seed = None if options["seed"] is None else options["seed"] + len(jobs)
+                jobs.append((pair, game_count, seed))
+
+        if processes > 1:
+            with Pool(processes) as pool:
+                results = pool.starmap(simulation.simulate, jobs)
+        else:
+            results = [simulation.simulate(*job) for job in jobs]
+
+        stats = simulation.SimulationStats()
+        for result in results:
+            stats.merge(result)
+
+        self.report(stats, pairs)
+
+    def report(self, stats: simulation.SimulationStats, pairs: list) -> None:
+        for pair in pairs:
+            rates = ", ".join(f"{bot_level} {stats.get_win_rate(pair, bot_level):.1%}" for bot_level in dict.fromkeys(pair))
+            self.stdout.write(f"{' vs '.join(pair)}: {stats.games[pair]} games, wins: {rates}")
+
+        for bot_level, histogram in stats.latency_histograms.items():
+            shots = stats.get_average_shots_to_win(bot_level)
+            shots = f"{shots:.1f}" if shots is not None else "-"
+            p50, p99 = stats.get_latency_quantile(bot_level, 0.5), stats.get_latency_quantile(bot_level, 0.99)
+            self.stdout.write(f"{bot_level}: {shots} shots to win, decision p50 < {p50} us, p99 < {p99} us")
+
+            for bucket, count in enumerate(histogram):
+                if count:
+                    self.stdout.write(f"    < {2 ** bucket:>7} us: {count}")
@@ -4,7 +4,7 @@ import uuid
 from typing import Optional
 from django.db import models
 from django.urls.base import reverse
-from config import settings, utilities
+from config import settings
 from .services import Bet, ChooseTime, ChooseBotLevel
 
 
@@ -34,11 +34,26 @@ class Lobby(models.Model):
     winner: str = models.CharField(max_length=150, blank=True)
     users: Optional[list[User]] = models.ManyToManyField(to=User, related_name="lobbies", help_text="Required")
 
+    # Kept by db_queries.add_users_to_lobby, a lobby is open while it waits for a second player
+    player_count: int = models.PositiveSmallIntegerField("number of players", default=0)
+    is_open: bool = models.BooleanField("is open", default=False)
+
     class Meta:
         verbose_name = "Lobby"
         verbose_name_plural = "Lobbies"
         ordering = ["bet", "created_in", "finished_in"]
         unique_together = ["slug"]
+        indexes = [
+            models.Index(fields=["created_in", "id"], name="lobby_created_in_idx"),
+            models.Index(
+                fields=["finished_in", "id"], name="finished_lobby_idx",
+                condition=models.Q(finished_in__isnull=False, is_play_with_a_bot__isnull=True)
+            ),
+            models.Index(
+                fields=["bet", "created_in"], name="open_lobby_idx",
+                condition=models.Q(is_open=True, is_play_with_a_bot__isnull=True)
+            ),
+        ]
 
     def __str__(self):
         return f"lobby {self.name}"
@@ -50,16 +65,7 @@ class Lobby(models.Model):
 class Board(models.Model):
     """Game board model"""
 
-    A: str = models.TextField("column A", default=utilities.column_generate("A"))
-    B: str = models.TextField("column B", default=utilities.column_generate("B"))
-    C: str = models.TextField("column C", default=utilities.column_generate("C"))
-    D: str = models.TextField("column D", default=utilities.column_generate("D"))
-    E: str = models.TextField("column E", default=utilities.column_generate("E"))
-    F: str = models.TextField("column F", default=utilities.column_generate("F"))
-    G: str = models.TextField("column G", default=utilities.column_generate("G"))
-    H: str = models.TextField("column H", default=utilities.column_generate("H"))
-    I: str = models.TextField("column I", default=utilities.column_generate("I"))
-    J: str = models.TextField("column J", default=utilities.column_generate("J"))
+    grid: bytes = models.BinaryField("grid", default=bytes)
     is_ready: bool = models.BooleanField("is ready", default=False)
     is_my_turn: bool = models.BooleanField("is my turn", default=False)
     is_play_again: bool = models.BooleanField("is play again", null=True)
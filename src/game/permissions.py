@@ -7,7 +7,7 @@ class IsLobbyFree(BasePermission):
     message = "The lobby is crowded"
 
     def has_object_permission(self, request, view, obj):
-        if len(obj.users.all()) < 2 or request.user in obj.users.all():
+        if obj.player_count < 2 or request.user in obj.users.all():
             return True
         return False
 
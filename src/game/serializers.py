@@ -1,8 +1,9 @@
 import re
-import json
 
 from rest_framework import serializers, status
-from . import models, services
+from rest_framework.reverse import reverse
+from . import models
+from .engine import bitboard
 from ..user import models as user_models
 
 
@@ -30,15 +31,13 @@ class BoardSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = models.Board
-        fields = ["id", "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "is_ready", "is_my_turn", "is_play_again", 
-                  "lobby_id", "user_id", "ships"]
+        fields = ["id", "is_ready", "is_my_turn", "is_play_again", "lobby_id", "user_id", "ships"]
         extra_kwargs = {"user_id": {"read_only": True}, "lobby_id": {"read_only": True}}
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        for column_name, in services.column_name_list:
-            ret[column_name] = json.loads(ret[column_name].replace("'", '"'))
-        return ret
+        columns = bitboard.CompactBoard.from_bytes(instance.grid).to_columns()
+        return {"id": ret.pop("id"), **columns, **ret}
 
 
 class MessageSerializer(serializers.ModelSerializer):
@@ -123,11 +122,13 @@ class RetrieveLobbyWithUsersSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "created_in", "bet", "password", "time_to_move", "time_to_placement", "slug", "users"]
 
 
-class LeadBoardSerializer(serializers.HyperlinkedModelSerializer):
-    """Base user serializer"""
+class LeadBoardSerializer(serializers.Serializer):
+    """Leaderboard entry serializer"""
 
-    url = serializers.HyperlinkedIdentityField(lookup_field="username", view_name="user-detail")
+    url = serializers.SerializerMethodField()
+    rank = serializers.IntegerField()
+    username = serializers.CharField()
+    rating = serializers.IntegerField()
 
-    class Meta:
-        model = user_models.User
-        fields = ("url", "username", "rating")
+    def get_url(self, entry: dict) -> str:
+        return reverse("user-detail", kwargs={"username": entry["username"]}, request=self.context.get("request"))
@@ -7,6 +7,12 @@ ship_count_dict = {
     "singledeck": 4,
     "doubledeck": 3    
 }
+ship_size_dict = {
+    "fourdeck": 4,
+    "tripledeck": 3,
+    "singledeck": 1,
+    "doubledeck": 2
+}
 
 
 class Bet(models.IntegerChoices):
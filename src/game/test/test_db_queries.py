@@ -0,0 +1,79 @@
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from src.game import models, db_queries
+from src.user import models as user_models
+
+
+class TestGameDBQueriesModule(APITestCase):
+    """Testing ./game/db_queries module functions"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.user_1 = user_models.User.objects.get(id=1)
+        self.user_2 = user_models.User.objects.get(id=2)
+        self.user_3 = user_models.User.objects.get(id=3)
+
+    def test_get_open_lobbies(self):
+        """Testing get_open_lobbies function"""
+
+        lobbies = db_queries.get_open_lobbies()
+        assert [lobby.id for lobby in lobbies] == [2], lobbies
+
+    def test_add_users_to_lobby(self):
+        """Testing add_users_to_lobby function"""
+
+        lobby = models.Lobby.objects.create(name="lobby", bet=50)
+        assert (lobby.player_count, lobby.is_open) == (0, False), (lobby.player_count, lobby.is_open)
+
+        is_added = db_queries.add_users_to_lobby(lobby.id, [self.user_1])
+        lobby.refresh_from_db()
+        assert is_added == True, is_added
+        assert (lobby.player_count, lobby.is_open) == (1, True), (lobby.player_count, lobby.is_open)
+
+        # A user that is already in the lobby isn't counted twice
+        is_added = db_queries.add_users_to_lobby(lobby.id, [self.user_1, self.user_2])
+        lobby.refresh_from_db()
+        assert is_added == True, is_added
+        assert (lobby.player_count, lobby.is_open) == (2, False), (lobby.player_count, lobby.is_open)
+
+        is_added = db_queries.add_users_to_lobby(lobby.id, [self.user_3])
+        lobby.refresh_from_db()
+        assert is_added == False, is_added
+        assert lobby.player_count == 2, lobby.player_count
+        assert set(lobby.users.values_list("id", flat=True)) == {1, 2}, lobby.users.all()
+
+    def test_remove_user_from_lobbies(self):
+        """Testing remove_user_from_lobbies function"""
+
+        lobby_ids = db_queries.remove_user_from_lobbies(self.user_1.id)
+        assert sorted(lobby_ids) == [1, 2], lobby_ids
+
+        lobby_1, lobby_2 = models.Lobby.objects.get(id=1), models.Lobby.objects.get(id=2)
+        assert (lobby_1.player_count, lobby_1.is_open) == (1, True), (lobby_1.player_count, lobby_1.is_open)
+        assert (lobby_2.player_count, lobby_2.is_open) == (0, False), (lobby_2.player_count, lobby_2.is_open)
+        assert not lobby_1.users.filter(id=self.user_1.id).exists()
+
+    def test_remove_user_from_finished_lobby(self):
+        """Testing that remove_user_from_lobbies doesn't open a lobby of a finished game"""
+
+        models.Lobby.objects.filter(id=1).update(finished_in=timezone.now())
+        db_queries.remove_user_from_lobbies(self.user_1.id)
+
+        lobby_1 = models.Lobby.objects.get(id=1)
+        assert (lobby_1.player_count, lobby_1.is_open) == (1, False), (lobby_1.player_count, lobby_1.is_open)
+
+    def test_count_players_of_lobbies(self):
+        """Testing count_players_of_lobbies function"""
+
+        models.Lobby.objects.update(player_count=0, is_open=False)
+
+        count = db_queries.count_players_of_lobbies()
+        assert count == 2, count
+        assert list(models.Lobby.objects.order_by("id").values_list("player_count", "is_open")) == [(2, False), (1, True)]
+
+        models.Lobby.objects.filter(id=2).update(finished_in=timezone.now())
+        db_queries.count_players_of_lobbies()
+        assert models.Lobby.objects.get(id=2).is_open == False
@@ -1,3 +1,4 @@
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase
 
 from src.game import models, filters
@@ -36,4 +37,40 @@ class TestLobbyFilter(APITestCase):
 
         filtered_queryset = self.instance.filter_is_private(self.lobby_list, "is_private", False)
         assert len(filtered_queryset) == 1, filtered_queryset
-        assert filtered_queryset[0].name == "string1", filtered_queryset
\ No newline at end of file
+        assert filtered_queryset[0].name == "string1", filtered_queryset
+
+class TestGetLobbyMatcher(APITestCase):
+    """Testing the get_lobby_matcher function"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.lobby_list = [
+            {"id": 1, "name": "string", "password": "admin", "bet": 100, "time_to_move": 30, "time_to_placement": 30},
+            {"id": 2, "name": "string1", "password": "", "bet": 50, "time_to_move": 60, "time_to_placement": 30},
+        ]
+
+    def filter_lobby_list(self, data, search_terms: list) -> list:
+        is_matched = filters.get_lobby_matcher(data, search_terms)
+        return [lobby for lobby in self.lobby_list if is_matched(lobby)]
+
+    def test_get_lobby_matcher(self):
+        """Testing the get_lobby_matcher function"""
+
+        filtered_list = self.filter_lobby_list({}, [])
+        assert len(filtered_list) == 2, filtered_list
+
+        filtered_list = self.filter_lobby_list({"name": "RING1"}, [])
+        assert [lobby["id"] for lobby in filtered_list] == [2], filtered_list
+
+        filtered_list = self.filter_lobby_list({}, ["str", "1"])
+        assert [lobby["id"] for lobby in filtered_list] == [2], filtered_list
+
+        filtered_list = self.filter_lobby_list({"is_private": "true"}, [])
+        assert [lobby["id"] for lobby in filtered_list] == [1], filtered_list
+
+        filtered_list = self.filter_lobby_list({"bet_min": 60, "time_to_move_max": 30}, [])
+        assert [lobby["id"] for lobby in filtered_list] == [1], filtered_list
+
+        with self.assertRaises(ValidationError):
+            self.filter_lobby_list({"bet_min": "hundred"}, [])
@@ -0,0 +1,87 @@
+from rest_framework.test import APITransactionTestCase
+
+from src.game import leaderboard
+from src.user import models as user_models
+from config.utilities import redis_instance
+
+
+class TestLeaderboard(APITransactionTestCase):
+    """Testing the leaderboard of user ratings"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        for user_id, rating in ((1, 100), (2, 80), (3, 60), (4, 40)):
+            user_models.User.objects.filter(id=user_id).update(rating=rating)
+        self.user_2 = user_models.User.objects.get(id=2)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(
+            leaderboard.RATINGS_KEY, leaderboard.USERNAMES_KEY, leaderboard.IS_BUILT_KEY, leaderboard.BUILD_LOCK_KEY,
+            leaderboard.BUILD_RATINGS_KEY, leaderboard.BUILD_USERNAMES_KEY
+        )
+
+    def test_get_top(self):
+        """Testing the get_top function"""
+
+        # Readers don't build the leaderboard
+        assert leaderboard.get_top(2) == []
+        assert redis_instance.exists(leaderboard.IS_BUILT_KEY) == 0
+
+        assert leaderboard.build_if_missing() == 4
+        assert leaderboard.build_if_missing() is None
+
+        entries = leaderboard.get_top(2)
+        assert [entry["username"] for entry in entries] == ["admin", "lanterman"], entries
+        assert entries[0] == {"rank": 1, "username": "admin", "rating": 100}, entries[0]
+
+        # The leaderboard is served without the database once it is built
+        user_models.User.objects.filter(id=1).update(rating=0)
+        entries = leaderboard.get_top(2)
+        assert entries[0]["rating"] == 100, entries
+
+    def test_get_rank_and_around(self):
+        """Testing the get_rank and get_around functions"""
+
+        leaderboard.build()
+        entry = leaderboard.get_rank(self.user_2)
+        assert entry == {"rank": 2, "username": "lanterman", "rating": 80}, entry
+
+        entries = leaderboard.get_around(self.user_2, 1)
+        assert [entry["rank"] for entry in entries] == [1, 2, 3], entries
+
+        entries = leaderboard.get_around(self.user_2, 5)
+        assert [entry["username"] for entry in entries] == ["admin", "lanterman", "user", "no_activate"], entries
+
+    def test_update_users(self):
+        """Testing the update_users function"""
+
+        leaderboard.build()
+        self.user_2.rating = 120
+        leaderboard.update_users(self.user_2)
+
+        entry = leaderboard.get_rank(self.user_2)
+        assert entry == {"rank": 1, "username": "lanterman", "rating": 120}, entry
+
+        leaderboard.remove_user(self.user_2.id)
+        assert redis_instance.zscore(leaderboard.RATINGS_KEY, self.user_2.id) is None
+
+    def test_update_users_during_build(self):
+        """Testing that ratings updated during a build are put to the build and a second build doesn't start"""
+
+        redis_instance.set(leaderboard.BUILD_LOCK_KEY, 1)
+        assert leaderboard.build() is None
+
+        self.user_2.rating = 120
+        leaderboard.update_users(self.user_2)
+        assert redis_instance.zscore(leaderboard.RATINGS_KEY, self.user_2.id) == 120
+        assert redis_instance.zscore(leaderboard.BUILD_RATINGS_KEY, self.user_2.id) == 120
+
+        redis_instance.delete(leaderboard.BUILD_LOCK_KEY)
+        leaderboard.build()
+        self.user_2.rating = 140
+        leaderboard.update_users(self.user_2)
+        assert redis_instance.exists(leaderboard.BUILD_RATINGS_KEY) == 0
+        assert redis_instance.zscore(leaderboard.RATINGS_KEY, self.user_2.id) == 140
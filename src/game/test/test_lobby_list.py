@@ -0,0 +1,89 @@
+import json
+
+from rest_framework.test import APITransactionTestCase
+from channels.db import database_sync_to_async
+
+from src.game import models, lobby_list, db_queries
+from src.user import models as user_models
+from config.utilities import redis_instance
+
+
+class TestLobbyList(APITransactionTestCase):
+    """Testing the index of open lobbies"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.lobby_1 = models.Lobby.objects.get(id=1)
+        self.lobby_2 = models.Lobby.objects.get(id=2)
+        self.user_2 = user_models.User.objects.get(id=2)
+        self.user_3 = user_models.User.objects.get(id=3)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(lobby_list.LOBBIES_KEY, lobby_list.ORDER_KEY, lobby_list.IS_BUILT_KEY)
+
+    def test_get_page(self):
+        """Testing the get_page method of OpenLobbies"""
+
+        lobbies = lobby_list.OpenLobbies().get_page(None, None, False, 10)
+        assert [lobby["name"] for lobby in lobbies] == ["string1"], lobbies
+        assert lobbies[0]["url"] == self.lobby_2.get_absolute_url(), lobbies[0]["url"]
+        assert redis_instance.exists(lobby_list.IS_BUILT_KEY) == 1
+
+        # The index is served without the database until it expires
+        models.Lobby.objects.filter(id=2).delete()
+        lobbies = lobby_list.OpenLobbies().get_page(None, None, False, 10)
+        assert [lobby["name"] for lobby in lobbies] == ["string1"], lobbies
+
+        redis_instance.delete(lobby_list.IS_BUILT_KEY)
+        lobbies = lobby_list.OpenLobbies().get_page(None, None, False, 10)
+        assert lobbies == [], lobbies
+
+    def test_get_page_after_key(self):
+        """Testing that get_page reads lobbies after a key, from the newest by (created_in, id)"""
+
+        for name in ("string3", "string4", "string5"):
+            lobby = models.Lobby.objects.create(name=name, bet=5)
+            db_queries.add_users_to_lobby(lobby.id, [self.user_3])
+
+        # Lobbies created in the same microsecond are sorted by id
+        lobby_3 = models.Lobby.objects.get(name="string3")
+        models.Lobby.objects.filter(name__in=["string4", "string5"]).update(created_in=lobby_3.created_in)
+        assert lobby_list.build() == 4
+
+        open_lobbies = lobby_list.OpenLobbies()
+        lobbies = open_lobbies.get_page(None, None, False, 2)
+        assert [lobby["name"] for lobby in lobbies] == ["string5", "string4"], lobbies
+
+        lobbies = open_lobbies.get_page(lobby_3.created_in, lobbies[-1]["id"], False, 2)
+        assert [lobby["name"] for lobby in lobbies] == ["string3", "string1"], lobbies
+
+        lobbies = open_lobbies.get_page(lobby_3.created_in, lobby_3.id, True, 2)
+        assert [lobby["name"] for lobby in lobbies] == ["string4", "string5"], lobbies
+
+        # Lobbies that don't pass the filter are skipped until the page is full
+        open_lobbies = lobby_list.OpenLobbies(lambda lobby: lobby["name"] != "string4")
+        lobbies = open_lobbies.get_page(None, None, False, 3)
+        assert [lobby["name"] for lobby in lobbies] == ["string5", "string3", "string1"], lobbies
+
+    async def test_arefresh(self):
+        """Testing the arefresh function"""
+
+        await database_sync_to_async(lobby_list.build)()
+        assert redis_instance.hkeys(lobby_list.LOBBIES_KEY) == ["2"], redis_instance.hkeys(lobby_list.LOBBIES_KEY)
+
+        await database_sync_to_async(db_queries.add_users_to_lobby)(self.lobby_2.id, [self.user_3])
+        await lobby_list.arefresh(self.lobby_2.id)
+        assert redis_instance.hkeys(lobby_list.LOBBIES_KEY) == [], redis_instance.hkeys(lobby_list.LOBBIES_KEY)
+
+        await database_sync_to_async(db_queries.remove_user_from_lobbies)(self.user_2.id)
+        await lobby_list.arefresh(self.lobby_1.id)
+        entry = json.loads(redis_instance.hget(lobby_list.LOBBIES_KEY, self.lobby_1.id))
+        assert entry["slug"] == str(self.lobby_1.slug), entry
+        assert redis_instance.zscore(lobby_list.ORDER_KEY, "000000000001") == lobby_list.get_score(self.lobby_1.created_in)
+
+        await lobby_list.aremove(self.lobby_1.id)
+        assert redis_instance.hkeys(lobby_list.LOBBIES_KEY) == [], redis_instance.hkeys(lobby_list.LOBBIES_KEY)
+        assert redis_instance.zrange(lobby_list.ORDER_KEY, 0, -1) == [], redis_instance.zrange(lobby_list.ORDER_KEY, 0, -1)
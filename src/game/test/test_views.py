@@ -4,7 +4,7 @@ from rest_framework.test import APIClient, APITestCase, APIRequestFactory
 from rest_framework.reverse import reverse
 
 from src.user import models as user_models, services as user_services
-from src.game import models, serializers, views
+from src.game import models, serializers, views, lobby_list, leaderboard
 from config.utilities import redis_instance
 from config import settings
 
@@ -38,6 +38,21 @@ class TestLobbyListView(APITestCase):
         assert len(queryset) == 1, queryset
         assert queryset[0].name == "string1", queryset
     
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(lobby_list.LOBBIES_KEY, lobby_list.ORDER_KEY, lobby_list.IS_BUILT_KEY)
+
+    def test_list(self):
+        """Testing list method"""
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'{self.type_token} {self.user_token.access_token}')
+        response = self.client.get(path=self.url)
+        assert response.status_code == 200, response.status_code
+        assert "count" not in response.data, response.data
+        assert response.data["next"] == response.data["previous"] == None, response.data
+        assert [lobby["name"] for lobby in response.data["results"]] == ["string1"], response.data
+        assert response.data["results"][0]["url"].startswith("http"), response.data["results"][0]["url"]
+
     def test_get_serializer_class(self):
         """Testing get_serializer_class method"""
 
@@ -115,3 +130,54 @@ class TestDetailLobbyView(APITestCase):
         response = self.client.get(path=self.url)
         assert response.status_code == 200, response.status_code
         assert response.data["time_left"] == 30, response.data["time_left"]
+
+
+class TestLeadBoardViews(APITestCase):
+    """Testing LeadBoardView, MyRankView and AroundMeView views"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        self.user = user_models.User.objects.get(id=2)
+        self.user_token = user_services.create_jwttoken(self.user.id)
+        self.client.credentials(HTTP_AUTHORIZATION=f"{settings.JWT_SETTINGS['AUTH_HEADER_TYPES']} {self.user_token.access_token}")
+        leaderboard.build()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        redis_instance.delete(leaderboard.RATINGS_KEY, leaderboard.USERNAMES_KEY, leaderboard.IS_BUILT_KEY)
+
+    def test_leadboard(self):
+        """Testing the top of the leaderboard"""
+
+        for count in (2, 4):
+            response = self.client.get(reverse("leadboard"), {"count": count})
+            assert response.status_code == 200, response.data
+            assert response.data["count"] == len(response.data["results"]) == count, response.data
+            assert response.data["results"][0]["rank"] == 1, response.data
+
+        # The top is paged by the default pagination
+        user_models.User.objects.bulk_create([user_models.User(username=f"player{index}", email=f"player{index}@mail.ru") for index in range(20)])
+        leaderboard.build()
+        response = self.client.get(reverse("leadboard"), {"count": 20})
+        assert response.data["count"] == 20, response.data
+        assert len(response.data["results"]) == 15, response.data
+        assert response.data["next"] is not None, response.data
+
+        response = self.client.get(response.data["next"])
+        assert [entry["rank"] for entry in response.data["results"]] == list(range(16, 21)), response.data
+
+        response = self.client.get(reverse("leadboard"), {"count": 0})
+        assert response.status_code == 400, response.data
+
+    def test_my_rank_and_around_me(self):
+        """Testing the rank of the current user and the users next to them"""
+
+        response = self.client.get(reverse("leadboard-me"))
+        assert response.status_code == 200, response.data
+        assert response.data["username"] == "lanterman", response.data
+
+        response = self.client.get(reverse("leadboard-around-me"), {"radius": 1})
+        assert response.status_code == 200, response.data
+        assert "lanterman" in [entry["username"] for entry in response.data], response.data
+        assert len(response.data) <= 3, response.data
@@ -0,0 +1,58 @@
+import math
+import time
+import uuid
+
+from config.utilities import redis_instance, async_redis_instance
+
+
+DEADLINES_KEY = "timers:deadlines"
+DEADLINES_CHANNEL = "timers:deadlines"
+
+
+def _queue_schedule(pipeline, lobby_slug: uuid.uuid4, deadline: float):
+    """Add commands that set a turn deadline of a lobby to a sync or async pipeline"""
+
+    pipeline.hset(str(lobby_slug), "turn_deadline", deadline)
+    pipeline.zadd(DEADLINES_KEY, {str(lobby_slug): deadline})
+    pipeline.publish(DEADLINES_CHANNEL, str(lobby_slug))
+    return pipeline
+
+
+def _queue_cancel(pipeline, lobby_slug: uuid.uuid4):
+    """Add commands that remove a turn deadline of a lobby to a sync or async pipeline"""
+
+    pipeline.hdel(str(lobby_slug), "turn_deadline")
+    pipeline.zrem(DEADLINES_KEY, str(lobby_slug))
+    pipeline.publish(DEADLINES_CHANNEL, str(lobby_slug))
+    return pipeline
+
+
+def schedule(lobby_slug: uuid.uuid4, time_left: int) -> float:
+    """
+    Set a turn deadline of a lobby and notify the timer service. Return the deadline.
+    The deadline is an absolute unix time: it is written once per turn and the time left is calculated on reading.
+    """
+
+    deadline = time.time() + time_left
+    _queue_schedule(redis_instance.pipeline(), lobby_slug, deadline).execute()
+    return deadline
+
+
+def cancel(lobby_slug: uuid.uuid4) -> None:
+    """Remove a turn deadline of a lobby"""
+
+    _queue_cancel(redis_instance.pipeline(), lobby_slug).execute()
+
+
+async def acancel(lobby_slug: uuid.uuid4) -> None:
+    """Async version of cancel"""
+
+    await _queue_cancel(async_redis_instance.pipeline(), lobby_slug).execute()
+
+
+def get_time_left(turn_deadline: str | float | None) -> int | None:
+    """Get seconds left to a turn deadline from the lobby hash, None if the lobby has no deadline"""
+
+    if turn_deadline is None:
+        return None
+    return max(math.ceil(float(turn_deadline) - time.time()), 0)
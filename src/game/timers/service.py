@@ -0,0 +1,79 @@
+import time
+import asyncio
+import logging
+
+from channels.db import database_sync_to_async
+
+from config import settings
+from config.utilities import async_redis_instance
+from . import deadlines
+from .wheel import TimerWheel
+from ..celery_tasks import services
+
+
+async def expire(lobby_slug: str) -> None:
+    """Called when a turn deadline of a lobby has passed"""
+
+    deadline = await async_redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug)
+
+    # The deadline was moved or removed, the timer service is notified about it separately
+    if deadline is None or deadline > time.time():
+        return
+
+    current_turn = await async_redis_instance.hget(lobby_slug, "current_turn")
+    logging.info(msg=f"Timer: the deadline of lobby '{lobby_slug}' has passed, turn {current_turn}.")
+
+    if current_turn is None:
+        await async_redis_instance.delete(lobby_slug)
+
+    elif current_turn == "0":
+        await asyncio.sleep(settings.TIMER_SETTINGS["PREPARATION_GRACE"])
+        if await is_deadline_kept(lobby_slug, deadline, current_turn):
+            await database_sync_to_async(services.determine_winner_at_preparation_stage)(lobby_slug)
+
+    else:
+        await asyncio.sleep(settings.TIMER_SETTINGS["SHOT_GRACE"])
+        if await is_deadline_kept(lobby_slug, deadline, current_turn):
+            await database_sync_to_async(services.determine_winner_at_shot_stage)(lobby_slug)
+
+    if await async_redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug) == deadline:
+        await async_redis_instance.zrem(deadlines.DEADLINES_KEY, lobby_slug)
+
+
+async def is_deadline_kept(lobby_slug: str, deadline: float, current_turn: str) -> bool:
+    """Check that a player didn't make a move during the grace period"""
+
+    pipeline = async_redis_instance.pipeline()
+    pipeline.zscore(deadlines.DEADLINES_KEY, lobby_slug)
+    pipeline.hget(lobby_slug, "current_turn")
+    return await pipeline.execute() == [deadline, current_turn]
+
+
+async def serve() -> None:
+    """Load the deadlines and keep the timer wheel in sync with them"""
+
+    wheel = TimerWheel(expire)
+    pubsub = async_redis_instance.pubsub()
+    await pubsub.subscribe(deadlines.DEADLINES_CHANNEL)
+
+    for lobby_slug, deadline in await async_redis_instance.zrange(deadlines.DEADLINES_KEY, 0, -1, withscores=True):
+        wheel.schedule(lobby_slug, deadline)
+
+    logging.info(msg=f"Timer: {len(wheel)} deadlines were loaded.")
+    runner = asyncio.create_task(wheel.run())
+
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+
+            lobby_slug = message["data"]
+            deadline = await async_redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug)
+
+            if deadline is None:
+                wheel.cancel(lobby_slug)
+            else:
+                wheel.schedule(lobby_slug, deadline)
+    finally:
+        runner.cancel()
+        await pubsub.close()
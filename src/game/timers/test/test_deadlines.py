@@ -0,0 +1,15 @@
+import time
+import pytest
+
+from src.game.timers import deadlines
+
+
+class TestDeadlines:
+    """Testing the deadlines functions"""
+
+    @pytest.mark.parametrize("test_input, output", [(None, None), (-5, 0), (9.2, 10), (30, 30)])
+    def test_get_time_left(self, test_input: float | None, output: int | None):
+        """Testing the get_time_left function"""
+
+        turn_deadline = None if test_input is None else str(time.time() + test_input)
+        assert deadlines.get_time_left(turn_deadline) == output
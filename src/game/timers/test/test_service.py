@@ -0,0 +1,90 @@
+import time
+import logging
+
+from unittest import mock
+from channels.db import database_sync_to_async
+from rest_framework.test import APITransactionTestCase
+
+from src.game.timers import service, deadlines
+from src.game.models import Lobby, Board
+from config import settings
+from config.utilities import redis_instance
+
+
+@mock.patch.dict(settings.TIMER_SETTINGS, {"PREPARATION_GRACE": 0, "SHOT_GRACE": 0})
+class TestExpire(APITransactionTestCase):
+    """Testing the expire function of the timer service"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        info = f"{self.__class__.__name__}: Number of keys in Redis database before running tests: {len(redis_instance.keys())}"
+        logging.info(info)
+
+        self.lobby_1 = Lobby.objects.get(id=1)
+        self.lobby_2 = Lobby.objects.get(id=2)
+
+        self.slug_lobby_1 = str(self.lobby_1.slug)
+        self.slug_lobby_2 = str(self.lobby_2.slug)
+
+        redis_instance.hset(name=self.slug_lobby_1, mapping={"current_turn": 1})
+        redis_instance.hset(name=self.slug_lobby_2, mapping={"current_turn": 0})
+
+    def tearDown(self) -> None:
+        redis_instance.delete(self.slug_lobby_1, self.slug_lobby_2)
+        redis_instance.zrem(deadlines.DEADLINES_KEY, self.slug_lobby_1, self.slug_lobby_2)
+        super().tearDown()
+
+    async def get_play_again(self, lobby: Lobby) -> list:
+        return await database_sync_to_async(
+            lambda: list(Board.objects.filter(lobby_id=lobby.id).values_list("is_play_again", flat=True))
+        )()
+
+    async def test_first_lobby_with_moved_deadline(self):
+        """Testing first lobby at shot stage when a deadline was moved by a new turn"""
+
+        deadlines.schedule(self.slug_lobby_1, 30)
+        await service.expire(self.slug_lobby_1)
+        await database_sync_to_async(self.lobby_1.refresh_from_db)()
+
+        assert self.lobby_1.winner == "", self.lobby_1.winner
+        assert await self.get_play_again(self.lobby_1) == [None, None]
+        assert deadlines.get_time_left(redis_instance.hget(self.slug_lobby_1, "turn_deadline")) == 30
+
+    async def test_first_lobby_at_shot_stage(self):
+        """Testing first lobby at shot stage with a passed deadline"""
+
+        redis_instance.zadd(deadlines.DEADLINES_KEY, {self.slug_lobby_1: time.time() - 1})
+        with self.assertLogs():
+            await service.expire(self.slug_lobby_1)
+        await database_sync_to_async(self.lobby_1.refresh_from_db)()
+
+        assert self.lobby_1.winner == "admin", self.lobby_1.winner
+        assert await self.get_play_again(self.lobby_1) == [False, False]
+        assert redis_instance.zscore(deadlines.DEADLINES_KEY, self.slug_lobby_1) == None
+
+    async def test_second_lobby_at_preparation_stage(self):
+        """Testing second lobby at preparation stage with a passed deadline"""
+
+        assert self.lobby_2.winner == "lanterman", self.lobby_2.winner
+
+        redis_instance.zadd(deadlines.DEADLINES_KEY, {self.slug_lobby_2: time.time() - 1})
+        with self.assertLogs():
+            await service.expire(self.slug_lobby_2)
+        await database_sync_to_async(self.lobby_2.refresh_from_db)()
+
+        assert self.lobby_2.winner == "Both lose!", self.lobby_2.winner
+        assert await self.get_play_again(self.lobby_2) == [False, False]
+
+    async def test_finished_game(self):
+        """Testing that a lobby key is removed when a game has already finished"""
+
+        redis_instance.hdel(self.slug_lobby_1, "current_turn")
+        redis_instance.hset(self.slug_lobby_1, "is_running", 1)
+        redis_instance.zadd(deadlines.DEADLINES_KEY, {self.slug_lobby_1: time.time() - 1})
+
+        with self.assertLogs():
+            await service.expire(self.slug_lobby_1)
+
+        assert redis_instance.exists(self.slug_lobby_1) == 0
@@ -0,0 +1,50 @@
+import time
+import pytest
+
+from src.game.timers import turns, deadlines
+from config.utilities import redis_instance
+
+
+LOBBY_SLUG = "6c1f0b7e-3a1d-4f0e-8f52-9b7d2e4c1a33"
+
+
+@pytest.fixture
+def lobby_slug():
+    yield LOBBY_SLUG
+    redis_instance.delete(LOBBY_SLUG)
+    redis_instance.zrem(deadlines.DEADLINES_KEY, LOBBY_SLUG)
+
+
+class TestTurns:
+    """Testing the turn transition scripts"""
+
+    @pytest.mark.asyncio
+    async def test_claim_timer(self, lobby_slug: str):
+        """Testing the claim_timer function"""
+
+        assert await turns.claim_timer(lobby_slug) == None
+
+        redis_instance.hset(lobby_slug, mapping={"current_turn": 0, "time_left": 30})
+        assert await turns.claim_timer(lobby_slug) == 30
+        assert redis_instance.hget(lobby_slug, "is_running") == "1"
+        assert deadlines.get_time_left(redis_instance.hget(lobby_slug, "turn_deadline")) == 30
+
+        # the deadline is kept by the next claim
+        redis_instance.zadd(deadlines.DEADLINES_KEY, {lobby_slug: time.time() + 10})
+        redis_instance.hset(lobby_slug, "turn_deadline", time.time() + 10)
+        assert await turns.claim_timer(lobby_slug) == 10
+        assert deadlines.get_time_left(redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug)) == 10
+
+    @pytest.mark.asyncio
+    async def test_advance_turn(self, lobby_slug: str):
+        """Testing the advance_turn and end_turn functions"""
+
+        redis_instance.hset(lobby_slug, mapping={"current_turn": 1, "is_running": 1})
+        assert await turns.advance_turn(lobby_slug, 20) == 20
+        assert redis_instance.hget(lobby_slug, "current_turn") == "2"
+        assert redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug) == None
+
+        await turns.end_turn(lobby_slug)
+        assert await turns.advance_turn(lobby_slug, 15) == 15
+        assert redis_instance.hmget(lobby_slug, "current_turn", "is_running") == ["3", "1"]
+        assert deadlines.get_time_left(redis_instance.zscore(deadlines.DEADLINES_KEY, lobby_slug)) == 15
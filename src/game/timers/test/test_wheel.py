@@ -0,0 +1,54 @@
+import time
+import asyncio
+import pytest
+
+from src.game.timers.wheel import TimerWheel
+
+
+async def do_nothing(lobby_slug: str) -> None:
+    pass
+
+
+class TestTimerWheel:
+    """Testing the TimerWheel class methods"""
+
+    @pytest.mark.asyncio
+    async def test_pop_expired(self):
+        """Testing the schedule, cancel and pop_expired methods"""
+
+        wheel = TimerWheel(do_nothing)
+        wheel.schedule("first", 10)
+        wheel.schedule("second", 20)
+        wheel.schedule("third", 30)
+        assert len(wheel) == 3
+
+        # rescheduled and cancelled deadlines don't fire
+        wheel.schedule("first", 40)
+        wheel.cancel("second")
+
+        assert wheel.pop_expired(35) == ["third"]
+        assert wheel.get_delay(35) == 5
+        assert wheel.pop_expired(50) == ["first"]
+        assert wheel.get_delay(50) == None
+        assert len(wheel) == 0
+
+    @pytest.mark.asyncio
+    async def test_run(self):
+        """Testing that the run method fires deadlines in order"""
+
+        fired = []
+
+        async def on_expire(lobby_slug: str) -> None:
+            fired.append(lobby_slug)
+
+        wheel = TimerWheel(on_expire)
+        runner = asyncio.create_task(wheel.run())
+        now = time.time()
+
+        wheel.schedule("second", now + 0.2)
+        await asyncio.sleep(0.01)
+        wheel.schedule("first", now + 0.05)
+        await asyncio.sleep(0.3)
+        runner.cancel()
+
+        assert fired == ["first", "second"], fired
@@ -0,0 +1,134 @@
+import time
+import uuid
+
+from config.utilities import async_redis_instance
+from . import deadlines
+
+
+# KEYS: the lobby hash, the deadlines zset
+# ARGV: the lobby slug, the current unix time, the deadlines channel, the time left to a new turn
+_SCHEDULE = """
+local function schedule(time_left)
+    local deadline = string.format('%.6f', tonumber(ARGV[2]) + time_left)
+    redis.call('HSET', KEYS[1], 'turn_deadline', deadline, 'is_running', 1)
+    redis.call('ZADD', KEYS[2], deadline, ARGV[1])
+    redis.call('PUBLISH', ARGV[3], ARGV[1])
+end
+"""
+
+_ADVANCE_TURN = _SCHEDULE + """
+local time_left = tonumber(ARGV[4])
+redis.call('HINCRBY', KEYS[1], 'current_turn', 1)
+
+if redis.call('HEXISTS', KEYS[1], 'is_running') == 0 then
+    schedule(time_left)
+end
+return time_left
+"""
+
+_CLAIM_TIMER = _SCHEDULE + """
+local turn = redis.call('HMGET', KEYS[1], 'turn_deadline', 'is_running', 'time_left')
+local time_left = tonumber(turn[3])
+
+if turn[1] then
+    time_left = math.max(math.ceil(tonumber(turn[1]) - tonumber(ARGV[2])), 0)
+end
+if not time_left then
+    return false
+end
+if not turn[2] then
+    schedule(time_left)
+end
+return time_left
+"""
+
+# KEYS: the shot lock, the lobby hash
+# ARGV: the token of the lock, the timeout of the lock
+_LOCK_SHOT = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return false
+end
+return redis.call('HGET', KEYS[2], 'turn_board_id') or ''
+"""
+
+# KEYS: the shot lock
+# ARGV: the token of the lock
+_RELEASE_SHOT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# A shot that crashed doesn't hold the lock of its lobby for longer than this
+SHOT_LOCK_TIMEOUT = 5
+
+advance_turn_script = async_redis_instance.register_script(_ADVANCE_TURN)
+claim_timer_script = async_redis_instance.register_script(_CLAIM_TIMER)
+lock_shot_script = async_redis_instance.register_script(_LOCK_SHOT)
+release_shot_script = async_redis_instance.register_script(_RELEASE_SHOT)
+
+
+async def _run(script, lobby_slug: uuid.uuid4, time_left: int | None = None) -> int | None:
+    return await script(
+        keys=[str(lobby_slug), deadlines.DEADLINES_KEY],
+        args=[str(lobby_slug), time.time(), deadlines.DEADLINES_CHANNEL, time_left or 0],
+    )
+
+
+async def advance_turn(lobby_slug: uuid.uuid4, time_left: int) -> int:
+    """
+    Start a new turn of a lobby in one round trip. Return the time left.
+    The deadline is set only if the timer isn't claimed by the previous turn yet.
+    """
+
+    return await _run(advance_turn_script, lobby_slug, time_left)
+
+
+async def claim_timer(lobby_slug: uuid.uuid4) -> int | None:
+    """
+    Get the time left to the current turn of a lobby and set the deadline if nobody has claimed the timer.
+    Return None if the lobby has neither a deadline nor a pending time left.
+    """
+
+    return await _run(claim_timer_script, lobby_slug)
+
+
+async def end_turn(lobby_slug: uuid.uuid4) -> None:
+    """Release the timer, so the next turn sets a new deadline"""
+
+    await async_redis_instance.hdel(str(lobby_slug), "is_running")
+
+
+def get_shot_lock_key(lobby_slug: uuid.uuid4) -> str:
+    return f"{lobby_slug}:shot_lock"
+
+
+async def lock_shot(lobby_slug: uuid.uuid4) -> tuple[str | None, int | None]:
+    """
+    Take the shot lock of a lobby and read the board that holds the turn in one round trip,
+    shots are checked against the turn and written one by one.
+    Return a token of the lock, None if another shot holds it, and an id of the board that holds the turn,
+    None if it isn't kept in Redis.
+    """
+
+    token = uuid.uuid4().hex
+    turn_board_id = await lock_shot_script(
+        keys=[get_shot_lock_key(lobby_slug), str(lobby_slug)], args=[token, SHOT_LOCK_TIMEOUT]
+    )
+
+    if turn_board_id is None:
+        return None, None
+    return token, int(turn_board_id) if turn_board_id else None
+
+
+async def set_turn_board(lobby_slug: uuid.uuid4, board_id: int) -> None:
+    """Keep the board that holds the turn next to the current turn, shots are checked against it"""
+
+    await async_redis_instance.hset(str(lobby_slug), "turn_board_id", board_id)
+
+
+async def unlock_shot(lobby_slug: uuid.uuid4, token: str) -> None:
+    """Release the shot lock of a lobby if it is still held by the token"""
+
+    await release_shot_script(keys=[get_shot_lock_key(lobby_slug)], args=[token])
@@ -0,0 +1,91 @@
+import time
+import heapq
+import asyncio
+import logging
+
+
+class TimerWheel:
+    """
+    Deadlines of all lobbies in one heap.
+    A lobby has one deadline: scheduling it again leaves the old heap entry behind,
+    such stale entries are skipped when they come up.
+    """
+
+    def __init__(self, on_expire) -> None:
+        self.on_expire = on_expire
+        self.heap: list[tuple[float, str]] = []
+        self.deadlines: dict[str, float] = {}
+        self.running_tasks: set[asyncio.Task] = set()
+        self.wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.deadlines)
+
+    def schedule(self, lobby_slug: str, deadline: float) -> None:
+        """Set a deadline of a lobby"""
+
+        self.deadlines[lobby_slug] = deadline
+        heapq.heappush(self.heap, (deadline, lobby_slug))
+
+        if self.heap[0] == (deadline, lobby_slug):
+            self.wakeup.set()
+
+        # Stale entries are dropped from time to time, so the heap doesn't grow with every rescheduling
+        if len(self.heap) > 2 * len(self.deadlines) + 1024:
+            self.heap = [(deadline, lobby_slug) for lobby_slug, deadline in self.deadlines.items()]
+            heapq.heapify(self.heap)
+
+    def cancel(self, lobby_slug: str) -> None:
+        """Remove a deadline of a lobby"""
+
+        self.deadlines.pop(lobby_slug, None)
+
+    def pop_expired(self, now: float) -> list:
+        """Get slugs of lobbies whose deadlines have passed"""
+
+        expired = []
+
+        while self.heap and self.heap[0][0] <= now:
+            deadline, lobby_slug = heapq.heappop(self.heap)
+
+            if self.deadlines.get(lobby_slug) == deadline:
+                del self.deadlines[lobby_slug]
+                expired.append(lobby_slug)
+
+        return expired
+
+    def get_delay(self, now: float) -> float | None:
+        """Get seconds until the nearest deadline, None if there are no deadlines"""
+
+        while self.heap and self.deadlines.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+
+        return max(self.heap[0][0] - now, 0) if self.heap else None
+
+    def fire(self, lobby_slug: str) -> None:
+        """Run the expiry callback of a lobby in the background"""
+
+        task = asyncio.create_task(self.on_expire(lobby_slug))
+        self.running_tasks.add(task)
+        task.add_done_callback(self._finish_task)
+
+    def _finish_task(self, task: asyncio.Task) -> None:
+        self.running_tasks.discard(task)
+
+        if not task.cancelled() and task.exception():
+            logging.error(msg="Timer callback failed.", exc_info=task.exception())
+
+    async def run(self) -> None:
+        """Fire deadlines as they expire"""
+
+        while True:
+            for lobby_slug in self.pop_expired(time.time()):
+                self.fire(lobby_slug)
+
+            delay = self.get_delay(time.time())
+            self.wakeup.clear()
+
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
@@ -4,5 +4,7 @@ from . import views
 urlpatterns = [
     path("lobbies/", views.LobbyListView.as_view(), name='lobby-list'),
     path("lobbies/<slug:slug>/", views.DetailLobbyView.as_view(), name="lobby-detail"),
-    path("leadboard/", views.LeadBoardView.as_view(), name="leadboard")
+    path("leadboard/", views.LeadBoardView.as_view(), name="leadboard"),
+    path("leadboard/me/", views.MyRankView.as_view(), name="leadboard-me"),
+    path("leadboard/around-me/", views.AroundMeView.as_view(), name="leadboard-around-me"),
 ]
@@ -1,6 +1,5 @@
 import uuid
 
-from django.db.models import Count
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
@@ -11,24 +10,41 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters import rest_framework as dj_filters
 from drf_yasg.utils import swagger_auto_schema
 
-from . import models as game_models, serializers, services, permissions, db_queries, filters
-from ..user import models as user_models
+from . import models as game_models, serializers, services, permissions, db_queries, filters, lobby_list, leaderboard
+from .engine import store
+from .timers import deadlines
+from config import settings
 from config.utilities import redis_instance
+from config.pagination import KeysetPagination
 
 
 @method_decorator(name="get", decorator=swagger_auto_schema(tags=["game"]))
 @method_decorator(name="post", decorator=swagger_auto_schema(tags=["game"]))
 class LobbyListView(ListCreateAPIView):
-    """List of lobbies and create lobby"""
+    """
+    List of lobbies and create lobby.
+    Lobbies are paged from the index of open lobbies,
+    a page is filtered in memory by the parameters of the filter backends.
+    """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     filter_backends = (drf_filters.SearchFilter, dj_filters.DjangoFilterBackend)
     filterset_class = filters.LobbyFilter
     search_fields = ["name"]
 
     def get_queryset(self):
-        return game_models.Lobby.objects.exclude(is_play_with_a_bot__isnull=False).annotate(
-            num_users=Count("users")).filter(num_users=1).prefetch_related("users")
+        return db_queries.get_open_lobbies()
+
+    def list(self, request, *args, **kwargs):
+        search_terms = drf_filters.SearchFilter().get_search_terms(request)
+        is_matched = filters.get_lobby_matcher(request.query_params, search_terms)
+        page = self.paginate_queryset(lobby_list.OpenLobbies(is_matched))
+
+        for lobby in page:
+            lobby["url"] = request.build_absolute_uri(lobby["url"])
+
+        return self.get_paginated_response(page)
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -44,7 +60,7 @@ class LobbyListView(ListCreateAPIView):
                 )
 
         lobby = serializer.save()
-        lobby.users.add(self.request.user)
+        db_queries.add_users_to_lobby(lobby.id, [self.request.user])
         first_board_id, second_board_id = db_queries.create_lobby_boards(lobby.id, self.request.user.id)
         db_queries.create_ships_for_boards(first_board_id, second_board_id)
 
@@ -62,6 +78,7 @@ class DetailLobbyView(RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance).data
+        self.add_game_state(self.kwargs["slug"], serializer)
         index, enemy_board = services.clear_enemy_board(request.user, serializer["boards"])
         serializer["boards"][index] = enemy_board
 
@@ -71,13 +88,28 @@ class DetailLobbyView(RetrieveAPIView):
         headers = {"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache", "Expires": "0"}
         return Response(serializer, headers=headers)
 
+    @staticmethod
+    def add_game_state(slug: uuid, data: dict) -> None:
+        """Replace boards with ones from the game state, the database may be behind it while the game is on"""
+
+        game_boards = store.get_boards(slug)
+
+        for board in data["boards"]:
+            if board["id"] in game_boards:
+                board.update(game_boards[board["id"]].to_columns())
+
     def add_countdown(self, slug: uuid, data: dict) -> int:
         """Add time_left variable with countdown"""
 
-        if data["boards"][0]["is_ready"] and data["boards"][1]["is_ready"]:
-            return self.get_time_left(slug, redis_instance.hget(slug, "time_left"), data["time_to_move"])
+        time_from_redis, turn_deadline = redis_instance.hmget(slug, "time_left", "turn_deadline")
+        time_left = deadlines.get_time_left(turn_deadline)
+
+        if time_left is not None:
+            return time_left
+        elif data["boards"][0]["is_ready"] and data["boards"][1]["is_ready"]:
+            return self.get_time_left(slug, time_from_redis, data["time_to_move"])
         else:
-            return self.get_time_left(slug, redis_instance.hget(slug, "time_left"), data["time_to_placement"])
+            return self.get_time_left(slug, time_from_redis, data["time_to_placement"])
 
     @staticmethod
     def get_time_left(slug: uuid, time_from_redis: str, time_to_serializer: int) -> int:
@@ -89,10 +121,56 @@ class DetailLobbyView(RetrieveAPIView):
         return int(time_from_redis)
 
 
+def get_count_param(request, name: str, default: int, maximum: int) -> int:
+    """Get a positive integer query parameter, it is capped by a maximum"""
+
+    value = request.query_params.get(name, default)
+
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 0
+
+    if value < 1:
+        raise ValidationError({name: "A positive integer is required."})
+    return min(value, maximum)
+
+
 @method_decorator(name="get", decorator=swagger_auto_schema(tags=["game"]))
 class LeadBoardView(ListAPIView):
-    """LeadBoard page API"""
+    """LeadBoard page API, the users with the highest rating are listed from the leaderboard in Redis"""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = serializers.LeadBoardSerializer
+
+    def get_queryset(self) -> list[dict]:
+        count = get_count_param(
+            self.request, "count", settings.LEADERBOARD_SETTINGS["TOP_COUNT"], settings.LEADERBOARD_SETTINGS["MAX_COUNT"]
+        )
+        return leaderboard.get_top(count)
+
+
+@method_decorator(name="get", decorator=swagger_auto_schema(tags=["game"]))
+class MyRankView(RetrieveAPIView):
+    """Rank of the current user on the leaderboard"""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = serializers.LeadBoardSerializer
+
+    def get_object(self) -> dict:
+        return leaderboard.get_rank(self.request.user)
+
+
+@method_decorator(name="get", decorator=swagger_auto_schema(tags=["game"]))
+class AroundMeView(ListAPIView):
+    """Users next to the current user on the leaderboard"""
 
-    queryset = user_models.User.objects.all().order_by("-rating")[:15]
     permission_classes = [IsAuthenticated]
     serializer_class = serializers.LeadBoardSerializer
+    pagination_class = None
+
+    def get_queryset(self) -> list[dict]:
+        radius = get_count_param(
+            self.request, "radius", settings.LEADERBOARD_SETTINGS["RADIUS"], settings.LEADERBOARD_SETTINGS["MAX_RADIUS"]
+        )
+        return leaderboard.get_around(self.request.user, radius)
@@ -1,9 +1,12 @@
+import jwt
+
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import exceptions
 from rest_framework.authentication import BaseAuthentication, get_authorization_header
 
 from config import settings
+from . import signing_keys, token_cache
 
 
 class JWTTokenAuthBackend(BaseAuthentication):
@@ -48,23 +51,60 @@ class JWTTokenAuthBackend(BaseAuthentication):
         if access_token[-5:] == "oauth":
             return self.social_oauthenticate_credentials(access_token.split(".")[0])
         
+        if settings.JWT_SETTINGS["IS_STATELESS_VERIFICATION"]:
+            credentials = self.verify_credentials(access_token)
+            if credentials is not None:
+                return credentials
+
         return self.authenticate_credentials(access_token)
     
     def social_oauthenticate_credentials(self, access_token: str):
         """Authentication with third party applications"""
 
-        access_model, refresh_model = self.get_model(True)
+        access_model, _refresh_model = self.get_model(True)
 
         try:
-            token = access_model.objects.get(token=access_token)
+            token = access_model.objects.select_related("user").get(token=access_token)
         except access_model.DoesNotExist:
             raise exceptions.AuthenticationFailed(_('Invalid token.'))
-        
-        access_model.objects.filter(user=token.user).exclude(token=token.token).delete()
-        refresh_model.objects.filter(user=token.user).exclude(token=token.refresh_token).delete()
 
         return (token.user, token)
 
+    def verify_credentials(self, access_token: str):
+        """
+        JWT authentication without the database.
+        The signature and the expiry are checked against a user secret cached in Redis, signed out tokens are revoked.
+        Return None for tokens without an expiry, they are checked by the database.
+        """
+
+        try:
+            payload = jwt.decode(access_token, options={"verify_signature": False})
+            user_id = payload[settings.JWT_SETTINGS["USER_ID_CLAIM"]]
+        except (jwt.InvalidTokenError, KeyError):
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if "exp" not in payload or payload.get("type_token") != "access":
+            return None
+
+        secret, is_revoked = signing_keys.get_secret_and_is_revoked(user_id, access_token)
+
+        if is_revoked:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        try:
+            jwt.decode(access_token, key=secret or "", algorithms=[settings.JWT_SETTINGS["ALGORITHM"]])
+        except jwt.ExpiredSignatureError:
+            raise exceptions.AuthenticationFailed(_('Token expired.'))
+        except jwt.InvalidTokenError:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        user = token_cache.get_snapshot_user(user_id)
+
+        if user is None or not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (user, access_token)
+
     def authenticate_credentials(self, access_token: str):
         """JWT autentetication"""
 
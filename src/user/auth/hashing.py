@@ -0,0 +1,133 @@
+import os
+import time
+import asyncio
+import hashlib
+import threading
+
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from functools import partial
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, status
+
+from config import settings
+
+
+ITERATIONS = 100_000
+
+# A hash that took less than 2 ** <bucket> milliseconds falls into the bucket
+LATENCY_BUCKET_COUNT = 16
+
+
+def pbkdf2(password: str, salt: str) -> tuple[str, float]:
+    """Hash a password in a process of the pool. Return the hash and the time the hashing started at"""
+
+    started_at = time.time()
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), ITERATIONS).hex(), started_at
+
+
+class HashingBusy(exceptions.APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("Too many passwords are being checked, try again later.")
+    default_code = "hashing_busy"
+
+
+class HashingExecutor:
+    """
+    Hashes passwords in a pool of processes, so a burst of sign ins is spread over the cores
+    and doesn't hold the threads of requests. At most max_pending hashes wait or run at once, the rest are refused.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, timeout: float) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pool = None
+        self.pool_pid = None
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.hash_count = 0
+        self.refused_count = 0
+        self.wait_time = 0.0
+        self.latency_histogram = [0] * LATENCY_BUCKET_COUNT
+
+    def get_pool(self) -> ProcessPoolExecutor:
+        # A forked server process can't use the pool of its parent
+        if self.pool is None or self.pool_pid != os.getpid():
+            self.pool = ProcessPoolExecutor(self.max_workers)
+            self.pool_pid = os.getpid()
+        return self.pool
+
+    def submit(self, password: str, salt: str) -> Future:
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.refused_count += 1
+                raise HashingBusy()
+
+            self.pending += 1
+            pool = self.get_pool()
+
+        future = pool.submit(pbkdf2, password, salt)
+        future.add_done_callback(partial(self._finish, time.time()))
+        return future
+
+    def _finish(self, submitted_at: float, future: Future) -> None:
+        finished_at = time.time()
+
+        with self.lock:
+            self.pending -= 1
+
+            if future.cancelled() or future.exception() is not None:
+                return
+
+            _, started_at = future.result()
+            self.hash_count += 1
+            self.wait_time += max(started_at - submitted_at, 0.0)
+            milliseconds = int((finished_at - submitted_at) * 1000)
+            self.latency_histogram[min(milliseconds.bit_length(), LATENCY_BUCKET_COUNT - 1)] += 1
+
+    def hash(self, password: str, salt: str) -> str:
+        """Hash a password and wait for the hash in the thread of a request"""
+
+        try:
+            return self.submit(password, salt).result(self.timeout)[0]
+        except TimeoutError:
+            raise HashingBusy()
+
+    async def ahash(self, password: str, salt: str) -> str:
+        """Hash a password without blocking the event loop"""
+
+        try:
+            return (await asyncio.wait_for(asyncio.wrap_future(self.submit(password, salt)), self.timeout))[0]
+        except asyncio.TimeoutError:
+            raise HashingBusy()
+
+    def get_latency_quantile(self, quantile: float) -> int:
+        """Get an upper bound of a quantile of hashing latency in milliseconds"""
+
+        rank, count = quantile * sum(self.latency_histogram), 0
+
+        for bucket, bucket_count in enumerate(self.latency_histogram):
+            count += bucket_count
+            if count >= rank:
+                return 2 ** bucket
+        return 2 ** (LATENCY_BUCKET_COUNT - 1)
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            return {
+                "workers": self.max_workers,
+                "pending": self.pending,
+                "max_pending": self.max_pending,
+                "hash_count": self.hash_count,
+                "refused_count": self.refused_count,
+                "average_wait_ms": round(self.wait_time / self.hash_count * 1000, 1) if self.hash_count else None,
+                "latency_p50_ms": self.get_latency_quantile(0.5) if self.hash_count else None,
+                "latency_p99_ms": self.get_latency_quantile(0.99) if self.hash_count else None,
+            }
+
+
+hashing_executor = HashingExecutor(
+    settings.HASHING_SETTINGS["MAX_WORKERS"],
+    settings.HASHING_SETTINGS["MAX_PENDING"],
+    settings.HASHING_SETTINGS["TIMEOUT"],
+)
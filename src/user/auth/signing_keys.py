@@ -0,0 +1,64 @@
+import time
+import hashlib
+
+from config import settings
+from config.utilities import redis_instance
+from .models import SecretKey
+
+
+REVOKED_TOKENS_KEY = "jwt:revoked"
+
+
+def get_secret_key(user_id: int) -> str:
+    """Get a redis key of a user signing secret"""
+
+    return f"jwt:secret:{user_id}"
+
+
+def _load_secret(user_id: int) -> str | None:
+    """Get a secret of a user from the database and put it to Redis"""
+
+    secret = SecretKey.objects.filter(user_id=user_id).values_list("key", flat=True).first()
+    if secret is not None:
+        redis_instance.set(get_secret_key(user_id), secret, ex=settings.TOKEN_CACHE_SETTINGS["TTL"])
+    return secret
+
+
+def get_secret(user_id: int) -> str | None:
+    """Get a secret that signs tokens of a user from Redis, then from the database"""
+
+    secret = redis_instance.get(get_secret_key(user_id))
+    return secret if secret is not None else _load_secret(user_id)
+
+
+def set_secret(user_id: int, secret: str) -> None:
+    """Put a rotated secret of a user to Redis, tokens signed by the previous one stop passing"""
+
+    redis_instance.set(get_secret_key(user_id), secret, ex=settings.TOKEN_CACHE_SETTINGS["TTL"])
+
+
+def _get_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_secret_and_is_revoked(user_id: int, token: str) -> tuple[str | None, bool]:
+    """
+    Get a secret of a user and whether a token is revoked in one round trip to Redis.
+    Secrets aren't cached in a process, so a rotated secret or a revoked token stops passing in every process at once.
+    """
+
+    pipeline = redis_instance.pipeline()
+    pipeline.get(get_secret_key(user_id))
+    pipeline.zscore(REVOKED_TOKENS_KEY, _get_token_hash(token))
+    secret, revoked_until = pipeline.execute()
+
+    return secret if secret is not None else _load_secret(user_id), revoked_until is not None
+
+
+def revoke(token: str, expires_at: float) -> None:
+    """Add a token to the revocation set until it expires, tokens that have expired leave the set"""
+
+    pipeline = redis_instance.pipeline()
+    pipeline.zadd(REVOKED_TOKENS_KEY, {_get_token_hash(token): expires_at})
+    pipeline.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", time.time())
+    pipeline.execute()
@@ -1,11 +1,17 @@
+import jwt
+import time
+import datetime
+
+from django.utils import timezone
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase, APIRequestFactory
 from rest_framework.exceptions import AuthenticationFailed
 from oauth2_provider.models import AccessToken
 
 from config import settings
+from config.utilities import redis_instance
 from src.user import services as user_services, models as user_models
-from src.user.auth import backends, models as auth_models
+from src.user.auth import backends, signing_keys, token_cache, models as auth_models
 
 
 class TestJWTTokenAuthBackend(APITestCase):
@@ -88,8 +94,7 @@ class TestJWTTokenAuthBackend(APITestCase):
         assert tuple == type(resposne_6), resposne_6
         assert 2 == len(resposne_6), resposne_6
         assert "admin" == resposne_6[0].username, resposne_6[0]
-        assert "JWTToken" == resposne_6[1].__class__.__name__, resposne_6[1].__class__.__name__
-        assert self.token.access_token == resposne_6[1].access_token, resposne_6[1].access_token
+        assert self.token.access_token == resposne_6[1], resposne_6[1]
 
     def test_social_oauthenticate_credentials(self):
         """Testing social_oauthenticate_credentials method"""
@@ -125,4 +130,87 @@ class TestJWTTokenAuthBackend(APITestCase):
             self.instance.authenticate_credentials(self.token_to_db.access_token)
 
 
-        
+class TestVerifyCredentials(APITestCase):
+    """Testing verify_credentials method of JWTTokenAuthBackend class"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        self.token = user_services.create_jwttoken(user_id=1)
+        self.token_to_db = auth_models.JWTToken.objects.get(user_id=3)
+        self.instance = backends.JWTTokenAuthBackend()
+
+    def tearDown(self) -> None:
+        redis_instance.delete(signing_keys.REVOKED_TOKENS_KEY, signing_keys.get_secret_key(1))
+        token_cache.invalidate_users(1)
+
+    def test_verify_credentials(self):
+        """Testing verify_credentials method"""
+
+        response_1 = self.instance.verify_credentials(self.token.access_token)
+        assert tuple == type(response_1), response_1
+        assert "admin" == response_1[0].username, response_1[0]
+        assert self.token.access_token == response_1[1], response_1[1]
+
+        response_2 = self.instance.verify_credentials(self.token_to_db.access_token)
+        assert None == response_2, response_2
+
+        raise_msg = 'Invalid token.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(f"{self.token.access_token}1")
+
+    def test_verify_credentials_with_rotated_secret(self):
+        """Testing verify_credentials method with a token signed by a previous secret"""
+
+        user_services.create_jwttoken(user_id=1)
+
+        raise_msg = 'Invalid token.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(self.token.access_token)
+
+    def test_verify_credentials_with_secret_rotated_by_another_process(self):
+        """Testing verify_credentials method after a secret was rotated in Redis only"""
+
+        self.instance.verify_credentials(self.token.access_token)
+        redis_instance.set(signing_keys.get_secret_key(1), "rotated")
+
+        raise_msg = 'Invalid token.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(self.token.access_token)
+
+    def test_verify_credentials_with_expired_token(self):
+        """Testing verify_credentials method with an expired token"""
+
+        secret = signing_keys.get_secret(1)
+        access_token = jwt.encode(
+            payload={
+                settings.JWT_SETTINGS["USER_ID_CLAIM"]: 1, 
+                "type_token": "access", 
+                "exp": timezone.now() - datetime.timedelta(seconds=1),
+            },
+            key=secret, 
+            algorithm=settings.JWT_SETTINGS["ALGORITHM"]
+        )
+
+        raise_msg = 'Token expired.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(access_token)
+
+    def test_verify_credentials_with_revoked_token(self):
+        """Testing verify_credentials method with a signed out token"""
+
+        signing_keys.revoke(self.token.access_token, time.time() + 60)
+
+        raise_msg = 'Invalid token.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(self.token.access_token)
+
+    def test_verify_credentials_with_inactive_user(self):
+        """Testing verify_credentials method with an inactive user"""
+
+        user_models.User.objects.filter(id=1).update(is_active=False)
+        token_cache.invalidate_users(1)
+
+        raise_msg = 'User inactive or deleted.'
+        with self.assertRaisesMessage(AuthenticationFailed, raise_msg):
+            self.instance.verify_credentials(self.token.access_token)
@@ -0,0 +1,57 @@
+import asyncio
+import hashlib
+import pytest
+
+from concurrent.futures import Future
+
+from src.user.auth import hashing
+
+
+class TestHashingExecutor:
+    """Testing the HashingExecutor class methods"""
+
+    def setup_method(self):
+        self.executor = hashing.HashingExecutor(max_workers=2, max_pending=2, timeout=10)
+
+    def teardown_method(self):
+        if self.executor.pool is not None:
+            self.executor.pool.shutdown()
+
+    def test_hash(self):
+        """Testing the hash method"""
+
+        expected = hashlib.pbkdf2_hmac("sha256", b"password", b"KtQrvyHOiHFU", hashing.ITERATIONS).hex()
+
+        assert expected == self.executor.hash("password", "KtQrvyHOiHFU")
+        assert expected == asyncio.run(self.executor.ahash("password", "KtQrvyHOiHFU"))
+
+        metrics = self.executor.get_metrics()
+        assert 2 == metrics["hash_count"], metrics
+        assert 0 == metrics["pending"], metrics
+        assert metrics["latency_p99_ms"] >= metrics["latency_p50_ms"], metrics
+
+    def test_submit_over_max_pending(self):
+        """Testing the submit method when the queue is full"""
+
+        futures = [self.executor.submit("password", "salt") for _ in range(2)]
+
+        with pytest.raises(hashing.HashingBusy):
+            self.executor.submit("password", "salt")
+
+        for future in futures:
+            future.result()
+
+        metrics = self.executor.get_metrics()
+        assert 1 == metrics["refused_count"], metrics
+        assert 0 == metrics["pending"], metrics
+
+    def test_finish_with_failed_future(self):
+        """Testing that a failed hash frees its place in the queue"""
+
+        self.executor.pending = 1
+        future = Future()
+        future.set_exception(ValueError())
+        self.executor._finish(0.0, future)
+
+        assert 0 == self.executor.pending
+        assert 0 == self.executor.hash_count
@@ -0,0 +1,80 @@
+import time
+
+from rest_framework.test import APITransactionTestCase
+from django.contrib.auth.models import AnonymousUser
+
+from src.user import services as user_services, models as user_models
+from src.user.auth import token_cache
+from config.utilities import redis_instance
+
+
+class TestLocalCache:
+    """Testing the LocalCache class methods"""
+
+    def test_get(self):
+        """Testing the get method"""
+
+        cache = token_cache.LocalCache(max_size=2)
+        cache.set("token_1", 1, ttl=60)
+        cache.set("token_2", None, ttl=60)
+        assert cache.get("token_1") == 1
+        assert cache.get("token_2") is None
+        assert cache.get("token_3") is token_cache._MISSING
+
+        # The least recently used entry is evicted
+        cache.set("token_3", 3, ttl=60)
+        assert cache.get("token_1") is token_cache._MISSING
+        assert list(cache.entries) == ["token_2", "token_3"], cache.entries
+
+        cache.set("token_4", 4, ttl=0)
+        time.sleep(0.001)
+        assert cache.get("token_4") is token_cache._MISSING
+        assert "token_4" not in cache.entries, cache.entries
+
+        cache.delete("token_2")
+        assert cache.get("token_2") is token_cache._MISSING
+
+    def test_load_user(self):
+        """Testing the load_user function"""
+
+        user = user_models.User(id=1, username="admin", email="admin@mail.ru", rating=30, cash=70, is_active=True)
+        loaded_user = token_cache.load_user(token_cache.dump_user(user))
+        assert (loaded_user.id, loaded_user.username, loaded_user.cash) == (1, "admin", 70), loaded_user
+        assert loaded_user._state.adding == False
+        assert loaded_user.get_deferred_fields() >= {"photo", "hashed_password"}, loaded_user.get_deferred_fields()
+
+
+class TestAGetUser(APITransactionTestCase):
+    """Testing the aget_user function"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.token = user_services.create_jwttoken(user_id=1)
+
+    def tearDown(self) -> None:
+        redis_instance.flushall()
+        token_cache.local_cache.clear()
+        super().tearDown()
+
+    async def test_aget_user(self):
+        """Testing the aget_user function"""
+
+        user = await token_cache.aget_user(self.token.access_token)
+        assert user.id == 1, user
+        assert redis_instance.get(token_cache.get_token_key(self.token.access_token)) == "1"
+
+        # Served from the caches without the database
+        token_cache.local_cache.clear()
+        with self.assertNumQueries(0):
+            user = await token_cache.aget_user(self.token.access_token)
+        assert user.username == "admin", user
+
+        user = await token_cache.aget_user("unknown")
+        assert isinstance(user, AnonymousUser), user
+        assert redis_instance.get(token_cache.get_token_key("unknown")) == ""
+        assert redis_instance.ttl(token_cache.get_token_key("unknown")) <= 5
+
+        token_cache.invalidate_token(self.token.access_token)
+        assert redis_instance.get(token_cache.get_token_key(self.token.access_token)) is None
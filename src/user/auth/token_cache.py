@@ -0,0 +1,204 @@
+import json
+import time
+import hashlib
+import threading
+
+from collections import OrderedDict
+from django.contrib.auth.models import AnonymousUser
+from channels.db import database_sync_to_async
+from oauth2_provider.models import AccessToken
+
+from config import settings
+from config.utilities import redis_instance, async_redis_instance
+from src.user.models import User
+from .models import JWTToken
+
+
+# Fields of a user that sockets use, a snapshot of them is built without a query
+SNAPSHOT_FIELDS = ("id", "username", "first_name", "last_name", "email", "rating", "cash", "is_active")
+
+_MISSING = object()
+
+
+class LocalCache:
+    """An LRU cache of a process, its entries expire after their TTL"""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str, default=_MISSING):
+        with self.lock:
+            value, expires_at = self.entries.get(key, (default, None))
+
+            if expires_at is None:
+                return default
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return default
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: float) -> None:
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + ttl)
+            self.entries.move_to_end(key)
+
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+local_cache = LocalCache(settings.TOKEN_CACHE_SETTINGS["MAX_SIZE"])
+
+
+def get_token_key(token: str) -> str:
+    """Get a key of a token, tokens aren't kept in Redis as they are"""
+
+    return f"ws_token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def get_user_key(user_id: int) -> str:
+    """Get a key of a user snapshot"""
+
+    return f"ws_user:{user_id}"
+
+
+def dump_user(user: User) -> str:
+    """Pack the snapshot fields of a user"""
+
+    return json.dumps({field: getattr(user, field) for field in SNAPSHOT_FIELDS})
+
+
+def load_user(snapshot: str) -> User:
+    """Build a user from a snapshot as if it was fetched with only() of the snapshot fields"""
+
+    data = json.loads(snapshot)
+
+    # from_db takes values in the order of the model fields
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in data]
+    return User.from_db("default", field_names, [data[field_name] for field_name in field_names])
+
+
+@database_sync_to_async
+def _get_user_by_token(token: str) -> User | None:
+    try:
+        if token[-5:] == "oauth":
+            return AccessToken.objects.select_related("user").get(token=token[:-6]).user
+        return JWTToken.objects.select_related("user").get(access_token=token).user
+    except (AccessToken.DoesNotExist, JWTToken.DoesNotExist):
+        return None
+
+
+@database_sync_to_async
+def _get_user_by_id(user_id: int) -> User | None:
+    return User.objects.only(*SNAPSHOT_FIELDS).filter(id=user_id).first()
+
+
+async def _aget_snapshot(user_id: int) -> str | None:
+    """Get a user snapshot from the local cache, then from Redis, then from the database"""
+
+    user_key = get_user_key(user_id)
+    snapshot = local_cache.get(user_key)
+
+    if snapshot is _MISSING:
+        snapshot = await async_redis_instance.get(user_key)
+
+        if snapshot is None:
+            user = await _get_user_by_id(user_id)
+            if user is None:
+                return None
+
+            snapshot = dump_user(user)
+            await async_redis_instance.set(user_key, snapshot, ex=settings.TOKEN_CACHE_SETTINGS["TTL"])
+
+        local_cache.set(user_key, snapshot, settings.TOKEN_CACHE_SETTINGS["LOCAL_TTL"])
+
+    return snapshot
+
+
+def get_snapshot_user(user_id: int) -> User | None:
+    """Get a user snapshot from the local cache, then from Redis, then from the database. Sync version for views"""
+
+    user_key = get_user_key(user_id)
+    snapshot = local_cache.get(user_key)
+
+    if snapshot is _MISSING:
+        snapshot = redis_instance.get(user_key)
+
+        if snapshot is None:
+            user = User.objects.only(*SNAPSHOT_FIELDS).filter(id=user_id).first()
+            if user is None:
+                return None
+
+            snapshot = dump_user(user)
+            redis_instance.set(user_key, snapshot, ex=settings.TOKEN_CACHE_SETTINGS["TTL"])
+
+        local_cache.set(user_key, snapshot, settings.TOKEN_CACHE_SETTINGS["LOCAL_TTL"])
+
+    return load_user(snapshot)
+
+
+async def aget_user(token: str | None):
+    """
+    Get a user of a token.
+    A token is resolved to a user id and the id to a snapshot of the user, both are cached in the process
+    and in Redis. Unknown tokens are cached for a short time too, an AnonymousUser is returned for them.
+    """
+
+    if not token:
+        return AnonymousUser()
+
+    token_key = get_token_key(token)
+    user_id = local_cache.get(token_key)
+
+    if user_id is _MISSING:
+        cached_user_id = await async_redis_instance.get(token_key)
+
+        if cached_user_id is None:
+            user = await _get_user_by_token(token)
+            user_id = user.id if user is not None else None
+            ttl = settings.TOKEN_CACHE_SETTINGS["TTL" if user is not None else "NEGATIVE_TTL"]
+
+            pipeline = async_redis_instance.pipeline()
+            pipeline.set(token_key, user_id or "", ex=ttl)
+            if user is not None:
+                pipeline.set(get_user_key(user_id), dump_user(user), ex=settings.TOKEN_CACHE_SETTINGS["TTL"])
+            await pipeline.execute()
+        else:
+            user_id = int(cached_user_id) if cached_user_id else None
+
+        local_cache.set(token_key, user_id, settings.TOKEN_CACHE_SETTINGS[
+            "LOCAL_TTL" if user_id is not None else "NEGATIVE_TTL"
+        ])
+
+    snapshot = await _aget_snapshot(user_id) if user_id is not None else None
+    return load_user(snapshot) if snapshot is not None else AnonymousUser()
+
+
+def invalidate_token(token: str) -> None:
+    """Forget a token, e.g. after sign out. Other processes forget it after the local TTL"""
+
+    token_key = get_token_key(token)
+    local_cache.delete(token_key)
+    redis_instance.delete(token_key)
+
+
+def invalidate_users(*user_ids: int) -> None:
+    """Forget snapshots of users after their fields have changed"""
+
+    user_keys = [get_user_key(user_id) for user_id in user_ids]
+
+    for user_key in user_keys:
+        local_cache.delete(user_key)
+
+    redis_instance.delete(*user_keys)
@@ -1,10 +1,12 @@
+import logging
+
 from django.core.mail import send_mail
 from smtplib import SMTPException
 
 from celery import shared_task
 
 from config import settings
-from src.user import models
+from src.user import models, db_queries
 
 
 @shared_task
@@ -28,3 +30,22 @@ def send_account_activation(user_email: str, secret_key: str) -> None:
         )
     except SMTPException:
         models.User.objects.filter(email=user_email).delete()
+
+
+@shared_task
+def sweep_tokens() -> dict:
+    """The periodic task that deletes expired and superseded tokens by chunks. Return the numbers of deleted rows"""
+
+    chunk_size = settings.TOKEN_SWEEP_SETTINGS["CHUNK_SIZE"]
+    lifetime = settings.JWT_SETTINGS["REFRESH_TOKEN_LIFETIME"]
+
+    # Refresh tokens go first, otherwise deleted access tokens would null their links one by one
+    deleted = {
+        "refresh_tokens": db_queries.delete_in_chunks(db_queries.get_stale_refresh_tokens(), chunk_size),
+        "access_tokens": db_queries.delete_in_chunks(db_queries.get_stale_access_tokens(), chunk_size),
+        "jwt_tokens": db_queries.delete_in_chunks(db_queries.get_expired_jwttokens(lifetime), chunk_size),
+        "secret_keys": db_queries.delete_in_chunks(db_queries.get_expired_secret_keys(lifetime), chunk_size),
+    }
+
+    logging.info(msg=f"Tokens: {deleted} rows were deleted.")
+    return deleted
@@ -1,7 +1,11 @@
+from datetime import timedelta
+
 from rest_framework import exceptions
 from django.utils import timezone
+from django.db.models import OuterRef, Q, QuerySet, Subquery
 from django.utils.translation import gettext_lazy as _
-from oauth2_provider.models import AccessToken
+from oauth2_provider.models import AccessToken, RefreshToken
+from oauth2_provider.settings import oauth2_settings
 
 from . import models
 from .auth import models as auth_models
@@ -97,3 +101,63 @@ def create_jwttoken(access_token: str, refresh_token: str, user_id: int) -> auth
     )
 
     return instance
+
+
+# sweeping of expired and superseded tokens
+def delete_in_chunks(queryset: QuerySet, chunk_size: int) -> int:
+    """Delete rows of a queryset by chunks of ids, so no statement holds locks on many rows. Return the number of rows"""
+
+    deleted = 0
+
+    while True:
+        ids = list(queryset.values_list("id", flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+
+        queryset.model.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+
+def get_superseded(model) -> QuerySet:
+    """Get rows of a model that aren't the latest row of their user"""
+
+    latest = model.objects.filter(user=OuterRef("user")).order_by("-id").values("id")[:1]
+    return model.objects.filter(user__isnull=False).exclude(id=Subquery(latest))
+
+
+def get_stale_access_tokens() -> QuerySet:
+    """Get social access tokens that were superseded or have expired and can't be refreshed"""
+
+    return AccessToken.objects.filter(
+        Q(id__in=get_superseded(AccessToken).values("id"))
+        | Q(expires__lt=timezone.now(), refresh_token__isnull=True)
+    )
+
+
+def get_stale_refresh_tokens() -> QuerySet:
+    """Get social refresh tokens that don't belong to the latest access token of their user or were revoked
+    longer than the refresh token grace period ago"""
+
+    latest = AccessToken.objects.filter(user=OuterRef("user")).order_by("-id").values("id")[:1]
+    grace_period = timedelta(seconds=oauth2_settings.REFRESH_TOKEN_GRACE_PERIOD_SECONDS)
+    return RefreshToken.objects.filter(
+        Q(access_token__isnull=True)
+        | Q(revoked__lt=timezone.now() - grace_period)
+        | ~Q(access_token_id=Subquery(latest))
+    )
+
+
+def get_expired_jwttokens(lifetime) -> QuerySet:
+    """Get JWT tokens whose refresh token has expired, or that were superseded"""
+
+    return auth_models.JWTToken.objects.filter(
+        Q(created__lt=timezone.now() - lifetime) | Q(id__in=get_superseded(auth_models.JWTToken).values("id"))
+    )
+
+
+def get_expired_secret_keys(lifetime) -> QuerySet:
+    """Get secret keys that no live token is signed by"""
+
+    return auth_models.SecretKey.objects.filter(
+        Q(created__lt=timezone.now() - lifetime) | Q(id__in=get_superseded(auth_models.SecretKey).values("id"))
+    )
@@ -25,6 +25,10 @@ class User(AbstractUser):
                               error_messages={"unique": _("A user with that email already exists.")})
     hashed_password: str = models.CharField("password", max_length=128, help_text="Required.")
 
+    # Counted with a rating of a game with another user
+    game_count: int = models.PositiveIntegerField("number of games", default=0)
+    win_count: int = models.PositiveIntegerField("number of wins", default=0)
+
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
@@ -34,3 +38,7 @@ class User(AbstractUser):
 
     def get_absolute_url(self):
         return reverse('user-detail', kwargs={'username': self.username})
+
+    @property
+    def win_rate(self) -> float:
+        return self.win_count / self.game_count if self.game_count else 0.0
@@ -10,6 +10,16 @@ class IsMyProfile(BasePermission):
             request.user.username == obj.username
         )
 
+
+class IsMyHistory(BasePermission):
+    """Game history is shown only to its owner"""
+
+    message = "This action is only allowed for the account owner"
+
+    def has_permission(self, request, view):
+        return view.kwargs["username"] == request.user.username
+
+
 class IsAccountOwner(BasePermission):
     """Allows the action only to the account owner"""
 
@@ -59,23 +59,27 @@ class ValidateClass:
 class MyProfileSerializer(serializers.ModelSerializer):
     """Profile user serializer"""
 
-    lobbies = game_serializers.BaseLobbySerializer(many=True)
+    win_rate = serializers.FloatField(read_only=True)
 
     class Meta:
         model = models.User
         fields = ["id", "username", "first_name", "last_name", "email", "mobile_number", "cash", "rating",
-                  "created_in", "updated_in", "photo", "lobbies"]
-        extra_kwargs = {"cash": {"read_only": True}, "rating": {"read_only": True}, "updated_in": {"read_only": True}}
+                  "created_in", "updated_in", "photo", "game_count", "win_count", "win_rate"]
+        extra_kwargs = {"cash": {"read_only": True}, "rating": {"read_only": True}, "updated_in": {"read_only": True},
+                        "game_count": {"read_only": True}, "win_count": {"read_only": True}}
 
 
 class EnemyProfileSerializer(serializers.ModelSerializer):
     """Profile user serializer"""
 
+    win_rate = serializers.FloatField(read_only=True)
+
     class Meta:
         model = models.User
         fields = ["username", "first_name", "last_name", "email", "mobile_number", "rating", "created_in", 
-                  "updated_in", "photo"]
-        extra_kwargs = {"rating": {"read_only": True}, "updated_in": {"read_only": True}}
+                  "updated_in", "photo", "game_count", "win_count", "win_rate"]
+        extra_kwargs = {"rating": {"read_only": True}, "updated_in": {"read_only": True},
+                        "game_count": {"read_only": True}, "win_count": {"read_only": True}}
 
 
 class UpdateUserPhotoSerializer(serializers.ModelSerializer):
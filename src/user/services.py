@@ -1,11 +1,13 @@
 import jwt
 import string
 import secrets
-import hashlib
 
 from random import choice
 
+from django.utils import timezone
+
 from . import db_queries
+from .auth import hashing, signing_keys
 from .celery_tasks import tasks
 from config import settings
 
@@ -23,9 +25,7 @@ def password_hashing(password: str, salt: str | None = None) -> hex:
     if not salt:
         salt = create_salt()
 
-    enc = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 100_000)
-
-    return enc.hex()
+    return hashing.hashing_executor.hash(password, salt)
 
 
 def validate_password(password: str, hashed_password: str) -> bool:
@@ -50,6 +50,7 @@ def create_user_secret_key(user_id: int) -> hex:
     secret_key = secrets.token_hex()
 
     db_queries.create_user_secret_key(secret_key=secret_key, user_id=user_id)
+    signing_keys.set_secret(user_id, secret_key)
 
     return secret_key
 
@@ -59,7 +60,11 @@ def create_jwttoken(user_id: int, user_email: str = None):
 
     _secret_key = create_user_secret_key(user_id=user_id)
     _access_token= jwt.encode(
-        payload={settings.JWT_SETTINGS["USER_ID_CLAIM"]: user_id, "type_token": "access"},
+        payload={
+            settings.JWT_SETTINGS["USER_ID_CLAIM"]: user_id, 
+            "type_token": "access", 
+            "exp": timezone.now() + settings.JWT_SETTINGS["ACCESS_TOKEN_LIFETIME"],
+        },
         key=_secret_key, 
         algorithm=settings.JWT_SETTINGS["ALGORITHM"]
     )
@@ -1,7 +1,13 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import AuthenticationFailed
-from oauth2_provider.models import AccessToken
+from oauth2_provider.models import AccessToken, RefreshToken
+from oauth2_provider.settings import oauth2_settings
 
+from config import settings
 from src.user import db_queries, models
 from src.user.auth import models as auth_models
 
@@ -258,3 +264,60 @@ class TestCreateJWTTokenFunction(APITestCase):
         self.assertTrue(secret_key,secret_key)
         assert "access_token" == response.access_token, response.access_token
         assert 3 == count_instance, count_instance
+
+
+class TestSweepTokensFunctions(APITestCase):
+    """Testing functions that get stale tokens for the sweeper"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    def setUp(self) -> None:
+        self.lifetime = settings.JWT_SETTINGS["REFRESH_TOKEN_LIFETIME"]
+        self.access_token = AccessToken.objects.get(id=1)
+
+    def test_delete_in_chunks(self):
+        response = db_queries.delete_in_chunks(auth_models.SecretKey.objects.all(), 2)
+        assert 3 == response, response
+        assert not auth_models.SecretKey.objects.exists()
+
+    def test_get_stale_access_tokens(self):
+        response = db_queries.get_stale_access_tokens()
+        assert 0 == response.count(), response
+
+        AccessToken.objects.create(
+            user_id=2, token="new_token", application_id=1, expires=timezone.now() + timedelta(hours=1)
+        )
+        response = db_queries.get_stale_access_tokens()
+        assert [self.access_token.id] == [token.id for token in response], response
+
+    def test_get_stale_refresh_tokens(self):
+        response = db_queries.get_stale_refresh_tokens()
+        assert 0 == response.count(), response
+
+        AccessToken.objects.create(
+            user_id=2, token="new_token", application_id=1, expires=timezone.now() + timedelta(hours=1)
+        )
+        response = db_queries.get_stale_refresh_tokens()
+        assert 1 == response.count(), response
+
+    @mock.patch.object(oauth2_settings, "REFRESH_TOKEN_GRACE_PERIOD_SECONDS", 60)
+    def test_get_stale_refresh_tokens_revoked(self):
+        RefreshToken.objects.filter(id=1).update(revoked=timezone.now())
+        response = db_queries.get_stale_refresh_tokens()
+        assert 0 == response.count(), response
+
+        RefreshToken.objects.filter(id=1).update(revoked=timezone.now() - timedelta(minutes=2))
+        response = db_queries.get_stale_refresh_tokens()
+        assert 1 == response.count(), response
+
+    def test_get_expired_jwttokens(self):
+        db_queries.create_jwttoken("access_token", "refresh_token", 1)
+
+        response = db_queries.get_expired_jwttokens(self.lifetime)
+        assert {3, 4} == {token.user_id for token in response}, response
+
+    def test_get_expired_secret_keys(self):
+        db_queries.create_user_secret_key("secret_key", 1)
+
+        response = db_queries.get_expired_secret_keys(self.lifetime)
+        assert {2, 3, 4} == {secret_key.user_id for secret_key in response}, response
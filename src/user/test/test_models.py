@@ -32,3 +32,9 @@ class TestUserModel(APITestCase):
 
         response = self.user_2.get_absolute_url()
         assert response == "/api/v1/auth/profile/lanterman/", response
+
+    def test_win_rate(self):
+        """Testing win_rate property"""
+
+        assert models.User(game_count=4, win_count=2).win_rate == 0.5
+        assert models.User().win_rate == 0.0
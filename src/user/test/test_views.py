@@ -1,11 +1,14 @@
 import json
 
 from rest_framework.reverse import reverse
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APITestCase, APIRequestFactory
 from oauth2_provider.models import AccessToken
 
 from src.user import models, services
 from src.user.auth import models as auth_models
+from src.game import models as game_models
+from config.pagination import KeysetPagination
 
 
 class TestSignInView(APITestCase):
@@ -267,6 +270,66 @@ class TestProfileView(APITestCase):
         assert updated_user_3.photo == self.user_2.photo, updated_user_3.photo
 
 
+class TestProfileLobbyListView(APITestCase):
+    """Testing the ProfileLobbyListView endpoint methods"""
+
+    fixtures = ["./src/game/consumers/test/test_data.json"]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        cls.user_1 = models.User.objects.get(id=1)
+        cls.token = services.create_jwttoken(cls.user_1.id)
+
+        cls.client = APIClient()
+
+        cls.path_1 = reverse("user-lobbies", kwargs={"username": "admin"})
+        cls.path_2 = reverse("user-lobbies", kwargs={"username": "lanterman"})
+
+    def test_get_method_unauthorization(self):
+        with self.assertLogs(level="WARNING"):
+            response = self.client.get(self.path_1)
+
+        assert response.status_code == 401, response.status_code
+
+    def test_get_method_authorization(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.token.access_token)
+
+        response = self.client.get(self.path_1)
+        assert response.status_code == 200, response.status_code
+        assert response.data["next"] == response.data["previous"] == None, response.data
+        assert [lobby["name"] for lobby in response.data["results"]] == ["string1", "string"], response.data
+
+        with self.assertLogs(level="WARNING"):
+            response = self.client.get(self.path_2)
+        assert response.status_code == 403, response.status_code
+
+    def test_get_method_pages(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.token.access_token)
+        paginator = KeysetPagination()
+        paginator.page_size = 1
+        queryset = game_models.Lobby.objects.filter(users=self.user_1)
+
+        lobbies = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(self.path_1)))
+        assert [lobby.id for lobby in lobbies] == [2], lobbies
+        assert paginator.get_previous_link() == None, paginator.get_previous_link()
+
+        next_link = paginator.get_next_link()
+        lobbies = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(next_link)))
+        assert [lobby.id for lobby in lobbies] == [1], lobbies
+        assert paginator.get_next_link() == None, paginator.get_next_link()
+
+        previous_link = paginator.get_previous_link()
+        lobbies = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(previous_link)))
+        assert [lobby.id for lobby in lobbies] == [2], lobbies
+        assert paginator.get_previous_link() == None, paginator.get_previous_link()
+
+        with self.assertLogs(level="WARNING"):
+            response = self.client.get(self.path_1, data={"cursor": "invalid"})
+        assert response.status_code == 404, response.status_code
+
+
 class TestRefreshTokenView(APITestCase):
     """Testing RefreshTokenView class methods"""
 
@@ -7,8 +7,10 @@ urlpatterns = [
     path('sign-up/', views.SignUpView.as_view(), name='sign-up'),
     path('sign-out/', views.SignOutView.as_view(), name='sign-out'),
     path("profile/<slug:username>/", views.ProfileView.as_view(), name="user-detail"),
+    path("profile/<slug:username>/lobbies/", views.ProfileLobbyListView.as_view(), name="user-lobbies"),
     path("token/refresh/", views.RefreshTokenView.as_view(), name="refresh-tokens"),
     path("activate_account/<int:user_id>/<str:secret_key>/", views.ActivateUserAccountView.as_view(), name="activate-account"),
     path("profile/<slug:username>/reset_password/", views.ResetPasswordView.as_view(), name="reset-password"),
     path("get-username/", views.get_base_username_by_token, name="get-username"),
+    path("hashing-metrics/", views.get_hashing_metrics, name="hashing-metrics"),
 ]
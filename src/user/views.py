@@ -1,17 +1,19 @@
 import re
 
+from django.db import transaction
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from rest_framework import generics, response, status, views, decorators
 from rest_framework.exceptions import ValidationError, AuthenticationFailed
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from drf_yasg.utils import swagger_auto_schema
 
 from . import models, serializers, services, permissions, db_queries
-from src.game import models as game_models
+from .auth import hashing, token_cache, signing_keys
+from src.game import models as game_models, serializers as game_serializers, leaderboard, lobby_list, db_queries as game_queries
 from config import settings
+from config.pagination import FinishedInKeysetPagination
 
 
 class SignInView(generics.CreateAPIView):
@@ -67,6 +69,7 @@ class SignUpView(generics.CreateAPIView):
             is_active=False,
             **serializer.data
         )
+        leaderboard.update_users(user)
 
         return services.create_jwttoken(user_id=user.id, user_email=user.email)
 
@@ -84,6 +87,10 @@ class SignOutView(views.APIView):
     
     def perform_delete(self, instance):
         db_queries.logout(instance)
+        token_cache.invalidate_token(instance.access_token)
+        signing_keys.revoke(
+            instance.access_token, (instance.created + settings.JWT_SETTINGS["ACCESS_TOKEN_LIFETIME"]).timestamp()
+        )
 
 
 @method_decorator(name="get", decorator=swagger_auto_schema(tags=["profile"]))
@@ -93,10 +100,7 @@ class SignOutView(views.APIView):
 class ProfileView(generics.RetrieveUpdateDestroyAPIView):
     """User profile endpoint"""
 
-    queryset = models.User.objects.all().prefetch_related(Prefetch(
-        "lobbies", queryset=game_models.Lobby.objects.filter(finished_in__isnull=False).exclude(
-            is_play_with_a_bot__isnull=False)
-    ))
+    queryset = models.User.objects.all()
     permission_classes = [IsAuthenticated, permissions.IsMyProfile]
     lookup_field = "username"
 
@@ -119,6 +123,32 @@ class ProfileView(generics.RetrieveUpdateDestroyAPIView):
             pre_data["photo"] = ""
 
         serializer.save(**pre_data)
+        token_cache.invalidate_users(serializer.instance.id)
+
+    def perform_destroy(self, instance):
+        user_id = instance.id
+
+        with transaction.atomic():
+            lobby_ids = game_queries.remove_user_from_lobbies(user_id)
+            instance.delete()
+
+        for lobby_id in lobby_ids:
+            lobby_list.refresh(lobby_id)
+        token_cache.invalidate_users(user_id)
+        leaderboard.remove_user(user_id)
+
+
+class ProfileLobbyListView(generics.ListAPIView):
+    """Game history of a user endpoint, the last finished games first"""
+
+    serializer_class = game_serializers.BaseLobbySerializer
+    permission_classes = [IsAuthenticated, permissions.IsMyHistory]
+    pagination_class = FinishedInKeysetPagination
+
+    def get_queryset(self):
+        return game_models.Lobby.objects.filter(
+            users__username=self.kwargs["username"], finished_in__isnull=False, is_play_with_a_bot__isnull=True
+        )
 
 
 class RefreshTokenView(generics.CreateAPIView):
@@ -145,6 +175,7 @@ class RefreshTokenView(generics.CreateAPIView):
             raise AuthenticationFailed(_("Refresh token expired."))
 
         token = self.perform_create(_token.user_id)
+        token_cache.invalidate_token(_token.access_token)
         serializer = self.get_serializer(token)
         headers = self.get_success_headers(serializer.data)
         return response.Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
@@ -172,6 +203,7 @@ class ActivateUserAccountView(views.APIView):
             raise AuthenticationFailed(_("No user with such secret key."))
 
         db_queries.activate_user(user_id)
+        token_cache.invalidate_users(user_id)
 
         return response.Response({"detail": "is activated."}, status=status.HTTP_200_OK)
 
@@ -210,3 +242,11 @@ def get_base_username_by_token(request, *args, **kwargs):
     rex: list = re.findall(r"\w+", request.headers["Authorization"])
     username: dict = db_queries.get_base_username_by_token(rex[-2])
     return response.Response(username)
+
+
+@decorators.api_view(["GET"])
+@decorators.permission_classes([IsAdminUser])
+def get_hashing_metrics(request, *args, **kwargs):
+    """Get queue depth and latency of password hashing in this process - endpoint"""
+
+    return response.Response(hashing.hashing_executor.get_metrics())